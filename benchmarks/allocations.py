@@ -0,0 +1,174 @@
+"""Count the vectors that the per-entity updates of asteroids and shots allocate per frame, and time them.
+
+Run from the project root:
+
+    python -m benchmarks.allocations
+    python -m benchmarks.allocations --entities 1000 --frames 240
+
+The positions and velocities of the entities are replaced by a `pygame.Vector2` subclass that counts
+every vector created from them by arithmetic or copies, so the count covers all temporaries of the
+update path. The timing runs separately with plain vectors.
+
+As a baseline the same entities are also run through the update path from before shapes moved in
+place: `position += velocity * dt` and the normalized speed of asteroids assigned through setters
+that stored a copy and moved the rect along with every new position. Both paths are printed side by side.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Callable
+
+import pygame
+
+import settings.graphics as graphics
+import settings.shot as shot_settings
+from settings.asteroids import MIN_RADIUS, SIZES, STARTING_SPEED_SPREAD
+from src import difficulty, game_clock
+from src.asteroid_sprite import Asteroid
+from src.circleshape import CircleShape
+from src.shot import Shot
+
+
+class CountingVector2(pygame.Vector2):
+    """A vector that counts the new vectors computed from it. Results are counting vectors again."""
+    created = 0
+
+
+def _counting(name: str) -> Callable[..., Any]:
+    method = getattr(pygame.Vector2, name)
+
+    def wrapper(self: pygame.Vector2, *args: Any) -> Any:
+        CountingVector2.created += 1
+        return method(self, *args)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+# every operation of a vector that returns a new one
+for _name in (
+    "__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__", "__truediv__", "__neg__", "__pos__",
+    "copy", "normalize", "rotate", "lerp", "reflect", "elementwise",
+):
+    setattr(CountingVector2, _name, _counting(_name))
+
+
+def build(kind: str, count: int, seed: int, vector: type[pygame.Vector2]) -> list[CircleShape]:
+    """Create detached asteroids or shots on screen, moving in random directions."""
+    rng = random.Random(seed)
+    shapes: list[CircleShape] = []
+    for _ in range(count):
+        position = pygame.Vector2(rng.uniform(0, graphics.SCREEN_WIDTH), rng.uniform(0, graphics.SCREEN_HEIGHT))
+        angle = rng.uniform(0, 360)
+        shape: CircleShape
+        if kind == "asteroids":
+            asteroid = Asteroid(position, rng.randint(1, SIZES) * MIN_RADIUS)
+            asteroid.velocity = pygame.Vector2(0, rng.randint(*STARTING_SPEED_SPREAD)).rotate(angle)
+            asteroid.initial_speed = asteroid.velocity.length()
+            shape = asteroid
+        else:
+            shape = Shot(position)
+            shape.velocity = pygame.Vector2(0, shot_settings.SPEED).rotate(angle)
+        # swap in vectors of the requested type, keeping the values
+        shape._position = vector(shape._position)
+        shape._velocity = vector(shape._velocity)
+        shapes.append(shape)
+    return shapes
+
+
+def _copy_position(shape: CircleShape, position: pygame.Vector2) -> None:
+    """The old position setter: store a copy and move the rect along."""
+    shape._position = position.copy()
+    shape._rect.center = (int(position.x), int(position.y))
+
+
+def copying_update(shape: CircleShape, dt: float) -> None:
+    """`update()` of asteroids and shots as it was before they moved in place."""
+    if isinstance(shape, Asteroid):
+        updated_speed = (shape.initial_speed or 0.0) * difficulty.current().speed_multiplier
+        if shape._velocity.length_squared() > 0:
+            shape._velocity = (shape._velocity.normalize() * updated_speed).copy()
+        position = shape._position
+        position += shape._velocity * dt
+        _copy_position(shape, position)
+        buffer = shape.radius + 50
+        screen_with_buffer = pygame.Rect(
+            -buffer, -buffer, graphics.SCREEN_WIDTH + 2 * buffer, graphics.SCREEN_HEIGHT + 2 * buffer
+        )
+        if not shape._rect.colliderect(screen_with_buffer):
+            shape.kill()
+    else:
+        position = shape._position
+        position += shape._velocity * dt
+        _copy_position(shape, position)
+        shape.age += dt
+        shape.distance += shape._velocity.length() * dt
+        if shape.is_expired():
+            shape.kill()
+
+
+def in_place_update(shape: CircleShape, dt: float) -> None:
+    shape.update(dt)
+
+
+# update paths by their name in the table
+PATHS: dict[str, Callable[[CircleShape, float], None]] = {"copying": copying_update, "in place": in_place_update}
+
+
+def run_frames(
+        shapes: list[CircleShape], frames: int, dt: float, update: Callable[[CircleShape, float], None],
+    ) -> None:
+    for _ in range(frames):
+        for shape in shapes:
+            update(shape, dt)
+
+
+def measure(
+        kind: str, count: int, frames: int, seed: int, update: Callable[[CircleShape, float], None],
+    ) -> dict[str, float]:
+    """Allocations and time per entity and frame of one kind of entity on one update path."""
+    dt = 1 / 120
+    shapes = build(kind, count, seed, CountingVector2)
+    CountingVector2.created = 0
+    run_frames(shapes, frames, dt, update)
+    allocations = CountingVector2.created
+
+    shapes = build(kind, count, seed, pygame.Vector2)
+    start = time.perf_counter()
+    run_frames(shapes, frames, dt, update)
+    seconds = time.perf_counter() - start
+    return {
+        "vectors_per_entity_frame": allocations / (count * frames),
+        "vectors_per_frame": allocations / frames,
+        "us_per_entity_frame": seconds / (count * frames) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=500, help="asteroids and shots each")
+    parser.add_argument("--frames", type=int, default=120, help="frames to update")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the positions and directions")
+    args = parser.parse_args()
+
+    pygame.init()
+    game_clock.reset()
+    difficulty.refresh(game_clock.game_time())
+    columns = ("vectors/frame", "per entity", "us/entity")
+    print(f"{'':<10} " + " | ".join(f"{path:^35}" for path in PATHS))
+    print(f"{'entities':<10} " + " | ".join(f"{columns[0]:>13} {columns[1]:>10} {columns[2]:>10}" for _ in PATHS))
+    for kind in ("asteroids", "shots"):
+        cells = []
+        for update in PATHS.values():
+            stats = measure(kind, args.entities, args.frames, args.seed, update)
+            cells.append(
+                f"{stats['vectors_per_frame']:>13.0f} {stats['vectors_per_entity_frame']:>10.2f} "
+                f"{stats['us_per_entity_frame']:>10.2f}"
+            )
+        print(f"{kind:<10} " + " | ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+r"""Play many seeded headless games with different settings in parallel and summarize how they went.
+
+Run from the project root:
+
+    python -m benchmarks.batch --runs 200 --bot aim \
+        --set asteroids.ON_COLLISION=DELETE --set asteroids.ON_COLLISION=BOUNCE \
+        --set "asteroids.SPAWN_RATE_GROWTH=POLYNOMIAL:0.2,2.0"
+
+`--set module.NAME=VALUE` overrides a constant of a settings module. Giving the same name several
+times tries every value, and every combination of the given values is played `--runs` times with
+the seeds `--seed`, `--seed + 1`, ... Values are Python literals, names of enum members, or
+`FUNCTION:coefficients` for growth settings.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import contextlib
+import csv
+import importlib
+import io
+import itertools
+import multiprocessing
+import os
+import statistics
+import time
+from enum import Enum
+from typing import Any, Iterator, NamedTuple, Sequence
+
+from benchmarks.bots import BOTS
+from benchmarks.scenarios import override_settings, percentile
+from settings import simulation
+from settings.asteroids import GrowthFunction, GrowthSetting
+
+# (settings module, constant, value), e.g. ("asteroids", "ON_COLLISION", CollisionBehavior.BOUNCE)
+Override = tuple[str, str, Any]
+
+
+class RunSpec(NamedTuple):
+    """One game to play."""
+    config: int  # index of the settings combination
+    overrides: tuple[Override, ...]
+    seed: int
+    bot: str
+    max_ticks: int
+
+
+class RunResult(NamedTuple):
+    """How one game went, small enough to send back from the worker cheaply."""
+    config: int
+    seed: int
+    survival_time: float  # game seconds, the full length if the bot survived
+    survived: bool
+    peak_asteroids: int
+    peak_shots: int
+    tick_p50_ms: float  # cost of a physics tick (collisions and update)
+    tick_p99_ms: float
+
+
+@contextlib.contextmanager
+def apply_overrides(overrides: Sequence[Override]) -> Iterator[None]:
+    """Override constants of the settings modules while the context is active."""
+    with contextlib.ExitStack() as stack:
+        for module_name, name, value in overrides:
+            module = importlib.import_module(f"settings.{module_name}")
+            stack.enter_context(override_settings(module, **{name: value}))
+        yield
+
+
+def parse_override(text: str) -> Override:
+    """Parse `module.NAME=VALUE`, using the current value of the constant to interpret VALUE."""
+    target, _, value_text = text.partition("=")
+    module_name, _, name = target.partition(".")
+    if not (module_name and name and value_text):
+        raise ValueError(f"Expected module.NAME=VALUE, but got {text!r}.")
+    current = getattr(importlib.import_module(f"settings.{module_name}"), name)
+
+    value: Any
+    if isinstance(current, Enum):
+        value = type(current)[value_text]
+    elif isinstance(current, GrowthSetting):
+        function_name, _, coefficients = value_text.partition(":")
+        value = GrowthSetting(
+            GrowthFunction[function_name],
+            tuple(float(c) for c in coefficients.split(",")),
+        )
+    else:
+        value = ast.literal_eval(value_text)
+    return module_name, name, value
+
+
+def configurations(overrides: Sequence[Override]) -> list[tuple[Override, ...]]:
+    """Every combination of the overridden values, names given several times are alternatives."""
+    alternatives: dict[tuple[str, str], list[Override]] = {}
+    for override in overrides:
+        alternatives.setdefault(override[:2], []).append(override)
+    return list(itertools.product(*alternatives.values()))
+
+
+def init_worker() -> None:
+    """Keep SDL from catching SIGTERM in the workers, or the pool couldn't terminate them."""
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+
+
+def run_one(spec: RunSpec) -> RunResult:
+    """Play one headless game with a bot until the bot dies or the time is up."""
+    # imported here so the workers initialize pygame themselves
+    from src.game import Game
+
+    dt = 1 / simulation.TICK_RATE
+    tick_ms: list[float] = []
+    peak_asteroids = peak_shots = 0
+    with apply_overrides(spec.overrides), contextlib.redirect_stdout(io.StringIO()):
+        game = Game(headless=True, seed=spec.seed)
+        game.player.input_source = game.input_source = BOTS[spec.bot](game, spec.seed)
+        while game.running and len(tick_ms) < spec.max_ticks:
+            start = time.perf_counter()
+            game.step(dt)
+            tick_ms.append((time.perf_counter() - start) * 1000)
+            peak_asteroids = max(peak_asteroids, len(game.vulnerable_asteroids) + len(game.invulnerable_asteroids))
+            peak_shots = max(peak_shots, len(game.shots))
+
+    survived = game.survival_time is None
+    return RunResult(
+        config=spec.config,
+        seed=spec.seed,
+        survival_time=len(tick_ms) * dt if survived else game.survival_time,
+        survived=survived,
+        peak_asteroids=peak_asteroids,
+        peak_shots=peak_shots,
+        tick_p50_ms=statistics.median(tick_ms),
+        tick_p99_ms=percentile(tick_ms, 99),
+    )
+
+
+def format_value(value: Any) -> str:
+    """Format a settings value the way `parse_override()` reads it."""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, GrowthSetting):
+        return f"{value.function_type.name}:{','.join(str(c) for c in value.coefficients)}"
+    return repr(value)
+
+
+def describe(overrides: tuple[Override, ...]) -> str:
+    if not overrides:
+        return "defaults"
+    return " ".join(f"{name}={format_value(value)}" for _, name, value in overrides)
+
+
+def summarize(configs: list[tuple[Override, ...]], results: list[RunResult]) -> list[dict[str, Any]]:
+    """Aggregate the runs of every configuration into one row."""
+    rows: list[dict[str, Any]] = []
+    for config, overrides in enumerate(configs):
+        runs = [result for result in results if result.config == config]
+        if not runs:
+            continue
+        survival = [run.survival_time for run in runs]
+        rows.append({
+            "config": describe(overrides),
+            "runs": len(runs),
+            "survived": sum(run.survived for run in runs) / len(runs),
+            "survival_median_s": statistics.median(survival),
+            "survival_p10_s": percentile(survival, 10),
+            "peak_asteroids": max(run.peak_asteroids for run in runs),
+            "peak_shots": max(run.peak_shots for run in runs),
+            "tick_p50_ms": statistics.median(run.tick_p50_ms for run in runs),
+            "tick_p99_ms": max(run.tick_p99_ms for run in runs),
+        })
+    return rows
+
+
+def print_table(rows: list[dict[str, Any]]) -> None:
+    width = max(len("configuration"), *(len(row["config"]) for row in rows))
+    print(
+        f"{'configuration':<{width}}  {'runs':>5} {'survived':>8} {'median s':>8} {'p10 s':>7} "
+        f"{'asteroids':>9} {'shots':>5} {'tick p50':>8} {'tick p99':>8}"
+    )
+    for row in rows:
+        print(
+            f"{row['config']:<{width}}  {row['runs']:>5} {row['survived']:>8.0%} "
+            f"{row['survival_median_s']:>8.1f} {row['survival_p10_s']:>7.1f} "
+            f"{row['peak_asteroids']:>9} {row['peak_shots']:>5} "
+            f"{row['tick_p50_ms']:>6.3f}ms {row['tick_p99_ms']:>6.3f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="module.NAME=VALUE",
+                        help="override a settings constant, repeat a name to try several values")
+    parser.add_argument("--runs", type=int, default=100, help="games per settings combination")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, the others count up")
+    parser.add_argument("--bot", choices=sorted(BOTS), default="aim", help="who plays the games")
+    parser.add_argument("--max-seconds", type=float, default=120.0, help="game seconds after which a run ends")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--output", help="write the result of every single run to this CSV file")
+    args = parser.parse_args()
+
+    configs = configurations([parse_override(text) for text in args.overrides])
+    max_ticks = int(args.max_seconds * simulation.TICK_RATE)
+    specs = [
+        RunSpec(config, overrides, args.seed + run, args.bot, max_ticks)
+        for config, overrides in enumerate(configs)
+        for run in range(args.runs)
+    ]
+
+    results: list[RunResult] = []
+    start = time.perf_counter()
+    pool = multiprocessing.Pool(args.processes, initializer=init_worker)
+    try:
+        # results stream in as the games finish, in whatever order that happens
+        for result in pool.imap_unordered(run_one, specs, chunksize=max(len(specs) // (args.processes * 8), 1)):
+            results.append(result)
+            print(f"\r{len(results)}/{len(specs)} games", end="", flush=True)
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    print(f"\r{len(results)} games with {args.processes} processes in {time.perf_counter() - start:.1f} s")
+
+    print_table(summarize(configs, results))
+
+    if args.output:
+        with open(args.output, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("config",) + RunResult._fields[1:])
+            for result in sorted(results):
+                writer.writerow((describe(configs[result.config]),) + result[1:])
+
+
+if __name__ == "__main__":
+    main()
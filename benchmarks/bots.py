@@ -0,0 +1,83 @@
+"""Scripted players for headless games. They plug into the game as input sources, see `src/input_source.py`."""
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Callable
+
+import pygame
+
+import settings.graphics as graphics
+from src.input_source import ACTIONS, NO_INPUT, InputState
+
+if TYPE_CHECKING:
+    from settings.controls import KeyMapping
+    from src.game import Game
+
+BIT = {action: 1 << bit for bit, action in enumerate(ACTIONS)}
+DANGER_DISTANCE = 150  # the aiming bot flees from asteroids whose border is closer than this
+
+
+class IdleBot:
+    """Doesn't touch the controls."""
+    finished = False
+
+    def __init__(self, game: Game, seed: int) -> None:
+        pass
+
+    def poll(self, mapping: KeyMapping) -> InputState:
+        return NO_INPUT
+
+
+class RandomBot:
+    """Mashes random buttons and moves the mouse around, changing its mind a few times per second."""
+    finished = False
+
+    def __init__(self, game: Game, seed: int) -> None:
+        self.rng = random.Random(seed)
+        self.state = NO_INPUT
+
+    def poll(self, mapping: KeyMapping) -> InputState:
+        if self.rng.random() < 0.05:
+            self.state = InputState(
+                self.rng.getrandbits(len(ACTIONS)),
+                (self.rng.randint(0, graphics.SCREEN_WIDTH), self.rng.randint(0, graphics.SCREEN_HEIGHT)),
+            )
+        return self.state
+
+
+class AimBot:
+    """Keeps shooting at the nearest asteroid and moves away from it when it gets too close.
+
+    Aims with the mouse and with the turn keys, so it plays with every control scheme.
+    Fleeing uses the screen-relative directions of the default `MOUSE_SCREEN_CONTROLS`.
+    """
+    finished = False
+
+    def __init__(self, game: Game, seed: int) -> None:
+        self.game = game
+
+    def poll(self, mapping: KeyMapping) -> InputState:
+        player = self.game.player
+        closest = self.game.asteroid_index.nearest(player.position)
+        if not closest:
+            return NO_INPUT
+        nearest = closest[0]
+
+        actions = BIT["shoot"]
+        direction = nearest.position - player.position
+        target_angle = -direction.angle_to(pygame.Vector2(0, 1))
+        angle_diff = (target_angle - player.rotation + 180) % 360 - 180
+        actions |= BIT["turn_right"] if angle_diff > 0 else BIT["turn_left"]
+
+        if direction.length() - nearest.radius - player.radius < DANGER_DISTANCE:
+            actions |= BIT["strafe_left"] if direction.x > 0 else BIT["strafe_right"]
+            actions |= BIT["forward"] if direction.y > 0 else BIT["backward"]
+
+        return InputState(actions, (int(nearest.position.x), int(nearest.position.y)))
+
+
+BOTS: dict[str, Callable[[Game, int], IdleBot | RandomBot | AimBot]] = {
+    "idle": IdleBot,
+    "random": RandomBot,
+    "aim": AimBot,
+}
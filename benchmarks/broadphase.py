@@ -0,0 +1,149 @@
+"""Compare the broadphases for the asteroid-asteroid collisions across entity counts and radius distributions.
+
+Run from the project root:
+
+    python -m benchmarks.broadphase
+    python -m benchmarks.broadphase --counts 100 400 1600 --frames 120 --output broadphase.json
+
+Every run moves the same seeded circles coherently across the screen and times, per frame, the
+rebuild of the broadphase, the candidate pairs and the exact overlap test on them. All broadphases
+have to find the same overlapping pairs, the benchmark fails otherwise.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+import pygame
+
+import settings.graphics as graphics
+from benchmarks.scenarios import percentile
+from settings.asteroids import MAX_RADIUS, MIN_RADIUS, SIZES, STARTING_SPEED_SPREAD
+from src.broadphase import Broadphase
+
+# radius distributions: a function drawing one radius
+DISTRIBUTIONS: dict[str, Callable[[random.Random], float]] = {
+    "tiers": lambda rng: rng.randint(1, SIZES) * MIN_RADIUS,  # like the asteroid field spawns them
+    "small": lambda rng: MIN_RADIUS,
+    "large": lambda rng: MAX_RADIUS,
+    "skewed": lambda rng: MAX_RADIUS if rng.random() < 0.1 else MIN_RADIUS,  # few large among many small
+}
+
+
+class Body:
+    """A bare moving circle, cheaper to move around than a sprite."""
+
+    def __init__(self, position: pygame.Vector2, velocity: pygame.Vector2, radius: float) -> None:
+        self.position = position
+        self.velocity = velocity
+        self.radius = radius
+
+
+def make_bodies(count: int, distribution: str, seed: int) -> list[Body]:
+    rng = random.Random(seed)
+    draw_radius = DISTRIBUTIONS[distribution]
+    return [
+        Body(
+            pygame.Vector2(rng.uniform(0, graphics.SCREEN_WIDTH), rng.uniform(0, graphics.SCREEN_HEIGHT)),
+            pygame.Vector2(0, rng.uniform(*STARTING_SPEED_SPREAD)).rotate(rng.uniform(0, 360)),
+            draw_radius(rng),
+        )
+        for _ in range(count)
+    ]
+
+
+def move(bodies: list[Body], dt: float) -> None:
+    """Move all bodies, wrapping around the screen."""
+    for body in bodies:
+        position = body.position + body.velocity * dt
+        body.position = pygame.Vector2(position.x % graphics.SCREEN_WIDTH, position.y % graphics.SCREEN_HEIGHT)
+
+
+def measure(broadphase: Broadphase, count: int, distribution: str, frames: int, seed: int) -> dict[str, Any]:
+    """Time one broadphase on one workload.
+
+    Returns:
+        dict[str, Any]: Median and p99 in milliseconds per frame, candidate pairs and overlaps per frame,
+        and the ids of all overlapping pairs to compare the broadphases with.
+    """
+    bodies = make_bodies(count, distribution, seed)
+    finder = broadphase.create()
+    dt = 1 / 60
+    timings: list[float] = []
+    candidates = 0
+    overlaps: set[tuple[int, int, int]] = set()  # (frame, id, id)
+    ids = {body: index for index, body in enumerate(bodies)}
+    for frame in range(frames):
+        start = time.perf_counter()
+        finder.rebuild(bodies)
+        found: list[tuple[Body, Body]] = []
+        for b1, b2 in finder.candidate_pairs():
+            candidates += 1
+            radius_sum = b1.radius + b2.radius
+            if b1.position.distance_squared_to(b2.position) <= radius_sum * radius_sum:
+                found.append((b1, b2))
+        timings.append((time.perf_counter() - start) * 1000)
+        for b1, b2 in found:
+            first, second = sorted((ids[b1], ids[b2]))
+            overlaps.add((frame, first, second))
+        move(bodies, dt)
+    return {
+        "median_ms": statistics.median(timings),
+        "p99_ms": percentile(timings, 99),
+        "candidates_per_frame": candidates / frames,
+        "overlaps_per_frame": len(overlaps) / frames,
+        "overlaps": overlaps,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 100, 200, 400], help="circles per workload")
+    parser.add_argument("--distributions", nargs="+", choices=sorted(DISTRIBUTIONS), default=list(DISTRIBUTIONS),
+                        help="radius distributions to try")
+    parser.add_argument("--broadphases", nargs="+", choices=[b.name for b in Broadphase],
+                        default=[b.name for b in Broadphase], help="broadphases to compare")
+    parser.add_argument("--frames", type=int, default=60, help="frames to measure per workload")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the workloads")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {"frames": args.frames, "workloads": {}}
+    mismatches: list[str] = []
+    print(f"{'workload':<14} {'broadphase':<16} {'median ms':>9} {'p99 ms':>8} {'pairs':>9} {'overlaps':>8}")
+    for distribution in args.distributions:
+        for count in args.counts:
+            workload = f"{count}-{distribution}"
+            results["workloads"][workload] = {}
+            reference: set[tuple[int, int, int]] | None = None
+            for name in args.broadphases:
+                stats = measure(Broadphase[name], count, distribution, args.frames, args.seed)
+                overlaps = stats.pop("overlaps")
+                if reference is None:
+                    reference = overlaps
+                elif overlaps != reference:
+                    mismatches.append(f"{workload} {name}: {len(overlaps ^ reference)} overlaps differ")
+                results["workloads"][workload][name] = stats
+                print(
+                    f"{workload:<14} {name:<16} {stats['median_ms']:>9.3f} {stats['p99_ms']:>8.3f} "
+                    f"{stats['candidates_per_frame']:>9.0f} {stats['overlaps_per_frame']:>8.1f}"
+                )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if mismatches:
+        print("The broadphases disagree:")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Time the stages of a frame (collisions, update, draw) in reproducible scenarios.
+
+Run from the project root:
+
+    python -m benchmarks.frame_stages --output results.json
+    python -m benchmarks.frame_stages --baseline results.json
+    python -m benchmarks.frame_stages --replay session.rec
+
+The results are written as JSON with the median and the 99th percentile of every stage in milliseconds.
+Passing a baseline (an earlier output) compares the medians and exits with an error on regressions.
+Recorded games (`main.py --record`) can be measured as additional workloads.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+from benchmarks.scenarios import Scenario, default_scenarios, percentile
+from settings import simulation
+from src.game import Game
+from src.input_source import ReplayInput
+
+STAGES = ("handle_collisions", "update", "draw")
+
+
+def measure(scenario: Scenario, frames: int) -> dict[str, dict[str, float]]:
+    """Run a scenario for some frames and time each stage separately.
+
+    Returns:
+        dict[str, dict[str, float]]: Median and p99 in milliseconds per stage.
+    """
+    dt = 1 / simulation.TICK_RATE
+    timings: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    with scenario.settings(), contextlib.redirect_stdout(io.StringIO()):
+        game = scenario.build()
+        stages: dict[str, Callable[[], None]] = {
+            "handle_collisions": game.handle_collisions,
+            "update": lambda: game.update(dt),
+            "draw": game.draw,
+        }
+        for _ in range(frames):
+            for stage, run_stage in stages.items():
+                start = time.perf_counter()
+                run_stage()
+                timings[stage].append((time.perf_counter() - start) * 1000)
+            game.replenish()
+    return summarize(timings)
+
+
+def measure_replay(path: str) -> dict[str, dict[str, float]]:
+    """Replay a recorded game (see `src/replay.py`) and time each stage of every tick separately.
+
+    Returns:
+        dict[str, dict[str, float]]: Median and p99 in milliseconds per stage.
+    """
+    recording = ReplayInput.load(path)
+    if recording.tick_rate != simulation.TICK_RATE:
+        raise ValueError(f"{path} was recorded with {recording.tick_rate} instead of {simulation.TICK_RATE} ticks per second.")
+    dt = 1 / recording.tick_rate
+    timings: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = Game(headless=True, seed=recording.seed, input_source=recording)
+        stages: dict[str, Callable[[], None]] = {
+            "handle_collisions": game.handle_collisions,
+            "update": lambda: game.update(dt),
+            "draw": game.draw,
+        }
+        while game.running and not recording.finished:
+            for stage, run_stage in stages.items():
+                if not game.running:  # lost during the collision checks, like in Game.step()
+                    break
+                start = time.perf_counter()
+                run_stage()
+                timings[stage].append((time.perf_counter() - start) * 1000)
+    return summarize(timings)
+
+
+def summarize(timings: dict[str, list[float]]) -> dict[str, dict[str, float]]:
+    """Reduce the samples of every stage to their median and p99."""
+    return {
+        stage: {
+            "median_ms": statistics.median(samples),
+            "p99_ms": percentile(samples, 99),
+        }
+        for stage, samples in timings.items()
+        if samples
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Find stages whose median got slower than the baseline by more than the tolerance (e.g. 0.2 for 20%)."""
+    regressions: list[str] = []
+    for name, stages in results["scenarios"].items():
+        baseline_stages = baseline["scenarios"].get(name)
+        if baseline_stages is None:
+            continue
+        for stage, stats in stages.items():
+            if stage not in baseline_stages:
+                continue
+            before, after = baseline_stages[stage]["median_ms"], stats["median_ms"]
+            if after > before * (1 + tolerance):
+                regressions.append(f"{name} {stage}: {before:.3f} ms -> {after:.3f} ms")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--asteroids", type=int, default=100, help="asteroids in every scenario")
+    parser.add_argument("--shots", type=int, default=20, help="shots in every scenario")
+    parser.add_argument("--frames", type=int, default=300, help="frames to measure per scenario")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the scenarios")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against the results in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown against the baseline")
+    parser.add_argument(
+        "--replay", action="append", default=[], metavar="PATH",
+        help="also measure a recorded game (main.py --record), can be given several times",
+    )
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {"frames": args.frames, "scenarios": {}}
+    workloads: list[tuple[str, Callable[[], dict[str, dict[str, float]]]]] = [
+        (scenario.name, functools.partial(measure, scenario, args.frames))
+        for scenario in default_scenarios(args.asteroids, args.shots, args.seed)
+    ]
+    workloads += [
+        (f"replay-{os.path.basename(path)}", functools.partial(measure_replay, path))
+        for path in args.replay
+    ]
+    for name, run_workload in workloads:
+        stages = run_workload()
+        results["scenarios"][name] = stages
+        summary = "  ".join(
+            f"{stage} {stats['median_ms']:.3f}/{stats['p99_ms']:.3f}" for stage, stats in stages.items()
+        )
+        print(f"{name:<45} {summary}  (median/p99 ms)")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Regressions against the baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
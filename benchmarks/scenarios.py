@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import contextlib
+import math
+import random
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Iterator
+
+import pygame
+
+import settings.asteroids as asteroid_settings
+import settings.graphics as graphics
+import settings.player as player_settings
+import settings.shot as shot_settings
+from settings.asteroids import MIN_RADIUS, SIZES, STARTING_SPEED_SPREAD
+from src.boundary_behaviors import BoundaryBehavior
+from src.collision_behaviors import CollisionBehavior
+from src.game import Game
+from src.shot import Shot
+
+
+@contextlib.contextmanager
+def override_settings(module: ModuleType, **values: Any) -> Iterator[None]:
+    """Temporarily replace constants of a settings module, e.g. `override_settings(asteroids, ON_COLLISION=...)`."""
+    originals = {name: getattr(module, name) for name in values}
+    for name, value in values.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(module, name, value)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A reproducible game state to measure: entity counts, behaviors and the random seed."""
+    asteroids: int
+    shots: int
+    collision: CollisionBehavior = asteroid_settings.ON_COLLISION
+    boundary: BoundaryBehavior = player_settings.BOUNDARY_BEHAVIOR
+    seed: int = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.asteroids}a-{self.shots}s-{self.collision.value}-{self.boundary.value}"
+
+    @contextlib.contextmanager
+    def settings(self) -> Iterator[None]:
+        """Apply the behaviors of this scenario to the settings modules."""
+        max_live_shots = max(shot_settings.MAX_LIVE_SHOTS, self.shots)
+        with override_settings(asteroid_settings, ON_COLLISION=self.collision), \
+                override_settings(player_settings, BOUNDARY_BEHAVIOR=self.boundary), \
+                override_settings(shot_settings, MAX_LIVE_SHOTS=max_live_shots):
+            yield
+
+    def build(self) -> ScenarioGame:
+        """Create a headless game populated for this scenario. Call it within `settings()`."""
+        game = ScenarioGame(self)
+        game.replenish()
+        return game
+
+
+class ScenarioGame(Game):
+    """A headless game that can't be lost and keeps its entity counts topped up.
+    The player flies in circles so the boundary behaviors get exercised.
+    """
+
+    # the player isn't even checked against the asteroids, the asteroids collide with each other every frame
+    player_can_be_hit = False
+
+    def __init__(self, scenario: Scenario) -> None:
+        super().__init__(headless=True, seed=scenario.seed)
+        self.scenario = scenario
+        self.rng = random.Random(scenario.seed)
+
+    def update(self, dt: float) -> None:
+        self.player.rotate(dt * 0.25)
+        self.player.thrust(dt)
+        super().update(dt)
+
+    def replenish(self) -> None:
+        """Spawn asteroids and shots at random on-screen positions until the scenario's counts are reached."""
+        rng = self.rng
+        missing_asteroids = self.scenario.asteroids - len(self.vulnerable_asteroids) - len(self.invulnerable_asteroids)
+        for _ in range(missing_asteroids):
+            velocity = pygame.Vector2(0, rng.randint(*STARTING_SPEED_SPREAD)).rotate(rng.uniform(0, 360))
+            self.asteroid_field.spawn(
+                radius=rng.randint(1, SIZES) * MIN_RADIUS,
+                position=self.random_position(),
+                velocity=velocity,
+            )
+        for _ in range(self.scenario.shots - len(self.shots)):
+            shot = Shot(self.random_position())
+            shot.velocity = pygame.Vector2(0, shot_settings.SPEED).rotate(rng.uniform(0, 360))
+
+    def random_position(self) -> pygame.Vector2:
+        return pygame.Vector2(
+            self.rng.uniform(0, graphics.SCREEN_WIDTH),
+            self.rng.uniform(0, graphics.SCREEN_HEIGHT),
+        )
+
+
+def default_scenarios(asteroids: int, shots: int, seed: int = 0) -> list[Scenario]:
+    """Every collision behavior and every boundary behavior, each with the defaults for the other one."""
+    scenarios = [Scenario(asteroids, shots, collision=collision, seed=seed) for collision in CollisionBehavior]
+    scenarios += [
+        Scenario(asteroids, shots, boundary=boundary, seed=seed)
+        for boundary in BoundaryBehavior
+        if boundary is not player_settings.BOUNDARY_BEHAVIOR
+    ]
+    return scenarios
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """Nearest-rank percentile of some samples."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
@@ -0,0 +1,219 @@
+"""Find how many asteroids and shots the game sustains within the frame budget of `graphics.FPS`.
+
+Run from the project root:
+
+    python -m benchmarks.stress
+    python -m benchmarks.stress --collisions bounce split --renders cached dirty --output stress
+
+For every collision behavior and rendering path the asteroid count is ramped up level by level,
+with a fixed share of shots. Every level builds a fresh headless game, keeps its counts topped up
+through `AsteroidField.spawn()` and `Shot` (see `ScenarioGame.replenish()`), and takes the median
+stage times of its frames from the frame stats. The knee is the first level whose median frame
+time exceeds the budget, the level before it is the sustainable capacity.
+
+The scaling curves (entities against milliseconds per frame and stage) are written to
+`<output>.csv` and plotted to `<output>.png`. The plot is drawn with pygame on an off-screen
+surface, so neither a display nor a plotting library is needed. The pipelined rendering needs a
+window and isn't covered.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import io
+import statistics
+import time
+from typing import Any, Optional
+
+import pygame
+
+import settings.graphics as graphics
+from benchmarks.scenarios import Scenario, override_settings
+from settings import simulation
+from src.collision_behaviors import CollisionBehavior
+
+# rendering paths: the graphics settings they consist of
+RENDERS: dict[str, dict[str, bool]] = {
+    "cached": {"CACHE_ASTEROID_SURFACES": True, "DIRTY_RECT_RENDERING": False},
+    "circles": {"CACHE_ASTEROID_SURFACES": False, "DIRTY_RECT_RENDERING": False},
+    "dirty": {"CACHE_ASTEROID_SURFACES": True, "DIRTY_RECT_RENDERING": True},
+}
+STAGES = ("collisions", "timers", "update", "draw")  # what a frame of the stress test consists of
+FIELDS = (
+    "collision", "render", "target_asteroids", "target_shots", "asteroids", "shots", "entities",
+    "frame_ms", *(f"{stage}_ms" for stage in STAGES), "within_budget",
+)
+# colors of the curves in the plot
+COLORS = {"frame": "white", "collisions": "orange", "timers": "violet", "update": "cyan", "draw": "lime"}
+
+
+def measure_level(
+        collision: CollisionBehavior, render: str, asteroids: int, shots: int, frames: int, warmup: int, seed: int,
+    ) -> dict[str, Any]:
+    """Play a fresh game with the given counts and take the median of every stage over its frames."""
+    dt = 1 / simulation.TICK_RATE
+    scenario = Scenario(asteroids, shots, collision=collision, seed=seed)
+    with scenario.settings(), override_settings(graphics, **RENDERS[render]), \
+            contextlib.redirect_stdout(io.StringIO()):
+        game = scenario.build()
+        for _ in range(warmup + frames):
+            game.replenish()  # injecting isn't part of the frame
+            start = time.perf_counter()
+            game.step(dt)
+            draw_start = time.perf_counter()
+            game.draw()
+            game.frame_stats.add_time("draw", time.perf_counter() - draw_start)
+            game.end_frame(start, dt)
+        recent = game.frame_stats.recent(frames)
+    column = game.frame_stats.column
+    counts = {
+        "asteroids": float((recent[:, column["vulnerable"]] + recent[:, column["invulnerable"]]).mean()),
+        "shots": float(recent[:, column["shots"]].mean()),
+    }
+    return {
+        **counts,
+        "entities": counts["asteroids"] + counts["shots"],
+        "frame_ms": statistics.median(recent[:, column["frame"]].tolist()),
+        **{f"{stage}_ms": statistics.median(recent[:, column[stage]].tolist()) for stage in STAGES},
+    }
+
+
+def ramp(collision: CollisionBehavior, render: str, args: argparse.Namespace, budget_ms: float) -> list[dict[str, Any]]:
+    """Measure growing levels until the frame budget is blown or the maximum count is reached."""
+    rows: list[dict[str, Any]] = []
+    asteroids = args.start
+    while asteroids <= args.max_asteroids:
+        shots = round(asteroids * args.shot_ratio)
+        row: dict[str, Any] = {
+            "collision": collision.value, "render": render, "target_asteroids": asteroids, "target_shots": shots,
+        }
+        row.update(measure_level(collision, render, asteroids, shots, args.frames, args.warmup, args.seed))
+        row["within_budget"] = row["frame_ms"] <= budget_ms
+        rows.append(row)
+        stages = "  ".join(f"{stage} {row[f'{stage}_ms']:6.2f}" for stage in STAGES)
+        print(f"{collision.value:<8} {render:<8} {row['entities']:7.0f} entities  frame {row['frame_ms']:6.2f}  {stages}")
+        if not row["within_budget"]:
+            break
+        asteroids = max(asteroids + 1, round(asteroids * args.growth))
+    return rows
+
+
+def knee(rows: list[dict[str, Any]]) -> tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]:
+    """The last level within the budget and the first one beyond it, either can be missing."""
+    sustainable = None
+    for row in rows:
+        if not row["within_budget"]:
+            return sustainable, row
+        sustainable = row
+    return sustainable, None
+
+
+def write_csv(path: str, rows: list[dict[str, Any]]) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def plot(path: str, curves: dict[tuple[str, str], list[dict[str, Any]]], budget_ms: float) -> None:
+    """Draw one panel per collision behavior (rows) and rendering path (columns) and save it as an image."""
+    pygame.font.init()
+    font = pygame.font.Font(None, 18)
+    collisions = list(dict.fromkeys(collision for collision, _ in curves))
+    renders = list(dict.fromkeys(render for _, render in curves))
+    panel_width, panel_height, margin, legend_height = 380, 240, 40, 30
+    surface = pygame.Surface((
+        len(renders) * (panel_width + margin) + margin,
+        len(collisions) * (panel_height + margin) + margin + legend_height,
+    ))
+    surface.fill(graphics.GameColors.BACKGROUND)
+
+    # one scale for all panels so they can be compared at a glance
+    rows = [row for curve in curves.values() for row in curve]
+    max_entities = max((row["entities"] for row in rows), default=1.0) or 1.0
+    max_ms = max([budget_ms * 1.5] + [row["frame_ms"] for row in rows])
+
+    x = margin
+    for name, color in COLORS.items():
+        surface.blit(font.render(name, True, color), (x, 10))
+        x += 100
+    surface.blit(font.render(f"budget {budget_ms:.1f} ms", True, "red"), (x, 10))
+
+    for (collision, render), curve in curves.items():
+        area = pygame.Rect(
+            margin + renders.index(render) * (panel_width + margin),
+            legend_height + margin + collisions.index(collision) * (panel_height + margin),
+            panel_width,
+            panel_height,
+        )
+
+        def to_screen(entities: float, ms: float) -> tuple[float, float]:
+            return (
+                area.left + entities / max_entities * (area.width - 1),
+                area.bottom - 1 - min(ms / max_ms, 1.0) * (area.height - 1),
+            )
+
+        pygame.draw.rect(surface, graphics.GameColors.FOREGROUND, area, width=1)
+        budget_y = to_screen(0, budget_ms)[1]
+        pygame.draw.line(surface, "red", (area.left, budget_y), (area.right - 1, budget_y))
+        sustainable, blown = knee(curve)
+        if blown is not None:
+            knee_x = to_screen(blown["entities"], 0)[0]
+            pygame.draw.line(surface, "red", (knee_x, area.top), (knee_x, area.bottom - 1))
+        for name, color in COLORS.items():
+            points = [to_screen(row["entities"], row[f"{name}_ms"]) for row in curve]
+            if len(points) > 1:
+                pygame.draw.lines(surface, color, False, points, width=2 if name == "frame" else 1)
+            for point in points:
+                pygame.draw.circle(surface, color, point, 2)
+
+        capacity = f"sustains {sustainable['entities']:.0f}" if sustainable is not None else "over budget"
+        title = f"{collision} / {render}: {capacity}"
+        surface.blit(font.render(title, True, graphics.GameColors.FOREGROUND), (area.left, area.top - 16))
+        surface.blit(font.render(f"{max_ms:.0f} ms", True, graphics.GameColors.FOREGROUND), (area.left + 4, area.top + 4))
+        axis = font.render(f"{max_entities:.0f} entities", True, graphics.GameColors.FOREGROUND)
+        surface.blit(axis, (area.right - axis.get_width() - 4, area.bottom - axis.get_height() - 4))
+
+    pygame.image.save(surface, path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collisions", nargs="+", choices=[b.value for b in CollisionBehavior],
+                        default=[b.value for b in CollisionBehavior], help="collision behaviors to stress")
+    parser.add_argument("--renders", nargs="+", choices=list(RENDERS), default=list(RENDERS),
+                        help="rendering paths to stress")
+    parser.add_argument("--start", type=int, default=25, help="asteroids of the first level")
+    parser.add_argument("--growth", type=float, default=1.5, help="factor between the asteroid counts of two levels")
+    parser.add_argument("--max-asteroids", type=int, default=5000, help="stop ramping up after this many asteroids")
+    parser.add_argument("--shot-ratio", type=float, default=0.25, help="shots per asteroid")
+    parser.add_argument("--frames", type=int, default=60, help="frames to measure per level")
+    parser.add_argument("--warmup", type=int, default=10, help="frames to play before measuring a level")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the levels")
+    parser.add_argument("--output", default="stress", help="write <output>.csv and <output>.png")
+    args = parser.parse_args()
+
+    budget_ms = 1000 / graphics.FPS
+    curves: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for collision in args.collisions:
+        for render in args.renders:
+            curves[(collision, render)] = ramp(CollisionBehavior(collision), render, args, budget_ms)
+
+    print(f"Sustainable at {graphics.FPS} FPS ({budget_ms:.1f} ms per frame):")
+    for (collision, render), curve in curves.items():
+        sustainable, blown = knee(curve)
+        capacity = (
+            f"{sustainable['asteroids']:.0f} asteroids and {sustainable['shots']:.0f} shots"
+            if sustainable is not None else "not even the first level"
+        )
+        beyond = f", over budget at {blown['entities']:.0f} entities" if blown is not None else ", no knee found"
+        print(f"  {collision:<8} {render:<8} {capacity}{beyond}")
+
+    write_csv(f"{args.output}.csv", [row for curve in curves.values() for row in curve])
+    plot(f"{args.output}.png", curves, budget_ms)
+    print(f"Wrote {args.output}.csv and {args.output}.png")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,49 @@
 
 
+import argparse
+
 from src.game import Game
+from src.replay import record, replay
 from settings.graphics import FPS, SCREEN_HEIGHT, SCREEN_WIDTH
 
 
 def main():
-    print(f"Starting Asteroids! {SCREEN_WIDTH}×{SCREEN_HEIGHT} @ {FPS} FPS")
-    Game().run()
+    parser = argparse.ArgumentParser(description="Play Asteroids.")
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="simulate without a window as fast as possible with a fixed time step",
+    )
+    parser.add_argument(
+        "--frames", type=int, default=None,
+        help="stop after this many frames (default: run until the game ends)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="seed for everything random in the game (default: a random seed)",
+    )
+    parser.add_argument(
+        "--record", metavar="PATH", default=None,
+        help="record the input of every physics tick to this file",
+    )
+    parser.add_argument(
+        "--replay", metavar="PATH", default=None,
+        help="replay a recorded game, as fast as possible with --headless",
+    )
+    parser.add_argument(
+        "--telemetry", metavar="PATH", default=None,
+        help="log the timings and counts of every frame to this ring file, see src/telemetry.py",
+    )
+    args = parser.parse_args()
+
+    mode = "headless" if args.headless else f"{SCREEN_WIDTH}×{SCREEN_HEIGHT}"
+    print(f"Starting Asteroids! {mode} @ {FPS} FPS")
+    if args.replay:
+        replay(args.replay, headless=args.headless, telemetry_path=args.telemetry)
+    elif args.record:
+        record(args.record, headless=args.headless, seed=args.seed, max_frames=args.frames,
+               telemetry_path=args.telemetry)
+    else:
+        Game(headless=args.headless, seed=args.seed, telemetry_path=args.telemetry).run(max_frames=args.frames)
 
 if __name__ == "__main__":
     main()
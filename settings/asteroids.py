@@ -1,7 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 import math
+from typing import Callable
 
+from src.boundary_behaviors import BoundaryBehavior
+from src.broadphase import Broadphase
 from src.collision_behaviors import CollisionBehavior
 
 PolynomialCoefficients = tuple[float, ...]
@@ -26,12 +29,8 @@ class GrowthFunction(Enum):
        The tuple must contain exactly two floats: [a, b].
        Example: (1.0, 0.05) for 1.0*e^(0.05*x).
     """
-    def calculate_multiplier(
-            self,
-            coefficients: AnyGrowthCoefficients,
-            time: float
-        ) -> float:
-        """Calculates the speed multiplier for this growth function type."""
+    def validate(self, coefficients: AnyGrowthCoefficients) -> None:
+        """Check that the coefficients fit this growth function type."""
         if not isinstance(coefficients, tuple):  # type: ignore Give an error to careless people
             raise ValueError(f"Invalid coefficients for {self.name}: Must be a tuple, but received {coefficients!r}.")
 
@@ -48,13 +47,6 @@ class GrowthFunction(Enum):
                         f"Invalid coefficients for {self.name}: "
                         f"All polynomial coefficients must be numbers, but got {coefficients!r}."
                     )
-                # Calculate polynomial value
-                n = len(coefficients) - 1
-                multiplier = 0.0
-                for i, coeff in enumerate(coefficients):
-                    power = n - i
-                    multiplier += coeff * (time ** power)
-                return multiplier
 
             case GrowthFunction.EXPONETIAL:
                 # Specific checks for Exponential
@@ -68,17 +60,70 @@ class GrowthFunction(Enum):
                         f"Invalid coefficients for {self.name}: "
                         f"Exponential coefficients must be numbers, but got {coefficients!r}."
                 )
+            case _:
+                raise NotImplementedError(f"Calculation not implemented for {self}")
+
+    def compile(self, coefficients: AnyGrowthCoefficients) -> Callable[[float], float]:
+        """Validate the coefficients once and get a function calculating the multiplier for a time."""
+        self.validate(coefficients)
+        match self:
+            case GrowthFunction.POLYNOMIAL:
+                coeffs = tuple(float(c) for c in coefficients)
+                if len(coeffs) == 1:
+                    constant = coeffs[0]
+                    return lambda time: constant
+                if len(coeffs) == 2:
+                    slope, offset = coeffs
+                    return lambda time: slope * time + offset
+
+                def polynomial(time: float) -> float:
+                    # Horner's method: ((a*x + b)*x + c)*x + ... without any powers
+                    multiplier = 0.0
+                    for coeff in coeffs:
+                        multiplier = multiplier * time + coeff
+                    return multiplier
+                return polynomial
 
-                # Calculate exponential value
-                a, b = coefficients
-                return a * math.exp(b * time)
+            case GrowthFunction.EXPONETIAL:
+                a, b = (float(c) for c in coefficients)
+                exp = math.exp
+                return lambda time: a * exp(b * time)
             case _:
                 raise NotImplementedError(f"Calculation not implemented for {self}")
 
+    def calculate_multiplier(
+            self,
+            coefficients: AnyGrowthCoefficients,
+            time: float
+        ) -> float:
+        """Calculates the speed multiplier for this growth function type.
+        The coefficients are validated and compiled on the first call with them, see `compile()`.
+        """
+        key = (self, coefficients)
+        try:
+            evaluate = _COMPILED_GROWTH[key]
+        except KeyError:
+            evaluate = _COMPILED_GROWTH[key] = self.compile(coefficients)
+        except TypeError:  # unhashable, so not a tuple either; let compile() explain what is wrong
+            evaluate = self.compile(coefficients)
+        return evaluate(time)
+
+# growth functions compiled by `GrowthFunction.calculate_multiplier()`, by type and coefficients
+_COMPILED_GROWTH: dict[tuple[GrowthFunction, AnyGrowthCoefficients], Callable[[float], float]] = {}
+
 @dataclass(frozen=True) # frozen=True makes it immutable, like a constant
 class GrowthSetting:
     function_type: GrowthFunction
     coefficients: AnyGrowthCoefficients # This type hint applies to *this* field
+    # compiled from the two fields above, so invalid settings fail on import instead of mid-game
+    evaluate: Callable[[float], float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "evaluate", self.function_type.compile(self.coefficients))
+
+    def __reduce__(self) -> tuple[type, tuple[GrowthFunction, AnyGrowthCoefficients]]:
+        # the compiled evaluator can't be pickled, it gets compiled again on unpickling
+        return (GrowthSetting, (self.function_type, self.coefficients))
 
 # Shape
 MIN_RADIUS = 20.0
@@ -107,6 +152,13 @@ SPLIT_ANGLE = (10, 45)
 # Collision
 COLLISION_ENABLED = True  # Master switch for asteroid-asteroid collisions, not fully implemented
 ON_COLLISION = CollisionBehavior.DELETE  # Behavior when two asteroids collide
+BROADPHASE = Broadphase.GRID  # How the asteroid pairs to check for collisions are found
+BOUNDARY_BEHAVIOR = BoundaryBehavior.PASS_THROUGH  # Behavior at the screen edges, asteroids passing through get removed off-screen
+
+# Performance
+ARRAY_BACKED = False  # Keep asteroid state in NumPy arrays and update all asteroids in one batched step per frame
+POOL_ASTEROIDS = True  # Reuse killed asteroids for new ones instead of constructing them
+ASTEROID_POOL_MAX_SIZE = 512  # Killed asteroids kept for reuse at most
 
 # Visual
 BORDER_WIDTH_INVULNERABLE_MULTIPLIER = 4
@@ -170,3 +170,7 @@ MOUSE_SCREEN_CONTROLS = ControlScheme(
 )
 # Active scheme
 ACTIVE_CONTROL_SCHEME = MOUSE_SCREEN_CONTROLS
+
+# Diagnostics
+TOGGLE_FRAME_STATS_KEY = pygame.K_F3  # show/hide the frame timing overlay
+DUMP_FRAME_STATS_KEY = pygame.K_F4  # write the buffered frame timings to a CSV file
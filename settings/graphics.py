@@ -16,6 +16,7 @@ SCREEN_HEIGHT = 720
 FPS = 60
 TIMER_FONT:Optional[str] = None  # default font. can be change to font file path or system font
 TIMER_FONT_SIZE = 36
+STATS_FONT_SIZE = 20  # frame timing overlay, uses TIMER_FONT
 
 ASTEROID_BORDER_COLOR_OPTIONS: tuple[str | tuple[int, int, int], ...] = (GameColors.FOREGROUND, )
 # ("yellow",  
@@ -27,6 +28,10 @@ ASTEROID_BORDER_COLOR_OPTIONS: tuple[str | tuple[int, int, int], ...] = (GameCol
 #     "lightblue",
 #     "violet",)
 ASTEROID_FILL_COLOR_OPTIONS: tuple[str | tuple[int, int, int], ...] = (GameColors.BACKGROUND, )
+CACHE_ASTEROID_SURFACES = True  # draw asteroids by blitting pre-rendered surfaces instead of drawing circles every frame
+ASTEROID_SURFACE_CACHE_SIZE = 64  # pre-rendered asteroid surfaces kept at most, least recently used ones are dropped
+DIRTY_RECT_RENDERING = False  # only erase, redraw and present the screen regions that changed since the last frame
+DIRTY_RECT_FULL_FLIP_RATIO = 0.4  # present the whole screen instead if the changed regions cover more than this share of it
 
 class BorderWidths(int, Enum):
     """Defines border widths for different game objects."""
@@ -1,2 +1,11 @@
+from src.boundary_behaviors import BoundaryBehavior
+
 SPEED: float = 500
 RADIUS: float = 5.0
+
+# Lifetime
+MAX_LIVE_SHOTS = 32  # Firing more shots removes the oldest one
+MAX_LIFETIME_SEC = 3.0  # Shots that haven't hit anything are removed after this time
+MAX_RANGE = 1500.0  # or after travelling this many pixels
+OFFSCREEN_MARGIN = 50  # or as soon as they are this many pixels off-screen
+BOUNDARY_BEHAVIOR = BoundaryBehavior.PASS_THROUGH  # Behavior at the screen edges, e.g. WRAP_EDGE keeps shots on screen until they expire
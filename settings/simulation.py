@@ -0,0 +1,7 @@
+TICK_RATE = 120  # physics updates per second, independent of the rendering frame rate (graphics.FPS)
+MAX_CATCH_UP_STEPS = 5  # physics updates per rendered frame at most, a slow frame drops the remaining time instead of piling up
+INTERPOLATE_RENDERING = True  # draw moving objects between the last two physics states for smooth motion
+PIPELINED_RENDERING = False  # draw snapshots of the last frame on a render thread while the next frame is simulated
+FRAME_STATS_CAPACITY = 600  # frames kept in the ring buffer of per-stage timings
+FRAME_STATS_AVERAGE_FRAMES = 60  # frames the overlay averages over
+TELEMETRY_CAPACITY = 60 * 60 * 60  # frames kept in the telemetry ring file, an hour at 60 FPS
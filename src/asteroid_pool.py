@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pygame
+
+from src.asteroid_sprite import Asteroid
+
+
+class AsteroidPool:
+    """Reuses killed asteroids instead of constructing new ones, enabled with `settings.asteroids.POOL_ASTEROIDS`.
+
+    Killed asteroids are only handed out again after `recycle()` was called at the end of the frame,
+    so collision handling can't mistake a recycled fragment for the asteroid it used to be.
+
+    Args:
+        max_size (int): Maximum number of killed asteroids kept for reuse.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.free: list[Asteroid] = []
+        self.pending: list[Asteroid] = []  # killed during the current frame
+        self.hits = 0  # asteroids handed out again
+        self.misses = 0  # asteroids that had to be constructed
+        self.in_use = 0
+        self.high_water_mark = 0  # most asteroids in use at the same time
+
+    def acquire(self, position: pygame.Vector2, radius: float, is_fragment: bool = False) -> Asteroid:
+        """Get a fresh asteroid, reusing a killed one if possible. See `Asteroid.__init__()` for the arguments."""
+        if self.free:
+            asteroid = self.free.pop()
+            asteroid.reset(position, radius, is_fragment)
+            self.hits += 1
+        else:
+            asteroid = Asteroid(position, radius, is_fragment)
+            self.misses += 1
+
+        self.in_use += 1
+        self.high_water_mark = max(self.high_water_mark, self.in_use)
+        return asteroid
+
+    def release(self, asteroid: Asteroid) -> None:
+        """Take back a killed asteroid. It can be reused after the next `recycle()`."""
+        self.in_use -= 1
+        self.pending.append(asteroid)
+
+    def recycle(self) -> None:
+        """Make the asteroids killed during this frame available for reuse."""
+        room = self.max_size - len(self.free)
+        self.free.extend(self.pending[:room])
+        self.pending.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of acquired asteroids that were reused."""
+        acquired = self.hits + self.misses
+        return self.hits / acquired if acquired else 0.0
+
+    def report(self) -> str:
+        return (
+            f"asteroid pool: {self.hit_rate:.0%} hit rate, {self.high_water_mark} high-water mark, "
+            f"{len(self.free)} free"
+        )
@@ -1,12 +1,25 @@
-import random
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, Optional
 
 import pygame
 
 import settings.asteroids as asteroids
 import settings.graphics as graphics
+from src import difficulty, game_clock, game_random
+from src.boundary_behaviors import BoundaryBehavior, apply_to_shape
 from src.physics import bounce_asteroids
 from src.circleshape import CircleShape
+from src.entity_registry import Kind, Tag
+from src.entity_store import StoreField
+from src.surface_cache import asteroid_surfaces
+
+if TYPE_CHECKING:
+    from src.asteroid_pool import AsteroidPool
+    from src.asteroid_store import AsteroidStore
+    from src.frame_stats import FrameStats
+    from src.quadtree import LooseQuadtree
+    from src.timer_wheel import Timer
 
 
 class Asteroid(CircleShape):
@@ -17,38 +30,106 @@ class Asteroid(CircleShape):
         CircleShape (_type_): Asteroids are circular shapes.
     """
     first_fragment_id = None # <--- Add this back
+    kind = Kind.ASTEROID
+    store: ClassVar[Optional[AsteroidStore]] = None  # new asteroids get attached to this store if set
+    pool: ClassVar[Optional[AsteroidPool]] = None  # `create()` reuses killed asteroids from this pool if set
+    index: ClassVar[Optional[LooseQuadtree[Asteroid]]] = None  # new asteroids get indexed in this quadtree if set
+    frame_stats: ClassVar[Optional[FrameStats]] = None  # splits are counted here if set
+    initial_speed = StoreField("initial_speed", optional=True)
 
     def __init__(self, position: pygame.Vector2, radius: float, is_fragment: bool = False) -> None:
         """Initialize asteroid with position, radius, and invulnerability timer."""
         self.is_fragment = is_fragment
 
         super().__init__(position, radius)
-        self.invulnerable_timer = asteroids.SPAWN_INVUL_TIME_IN_SEC
+        self._init_asteroid_state()
+
+    @classmethod
+    def create(cls, position: pygame.Vector2, radius: float, is_fragment: bool = False) -> Asteroid:
+        """Get a new asteroid, from the pool if pooling is enabled. Takes the same arguments as the constructor."""
+        if cls.pool is not None:
+            return cls.pool.acquire(position, radius, is_fragment)
+        return cls(position, radius, is_fragment)
+
+    def reset(self, position: pygame.Vector2, radius: float, is_fragment: bool = False) -> None:
+        """Bring a killed asteroid back as a fresh one, used by the `AsteroidPool`."""
+        self.is_fragment = is_fragment
+        super().reset(position, radius)
+        self._init_asteroid_state()
+
+    def _init_asteroid_state(self) -> None:
+        """Set up the state of a fresh asteroid."""
+        self.invulnerable_until = game_clock.game_time() + asteroids.SPAWN_INVUL_TIME_IN_SEC
+        self.invulnerability: Optional[Timer] = game_clock.schedule(
+            asteroids.SPAWN_INVUL_TIME_IN_SEC, self.end_invulnerability
+        )
         self.fragmentation_counter = 0
         self.initial_speed: Optional[float] = None
         self.border_color: str | tuple[int, int, int] = graphics.GameColors.FOREGROUND
         self.fill_color: str | tuple[int, int, int] = graphics.GameColors.BACKGROUND
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw asteroids as a simple circle with a white border."""
+        if self.store is not None:
+            self.store.attach(self)
+        if self.index is not None:
+            self.index.insert(self)
+
+    @property
+    def invulnerable_timer(self) -> float:
+        """Seconds of invulnerability left, zero or less once we are vulnerable."""
+        return self.invulnerable_until - game_clock.game_time()
+
+    def end_invulnerability(self) -> None:
+        """Move from the invulnerable to the vulnerable asteroids, scheduled when we are created."""
+        self.invulnerability = None
+        self.retag(add=Tag.VULNERABLE, remove=Tag.INVULNERABLE)
+
+    def is_visible(self) -> bool:
+        """Whether we are drawn this frame, invulnerable asteroids blink."""
         if self.invulnerable_timer > 0:
             on_cycles, off_cycles = asteroids.INVULNERABILITY_BLINK_PATTERN
             total_cycle = on_cycles + off_cycles
             blink_cycles = self.invulnerable_timer * asteroids.INVULNERABILITY_BLINKING_PER_SECOND
             cycle_position = int(blink_cycles) % total_cycle
             if cycle_position < off_cycles:  # In the "off" part of the cycle
-                return  # Don't draw this frame
+                return False  # Don't draw this frame
+        return True
 
-        # Calculate border width based on invulnerability
-        border_width = graphics.BorderWidths.ASTEROID * (
+    def border_width(self) -> int:
+        """Calculate border width based on invulnerability."""
+        return graphics.BorderWidths.ASTEROID * (
             1 + asteroids.BORDER_WIDTH_INVULNERABLE_MULTIPLIER * (self.invulnerable_timer > 0)
         )
 
+    def blit_item(self) -> Optional[tuple[pygame.Surface, pygame.Rect]]:
+        """Get our pre-rendered surface and where to put it, for drawing many asteroids with one `Surface.blits()` call.
+
+        Returns:
+            Optional[tuple[pygame.Surface, pygame.Rect]]: Surface and destination, `None` if we are blinked off.
+        """
+        if not self.is_visible():
+            return None
+        surface = asteroid_surfaces.get(self.radius, self.fill_color, self.border_color, self.border_width())
+        return surface, surface.get_rect(center=self.draw_position)
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw asteroids as a simple circle with a white border."""
+        if graphics.CACHE_ASTEROID_SURFACES:
+            item = self.blit_item()
+            if item is not None:
+                screen.blit(*item)
+            return
+
+        if not self.is_visible():
+            return  # Don't draw this frame
+
+        border_width = self.border_width()
+        center = self.draw_position
+
         # Draw filled circle first
         pygame.draw.circle(
             screen,
             color=self.fill_color,
-            center=self.position,
+            center=center,
             radius=self.radius,
         )
 
@@ -56,55 +137,51 @@ class Asteroid(CircleShape):
         pygame.draw.circle(
             screen,
             color=self.border_color,
-            center=self.position,
+            center=center,
             radius=self.radius,
             width=border_width,
         )
 
     def update(self, dt: float) -> None:
-        """Update our state in the game."""
-
-        # Get game time directly from pygame for speed scaling and debug context
-        current_game_time = pygame.time.get_ticks() / 1000.0
-
-        # --- Invulnerable Timer Countdown (Apply to ALL asteroids) ---
-        if self.invulnerable_timer > 0:
-            self.invulnerable_timer -= dt
+        """Update our state in the game.
+        Asteroids attached to an `AsteroidStore` are updated by the store instead.
+        """
 
         # --- Speed Scaling (Apply to ALL asteroids) ---
-        # Use the local game time for speed scaling
-        game_time_for_speed = current_game_time
-
-        updated_speed = (
-            (self.initial_speed or 0.0)
-            * asteroids.SPEED_GROWTH.function_type.calculate_multiplier(
-                asteroids.SPEED_GROWTH.coefficients, game_time_for_speed
-            )
-        )
-        # Ensure velocity has magnitude before normalizing if it starts at zero
-        if self.velocity.length_squared() > 0:
-            self.velocity = self.velocity.normalize() * updated_speed
-        # else: handle zero initial speed if necessary
+        # The multiplier is evaluated once per physics step and shared by all asteroids
+        updated_speed = (self.initial_speed or 0.0) * difficulty.current().speed_multiplier
+        # in place, asteroids without velocity keep standing still
+        self.set_speed(updated_speed)
         # --- End Speed Scaling ---
 
         # --- Position Update (Apply to ALL asteroids) ---
-        # This is the core movement line.
-        self.position += self.velocity * dt
+        # This is the core movement line, in place without temporary vectors.
+        self.integrate(dt)
+        if asteroids.BOUNDARY_BEHAVIOR is not BoundaryBehavior.PASS_THROUGH:
+            apply_to_shape(asteroids.BOUNDARY_BEHAVIOR.batch_handler, self, dt)
         # --- End Position Update ---
 
         # Clean up if completely off-screen with buffer zone (Applies to ALL asteroids)
-        buffer = self.radius + 50  # Extra tolerance
-        screen_rect = pygame.Rect(
-            -buffer,
-            -buffer,
-            graphics.SCREEN_WIDTH + 2*buffer,
-            graphics.SCREEN_HEIGHT + 2*buffer,
-        )
-        if not self.rect.colliderect(screen_rect):
+        # compared by numbers like in the `AsteroidStore`, the rect doesn't need to be up to date for it
+        radius = self.radius
+        buffer = radius + 50  # Extra tolerance
+        position = self.position
+        if (
+            position.x + radius <= -buffer
+            or position.x - radius >= graphics.SCREEN_WIDTH + buffer
+            or position.y + radius <= -buffer
+            or position.y - radius >= graphics.SCREEN_HEIGHT + buffer
+        ):
             self.kill()
 
     def kill(self):
+        was_alive = self.alive()
         super().kill()
+        if self.invulnerability is not None:
+            self.invulnerability.cancel()
+            self.invulnerability = None
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
 
     def split(self) -> None:
         """Split ourselves and create a number of new smaller asteroids moving in random (within limits) directions.
@@ -116,12 +193,14 @@ class Asteroid(CircleShape):
         # don't split minimal asteroids
         if self.radius <= asteroids.MIN_RADIUS:
             return
+        if self.frame_stats is not None:
+            self.frame_stats.add_count("splits", 1)
 
-        angle = random.uniform(*asteroids.SPLIT_ANGLE)
+        angle = game_random.rng.uniform(*asteroids.SPLIT_ANGLE)
         new_radius = self.radius - asteroids.MIN_RADIUS
 
         for direction in asteroids.SPLIT_DIRECTIONS:
-            a = Asteroid(self.position, new_radius, is_fragment=True)
+            a = Asteroid.create(self.position, new_radius, is_fragment=True)
 
             # a.invulnerable_timer = asteroids.SPAWN_INVUL_TIME_IN_SEC  # Force fresh timer
             a.velocity = self.velocity
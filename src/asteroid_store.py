@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import numpy as np
+
+import settings.asteroids as asteroids
+import settings.graphics as graphics
+from src import difficulty
+from src.entity_store import INITIAL_CAPACITY, EntityStore
+
+if TYPE_CHECKING:
+    from src.asteroid_sprite import Asteroid
+
+CULL_BUFFER = 50  # Extra tolerance beyond the radius before an off-screen asteroid is removed
+
+
+class AsteroidStore(EntityStore["Asteroid"]):
+    """Array-backed storage for all asteroids, enabled with `settings.asteroids.ARRAY_BACKED`.
+
+    Instead of every `Asteroid.update()` running on its own, the store advances the
+    speed scaling, the movement and the off-screen cleanup of all attached asteroids
+    in one batched step per frame.
+    """
+    field_names: ClassVar[tuple[str, ...]] = ("radius", "initial_speed")
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        super().__init__(capacity)
+        self.boundary_handler = asteroids.BOUNDARY_BEHAVIOR.batch_handler
+
+    def update(self, dt: float) -> None:
+        """Advance all attached asteroids by the elapsed time in seconds."""
+        count = self.count
+        if count == 0:
+            return
+        positions = self.positions[:count]
+        velocities = self.velocities[:count]
+        radii = self.fields["radius"][:count]
+
+        # --- Speed Scaling, evaluated once for everybody ---
+        multiplier = difficulty.current().speed_multiplier
+        speeds = np.hypot(velocities[:, 0], velocities[:, 1])
+        # an initial speed of None is stored as NaN and means standing still
+        target_speeds = np.nan_to_num(self.fields["initial_speed"][:count]) * multiplier
+        # asteroids without velocity can't be scaled and keep standing still
+        scale = np.divide(target_speeds, speeds, out=np.ones(count), where=speeds > 0)
+        velocities *= scale[:, np.newaxis]
+
+        # --- Position Update ---
+        positions += velocities * dt
+        self.boundary_handler(positions, velocities, radii, dt)
+
+        # --- Clean up if completely off-screen with buffer zone ---
+        buffer = radii + CULL_BUFFER
+        x, y = positions[:, 0], positions[:, 1]
+        off_screen = (
+            (x + radii <= -buffer)
+            | (x - radii >= graphics.SCREEN_WIDTH + buffer)
+            | (y + radii <= -buffer)
+            | (y - radii >= graphics.SCREEN_HEIGHT + buffer)
+        )
+        if off_screen.any():
+            self.kill_slots(np.flatnonzero(off_screen))
+
+        self.sync_indexes()
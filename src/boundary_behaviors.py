@@ -3,9 +3,11 @@ from __future__ import annotations
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
+import numpy as np
 import pygame
 
 if TYPE_CHECKING:
+    from src.circleshape import CircleShape
     from src.player import Player  # Only import for type checking
 
 from settings.graphics import SCREEN_HEIGHT, SCREEN_WIDTH
@@ -22,6 +24,11 @@ TOP = "top"
 BOTTOM = "bottom"
 
 
+# Batch handlers work in place on the arrays of many moved entities: positions (n, 2), velocities (n, 2), radii (n,)
+# and the length of the step in seconds.
+BatchBoundaryHandler = Callable[[np.ndarray, np.ndarray, np.ndarray, float], None]
+
+
 class BoundaryInfo(NamedTuple):
     """Information about a boundary behavior including its handler function."""
     name: str
@@ -87,10 +94,15 @@ class BoundaryBehavior(Enum):
                               # If moving diagonally through top-left, emerge from bottom-right with same angle
     WRAP_RELATIVE = auto()  # Map position as percentage of screen, teleport to same relative position on opposite side
 
-    # Add a property to dynamically get the handler function based on the enum value (lowercase name)
+    # the handler function named after the enum value (lowercase name), resolved once in HANDLERS
     @property
     def handler(self) -> Callable[["Player", pygame.Vector2, float], None]:
-        return globals()[f"handle_{self.value}"]
+        return HANDLERS[self]
+
+    @property
+    def batch_handler(self) -> BatchBoundaryHandler:
+        """The batch version of the behavior for array-backed entities, look it up once and keep it."""
+        return BATCH_HANDLERS[self]
 
 def handle_pass_through(player: "Player", forward: pygame.Vector2, distance: float) -> None:
     """Allow movement off-screen without any boundary checks."""
@@ -136,20 +148,19 @@ def handle_bounce(player: "Player", forward: pygame.Vector2, distance: float) ->
     movement = forward * distance
     new_position = player.position + movement
 
-    # Collect all edges that would be hit
-    hit_edges: set[BoundaryEdge] = set()  # Fixed type hint
-    for edge in BoundaryEdge:
-        condition_func = edge.value.get_condition()
+    # Collect the bounces of all edges that would be hit
+    # a list keeps the edges in a fixed order, so replays rotate exactly the same way
+    hit_edges: list[Callable[[float], float]] = []
+    for condition_func, bounce_rotation_func in _BOUNCES:
         if condition_func(new_position, player.radius):
-            hit_edges.add(edge)
+            hit_edges.append(bounce_rotation_func)
 
     if not hit_edges:
         # No collision
         player.position = new_position
     else:
         # Handle collision - reflect rotation first
-        for edge in hit_edges:
-            bounce_rotation_func = edge.value.get_bounce_rotation()
+        for bounce_rotation_func in hit_edges:
             player.rotation = bounce_rotation_func(player.rotation)
         
         # NOW recalculate movement with the new rotation
@@ -185,12 +196,8 @@ def _handle_boundary_transfer(
     new_position = player.position + forward * distance
 
     # Extract transfer type from enum: WRAP_EDGE -> edge
-    transfer_type = behavior.name.removeprefix("WRAP_").lower()  # "edge", "momentum", etc.
-
-    for edge in BoundaryEdge:
-        condition_func = edge.value.get_condition()
+    for condition_func, transfer_func in _TRANSFERS[behavior]:
         if condition_func(new_position, player.radius):
-            transfer_func = edge.value.get_transfer(transfer_type)
             transfer_func(player)
             break
     else:
@@ -215,3 +222,124 @@ def handle_wrap_trajectory(player: "Player", forward: pygame.Vector2, distance:
 def handle_wrap_relative(player: "Player", forward: pygame.Vector2, distance: float) -> None:
     """Wrap player mapping position as percentage to opposite side."""
     _handle_boundary_transfer(player, forward, distance, BoundaryBehavior.WRAP_RELATIVE)
+
+
+# --- Batch handlers ---
+# An axis of an entity is only handled while the entity is beyond the limit of that axis and moving further out.
+# Asteroids spawn off-screen and fly in, they have to pass the limits untouched on their way.
+
+def _outward(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, axis: int) -> tuple[np.ndarray, np.ndarray]:
+    """Masks of the entities beyond the low and beyond the high limit of an axis, moving outward."""
+    high = (SCREEN_WIDTH, SCREEN_HEIGHT)[axis] - radii
+    coordinates, speeds = positions[:, axis], velocities[:, axis]
+    return (coordinates < radii) & (speeds < 0), (coordinates > high) & (speeds > 0)
+
+
+def batch_pass_through(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Leave all entities where they are, off-screen entities get culled elsewhere."""
+
+
+def batch_clamp(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Constrain the entities to the screen, they slide along the edges."""
+    for axis in (0, 1):
+        low, high = _outward(positions, velocities, radii, axis)
+        positions[low, axis] = radii[low]
+        positions[high, axis] = (SCREEN_WIDTH, SCREEN_HEIGHT)[axis] - radii[high]
+
+
+def batch_stick(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Take back the movement along every axis that would leave the screen."""
+    for axis in (0, 1):
+        low, high = _outward(positions, velocities, radii, axis)
+        out = low | high
+        positions[out, axis] -= velocities[out, axis] * dt
+
+
+def batch_check(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Take back the whole movement of entities that would leave the screen (all-or-nothing)."""
+    out = np.zeros(len(positions), dtype=bool)
+    for axis in (0, 1):
+        low, high = _outward(positions, velocities, radii, axis)
+        out |= low | high
+    positions[out] -= velocities[out] * dt
+
+
+def batch_bounce(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Reflect the entities off the edges, the overshoot is mirrored back onto the screen."""
+    for axis in (0, 1):
+        low, high = _outward(positions, velocities, radii, axis)
+        limit = (SCREEN_WIDTH, SCREEN_HEIGHT)[axis] - radii
+        positions[low, axis] = 2 * radii[low] - positions[low, axis]
+        positions[high, axis] = 2 * limit[high] - positions[high, axis]
+        out = low | high
+        velocities[out, axis] *= -1
+
+
+def batch_wrap_edge(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Move entities leaving the screen to the opposite edge."""
+    for axis in (0, 1):
+        low, high = _outward(positions, velocities, radii, axis)
+        positions[low, axis] = (SCREEN_WIDTH, SCREEN_HEIGHT)[axis] - radii[low]
+        positions[high, axis] = radii[high]
+
+
+def batch_wrap_momentum(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Move entities leaving the screen to the opposite edge, keeping their overshoot."""
+    for axis in (0, 1):
+        low, high = _outward(positions, velocities, radii, axis)
+        span = (SCREEN_WIDTH, SCREEN_HEIGHT)[axis] - 2 * radii
+        positions[low, axis] += span[low]
+        positions[high, axis] -= span[high]
+
+
+def batch_wrap_trajectory(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Move entities leaving the screen to the opposite edge, on the line they are flying along.
+    Unlike the player, every entity follows its own velocity.
+    """
+    for axis in (0, 1):
+        other = 1 - axis
+        low, high = _outward(positions, velocities, radii, axis)
+        limit = (SCREEN_WIDTH, SCREEN_HEIGHT)[axis] - radii
+        overshoot = np.zeros(len(positions))
+        overshoot[low] = radii[low] - positions[low, axis]
+        overshoot[high] = positions[high, axis] - limit[high]
+        out = low | high
+        # going back in time along the trajectory until the entity touched the edge
+        positions[out, other] -= overshoot[out] / np.abs(velocities[out, axis]) * velocities[out, other]
+        positions[low, axis] = limit[low]
+        positions[high, axis] = radii[high]
+
+
+def batch_wrap_relative(positions: np.ndarray, velocities: np.ndarray, radii: np.ndarray, dt: float) -> None:
+    """Move entities leaving the screen to the same relative position on the opposite edge.
+    Opposite edges are equally long, so this is the simple edge wrap.
+    """
+    batch_wrap_edge(positions, velocities, radii, dt)
+
+
+def apply_to_shape(handler: BatchBoundaryHandler, shape: CircleShape, dt: float) -> None:
+    """Run a batch handler on a single moved shape that isn't kept in an entity store."""
+    positions = np.array([[shape.position.x, shape.position.y]])
+    velocities = np.array([[shape.velocity.x, shape.velocity.y]])
+    handler(positions, velocities, np.array([shape.radius]), dt)
+    shape.position = pygame.Vector2(*positions[0])
+    shape.velocity = pygame.Vector2(*velocities[0])
+
+
+# Dispatch is resolved here once instead of on every call
+HANDLERS: dict[BoundaryBehavior, Callable[["Player", pygame.Vector2, float], None]] = {
+    behavior: globals()[f"handle_{behavior.value}"] for behavior in BoundaryBehavior
+}
+BATCH_HANDLERS: dict[BoundaryBehavior, BatchBoundaryHandler] = {
+    behavior: globals()[f"batch_{behavior.value}"] for behavior in BoundaryBehavior
+}
+_BOUNCES: list[tuple[Callable[[pygame.Vector2, float], bool], Callable[[float], float]]] = [
+    (edge.value.get_condition(), edge.value.get_bounce_rotation()) for edge in BoundaryEdge
+]
+_TRANSFERS: dict[BoundaryBehavior, list[tuple[Callable[[pygame.Vector2, float], bool], Callable[["Player"], None]]]] = {
+    behavior: [
+        (edge.value.get_condition(), edge.value.get_transfer(behavior.name.removeprefix("WRAP_").lower()))
+        for edge in BoundaryEdge
+    ]
+    for behavior in BoundaryBehavior if behavior.name.startswith("WRAP_")
+}
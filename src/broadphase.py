@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from enum import Enum, auto
+from typing import Any, Generic, Iterable, Iterator, Protocol, TypeVar
+
+ShapeT = TypeVar("ShapeT")
+
+
+class PairBroadphase(Protocol[ShapeT]):
+    """Finds the pairs of shapes that might overlap, the narrowphase check is up to the caller."""
+
+    def rebuild(self, shapes: Iterable[ShapeT]) -> None:
+        """Take in the shapes at their current positions, called once per frame."""
+        ...
+
+    def candidate_pairs(self) -> Iterator[tuple[ShapeT, ShapeT]]:
+        """Yield every pair of shapes that might overlap exactly once."""
+        ...
+
+
+class NestedLoops(Generic[ShapeT]):
+    """No broadphase at all: every shape is paired with every other shape."""
+
+    def __init__(self) -> None:
+        self.shapes: list[ShapeT] = []
+
+    def rebuild(self, shapes: Iterable[ShapeT]) -> None:
+        self.shapes = list(shapes)
+
+    def candidate_pairs(self) -> Iterator[tuple[ShapeT, ShapeT]]:
+        shapes = self.shapes
+        count = len(shapes)
+        for idx1 in range(count):
+            shape1 = shapes[idx1]
+            for idx2 in range(idx1 + 1, count):
+                yield shape1, shapes[idx2]
+
+
+class Broadphase(Enum):
+    """Enumeration of the broadphases that find the asteroid pairs to check for collisions."""
+    @staticmethod
+    def _generate_next_value_(name: str, start: int, count: int, last_values: list[Any]) -> str:
+        _ = start, count, last_values  # Acknowledge the parameters to avoid unused warnings
+        return name.lower()
+
+    NESTED_LOOPS = auto()  # Check every pair, only sensible for a handful of asteroids
+    GRID = auto()  # Uniform grid with cells as big as the largest asteroids, see `SpatialHash`
+    SWEEP_AND_PRUNE = auto()  # Keep the asteroids sorted along x and sweep over them, see `SweepAndPrune`
+
+    def create(self) -> PairBroadphase[Any]:
+        """Create a new, empty broadphase of this kind."""
+        # imported here because settings.asteroids imports this module and the broadphases import the settings
+        from src.spatial_hash import SpatialHash
+        from src.sweep_and_prune import SweepAndPrune
+
+        factories = {
+            Broadphase.NESTED_LOOPS: NestedLoops,
+            Broadphase.GRID: SpatialHash,
+            Broadphase.SWEEP_AND_PRUNE: SweepAndPrune,
+        }
+        return factories[self]()
@@ -1,27 +1,53 @@
 from __future__ import annotations
-from typing import Any, ClassVar, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 import pygame
 
+from src.entity_registry import Entity
+from src.entity_store import StoreField
+
+if TYPE_CHECKING:
+    from src.entity_store import EntityStore
+    from src.quadtree import LooseQuadtree
+
 
 # Base class for game objects
-class CircleShape(pygame.sprite.Sprite):
-    """Our base circular shapes. We won't initialize them but use subclasses instead"""
-    containers: ClassVar[tuple[pygame.sprite.Group[Any], ...]] = ()
+class CircleShape(Entity):
+    """Our base circular shapes. We won't initialize them but use subclasses instead
+
+    The position and the velocity are vectors we own and update in place: assigning copies
+    the values over instead of allocating a new vector, and `integrate()` moves us without
+    any temporary vectors. The rect is only moved to the position when somebody asks for it.
+    """
+    # the hot state lives in slots, everything else in the instance dictionary of the subclasses
+    __slots__ = ("_position", "_velocity", "_rect", "_rect_stale")
+
+    radius = StoreField("radius")
+
+    # the entity store holding our state while we are attached to one, see `EntityStore.attach()`
+    _store: Optional[EntityStore[Any]] = None
+    _slot: int = -1
+    # the quadtree we are indexed in, kept up to date whenever our position is set
+    _index: Optional[LooseQuadtree[Any]] = None
+
+    # where to draw between the previous (0.0) and the current (1.0) physics state, set by the game before drawing
+    render_alpha: ClassVar[float] = 1.0
+    previous_position: Optional[pygame.Vector2] = None
 
     def __init__(self, start_position: pygame.Vector2, radius: float) -> None:
         """
         Initialising a new circular shape.
-        Call super to initialize containers if defined in the class variable containers
+        Call super to join the entity registry with the start tags if the game set them,
         and initialize position, velocity and radius.
 
         Args:
             start_position (pygame.Vector2): starting position as a 2-dimensional vector
             radius (float): radius of our circle shape
         """
-        super().__init__(*self.containers)
+        super().__init__()
 
-        self._position: pygame.Vector2 = start_position
+        # our own copy, we change it in place
+        self._position: pygame.Vector2 = pygame.Vector2(start_position)
         self._velocity: pygame.Vector2 = pygame.Vector2(0, 0)  # velocity in pixels per second
         self.radius: float = radius
 
@@ -35,24 +61,126 @@ class CircleShape(pygame.sprite.Sprite):
         # TODO: stubs for future use and to satisfy typechecking
         self.image: Optional[pygame.Surface] = None
 
+    def reset(self, start_position: pygame.Vector2, radius: float) -> None:
+        """Bring a killed shape back to life at a new position, standing still.
+        It joins the entity registry with the start tags again.
+
+        Args:
+            start_position (pygame.Vector2): new position as a 2-dimensional vector
+            radius (float): new radius of our circle shape
+        """
+        self._position.update(start_position)
+        self._velocity.update(0, 0)
+        self.radius = radius
+        self._rect.update(start_position.x - radius, start_position.y - radius, radius * 2, radius * 2)
+        self._rect_stale = False
+        self.previous_position = None
+        self.register()
+
     @property
     def velocity(self) -> pygame.Vector2:
+        if self._store is not None:
+            return self._store.read_velocity(self._slot)
         return self._velocity
 
     @velocity.setter
     def velocity(self, value: pygame.Vector2) -> None:
-        # make a copy to prevent side effects
-        self._velocity = value.copy()
+        if self._store is not None:
+            self._store.write_velocity(self._slot, value)
+            return
+        # copy the values to prevent side effects, the vector stays ours
+        self._velocity.update(value)
 
     @property
     def position(self) -> pygame.Vector2:
+        # Attached shapes hand out a fresh vector, modifications only stick when assigned back
+        if self._store is not None:
+            return self._store.read_position(self._slot)
         return self._position
 
     @position.setter
     def position(self, value: pygame.Vector2) -> None:
-        self._position = value.copy()
-        # Automatically update rect when position changes
-        self.rect.center = (int(value.x), int(value.y))
+        if self._store is not None:
+            self._store.write_position(self._slot, value)
+        else:
+            # copy the values to prevent side effects, the vector stays ours
+            self._position.update(value)
+            self._rect_stale = True
+        if self._index is not None:
+            self._index.move(self, value.x, value.y)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Our bounding box, moved to the current position only when it is asked for."""
+        # the store moves attached shapes in batches without telling us
+        if self._rect_stale or self._store is not None:
+            position = self.position
+            self._rect.center = (int(position.x), int(position.y))
+            self._rect_stale = False
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: pygame.Rect) -> None:
+        self._rect = value
+        self._rect_stale = True
+
+    def integrate(self, dt: float) -> None:
+        """Move by our velocity for `dt` seconds, in place without allocating vectors."""
+        if self._store is not None:
+            self.position = self.position + self.velocity * dt
+            return
+        position, velocity = self._position, self._velocity
+        position.x += velocity.x * dt
+        position.y += velocity.y * dt
+        self._rect_stale = True
+        if self._index is not None:
+            self._index.move(self, position.x, position.y)
+
+    def set_speed(self, speed: float) -> None:
+        """Scale the velocity to a speed in place, keeping its direction. Standing still stays still."""
+        if self._store is not None:
+            velocity = self.velocity
+            if velocity.length_squared() > 0:
+                self.velocity = velocity.normalize() * speed
+            return
+        velocity = self._velocity
+        if velocity.x or velocity.y:
+            velocity.scale_to_length(speed)
+
+    def remember_position(self) -> None:
+        """Keep the current position as the previous physics state for interpolated drawing."""
+        if self.previous_position is None:
+            self.previous_position = self.position.copy()
+        else:
+            self.previous_position.update(self.position)
+
+    @property
+    def draw_position(self) -> pygame.Vector2:
+        """The position to draw at, interpolated between the previous and the current physics state."""
+        previous = self.previous_position
+        alpha = CircleShape.render_alpha
+        if previous is None or alpha >= 1.0:
+            return self.position
+        position = self.position
+        # don't smear teleports (e.g. wrapping around the screen) across the screen
+        if previous.distance_squared_to(position) > (2 * self.radius) ** 2:
+            return position
+        return previous.lerp(position, alpha)
+
+    def draw_rect(self) -> pygame.Rect:
+        """The screen region `draw()` paints into at the current `draw_position`."""
+        size = int(2 * self.radius) + 4  # a little slack for rounding and anti-aliasing
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (int(self.draw_position.x), int(self.draw_position.y))
+        return rect
+
+    def kill(self) -> None:
+        """Leave the entity registry and the quadtree, and take our state back from the entity store if we are attached to one."""
+        super().kill()
+        if self._index is not None:
+            self._index.remove(self)
+        if self._store is not None:
+            self._store.detach(self)
 
     def draw(self, screen: pygame.Surface) -> None:
         """Handles how we draw the circular shape on the screen/surface.
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 from enum import Enum, auto
 
 
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
 
 # Import physics functions needed by handlers (e.g., bounce_asteroids)
 # Adjust import path based on where physics.py is relative to this file
-from .physics import bounce_asteroids
+from .physics import bounce_asteroid_pairs, bounce_asteroids
 
 
 # Define the handler functions directly in this file
@@ -63,3 +63,18 @@ class CollisionBehavior(Enum):
         handler_name = f"handle_{self.value}"
         # Look up the function in the global scope of this module
         return globals()[handler_name]
+
+    def handle_pairs(self, pairs: Sequence[tuple["Asteroid", "Asteroid"]]) -> None:
+        """Handle a whole frame's worth of colliding pairs in order.
+        Bouncing is resolved in one batch, all other behaviors call their handler pair by pair.
+        """
+        if self is CollisionBehavior.BOUNCE:
+            bounce_asteroid_pairs([(a1, a2) for (a1, a2) in pairs if a1.alive() and a2.alive()])
+            return
+
+        handler = self.handler
+        for (a1, a2) in pairs:
+            # Check if asteroids are still alive before handling collision
+            if not (a1.alive() and a2.alive()):
+                continue
+            handler(a1, a2)
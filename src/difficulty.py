@@ -0,0 +1,51 @@
+"""Difficulty of the current physics step.
+
+The difficulty curves in `settings.asteroids` only depend on the game time, so they are evaluated
+once per physics step by `refresh()` and every asteroid reads the shared result with `current()`
+instead of evaluating the curves itself.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from settings import asteroids
+
+
+@dataclass(frozen=True)
+class Difficulty:
+    """The values of all difficulty curves at one point in game time."""
+    game_time: float
+    speed_multiplier: float  # `SPEED_GROWTH`, applied to the initial speed of every asteroid
+    spawn_rate: float  # `SPAWN_RATE_GROWTH`, asteroids spawned per second
+
+    @classmethod
+    def at(cls, game_time: float) -> Difficulty:
+        """Evaluate the difficulty curves of the current settings.
+
+        Args:
+            game_time (float): Simulated game time in seconds.
+        """
+        return cls(
+            game_time=game_time,
+            speed_multiplier=asteroids.SPEED_GROWTH.evaluate(game_time),
+            spawn_rate=asteroids.SPAWN_RATE_GROWTH.evaluate(game_time),
+        )
+
+
+_current = Difficulty.at(0.0)
+
+
+def current() -> Difficulty:
+    """Get the difficulty of the current physics step."""
+    return _current
+
+
+def refresh(game_time: float) -> Difficulty:
+    """Evaluate the difficulty curves for a new physics step.
+
+    Args:
+        game_time (float): Simulated game time in seconds.
+    """
+    global _current
+    _current = Difficulty.at(game_time)
+    return _current
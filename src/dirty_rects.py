@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pygame
+
+import settings.graphics as graphics
+
+
+class DirtyRectRenderer:
+    """Erases and presents only the screen regions that changed, enabled with `settings.graphics.DIRTY_RECT_RENDERING`.
+
+    Every region drawn into during a frame is recorded with `add()`. The next frame erases
+    exactly these regions instead of filling the whole screen, and the display is updated
+    with the regions of both frames: where things were and where they are now. If those
+    cover more than `full_flip_ratio` of the screen, updating the regions one by one is no
+    cheaper than presenting everything, so the whole screen gets flipped instead.
+
+    Args:
+        screen (pygame.Surface): The surface everything gets drawn on.
+        full_flip_ratio (float): Share of the screen area above which the whole screen is presented.
+    """
+
+    def __init__(self, screen: pygame.Surface, full_flip_ratio: float) -> None:
+        self.screen = screen
+        self.full_flip_ratio = full_flip_ratio
+        self.previous: list[pygame.Rect] = []  # drawn during the last frame
+        self.current: list[pygame.Rect] = []  # drawn during this frame
+        self.full_redraw = True  # nothing is known about the screen contents yet
+        self.full_flips = 0
+        self.partial_updates = 0
+        self.dirty_ratio = 0.0  # share of the screen presented in the last frame
+
+    def invalidate(self) -> None:
+        """Erase and present the whole screen in the next frame, e.g. after something else drew on it."""
+        self.full_redraw = True
+
+    def begin_frame(self) -> None:
+        """Erase everything drawn during the last frame."""
+        background = graphics.GameColors.BACKGROUND
+        if self.full_redraw:
+            self.screen.fill(background)
+        else:
+            for rect in self.previous:
+                self.screen.fill(background, rect)
+        self.current = []
+
+    def add(self, rect: pygame.Rect) -> None:
+        """Record a region that was drawn into during this frame."""
+        self.current.append(rect)
+
+    def end_frame(self, update_display: bool = True) -> None:
+        """Present the changed regions, or the whole screen if they cover too much of it.
+
+        Args:
+            update_display (bool): Whether there is a display to present to, headless games only do the bookkeeping.
+        """
+        dirty = self.previous + self.current
+        screen_area = self.screen.get_width() * self.screen.get_height()
+        # overlapping regions are counted twice, that's good enough for picking a strategy
+        self.dirty_ratio = min(sum(rect.width * rect.height for rect in dirty) / screen_area, 1.0)
+        if self.full_redraw or self.dirty_ratio > self.full_flip_ratio:
+            if update_display:
+                pygame.display.flip()
+            self.full_flips += 1
+            self.dirty_ratio = 1.0
+        else:
+            if update_display:
+                pygame.display.update(dirty)
+            self.partial_updates += 1
+        self.previous = self.current
+        self.full_redraw = False
+
+    def report(self) -> str:
+        frames = self.full_flips + self.partial_updates
+        full_share = self.full_flips / frames if frames else 0.0
+        return f"dirty rects: {self.dirty_ratio:.0%} of screen, {full_share:.0%} full flips"
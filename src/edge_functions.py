@@ -72,10 +72,8 @@ def bottom_momentum_transfer(player: Player) -> None:
 # Trajectory transfer functions
 def left_trajectory_transfer(player: Player) -> None:
     """Transfer player from left edge maintaining diagonal trajectory."""
-    from settings.player import FORWARD_SPEED
-
-    # Calculate current velocity vector from rotation
-    velocity = pygame.Vector2(0, 1).rotate(player.rotation) * FORWARD_SPEED
+    # Direction of flight, the speed cancels out of the overshoot ratio
+    velocity = pygame.Vector2(0, 1).rotate(player.rotation)
 
     # How far past the left boundary did we go?
     overshoot_x = player.radius - player.position.x
@@ -93,10 +91,8 @@ def left_trajectory_transfer(player: Player) -> None:
 
 def right_trajectory_transfer(player: Player) -> None:
     """Transfer player from right edge maintaining diagonal trajectory."""
-    from settings.player import FORWARD_SPEED
-
-    # Calculate current velocity vector from rotation
-    velocity = pygame.Vector2(0, 1).rotate(player.rotation) * FORWARD_SPEED
+    # Direction of flight, the speed cancels out of the overshoot ratio
+    velocity = pygame.Vector2(0, 1).rotate(player.rotation)
 
     # How far past the right boundary did we go?
     overshoot_x = player.position.x - (SCREEN_WIDTH - player.radius)
@@ -114,10 +110,8 @@ def right_trajectory_transfer(player: Player) -> None:
 
 def top_trajectory_transfer(player: Player) -> None:
     """Transfer player from top edge maintaining diagonal trajectory."""
-    from settings.player import FORWARD_SPEED
-
-    # Calculate current velocity vector from rotation
-    velocity = pygame.Vector2(0, 1).rotate(player.rotation) * FORWARD_SPEED
+    # Direction of flight, the speed cancels out of the overshoot ratio
+    velocity = pygame.Vector2(0, 1).rotate(player.rotation)
     
     # How far past the top boundary did we go?
     overshoot_y = player.radius - player.position.y
@@ -134,10 +128,8 @@ def top_trajectory_transfer(player: Player) -> None:
 
 def bottom_trajectory_transfer(player: Player) -> None:
     """Transfer player from bottom edge maintaining diagonal trajectory."""
-    from settings.player import FORWARD_SPEED
-
-    # Calculate current velocity vector from rotation
-    velocity = pygame.Vector2(0, 1).rotate(player.rotation) * FORWARD_SPEED
+    # Direction of flight, the speed cancels out of the overshoot ratio
+    velocity = pygame.Vector2(0, 1).rotate(player.rotation)
     
     # How far past the bottom boundary did we go?
     overshoot_y = player.position.y - (SCREEN_HEIGHT - player.radius)
@@ -152,6 +144,24 @@ def bottom_trajectory_transfer(player: Player) -> None:
         # Pure horizontal movement, use simple edge transfer
         player.position = pygame.Vector2(player.position.x, player.radius)
 
+# Relative transfer functions
+# Both sides of the screen are equally long, so the relative position along the edge carries over as it is.
+def left_relative_transfer(player: Player) -> None:
+    """Transfer player from left edge to the same relative height on the right edge."""
+    player.position = pygame.Vector2(SCREEN_WIDTH - player.radius, player.position.y)
+
+def right_relative_transfer(player: Player) -> None:
+    """Transfer player from right edge to the same relative height on the left edge."""
+    player.position = pygame.Vector2(player.radius, player.position.y)
+
+def top_relative_transfer(player: Player) -> None:
+    """Transfer player from top edge to the same relative width on the bottom edge."""
+    player.position = pygame.Vector2(player.position.x, SCREEN_HEIGHT - player.radius)
+
+def bottom_relative_transfer(player: Player) -> None:
+    """Transfer player from bottom edge to the same relative width on the top edge."""
+    player.position = pygame.Vector2(player.position.x, player.radius)
+
 # Bounce rotation functions
 def horizontal_bounce(rotation: float) -> float:
     """Bounce off horizontal wall (top/bottom edges) - flips vertical component"""
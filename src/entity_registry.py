@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import enum
+from typing import Any, ClassVar, Generic, Iterator, Optional, TypeVar, Union
+
+EntityT = TypeVar("EntityT", bound="Entity")
+
+
+class Kind(enum.Enum):
+    """What an entity is. Every entity has exactly one kind."""
+    PLAYER = "player"
+    ASTEROID = "asteroid"
+    SHOT = "shot"
+    SYSTEM = "system"  # bookkeeping without a body, e.g. the asteroid field and the entity stores
+
+
+class Tag(enum.IntFlag):
+    """Flags of an entity, combined into a bitmask. They replace the sprite groups the game used to keep."""
+    UPDATABLE = enum.auto()
+    DRAWABLE = enum.auto()
+    VULNERABLE = enum.auto()  # asteroids the shots can hit
+    INVULNERABLE = enum.auto()  # fresh asteroids, only the player can hit them
+
+
+TAGS = tuple(Tag)  # the single flags, in order
+_TAG_BITS = tuple(int(tag) for tag in TAGS)  # plain ints are much cheaper to combine than flags
+_KIND_SLOT = 0  # index into `Entity._slots`, the tags follow in the order of `TAGS`
+
+
+class Entity:
+    """Something the game keeps track of in its `EntityRegistry`, the replacement for `pygame.sprite.Sprite`.
+
+    Subclasses name their kind, and the game sets the tags they start with and the registry they
+    join, like it used to set the groups they join. `alive()` and `kill()` work like for sprites.
+    """
+    __slots__ = ("_registry", "_tags", "_slots")
+
+    kind: ClassVar[Kind] = Kind.SYSTEM
+    start_tags: ClassVar[Tag] = Tag(0)  # tags of new entities, set by the game
+    registry: ClassVar[Optional[EntityRegistry]] = None  # the registry new entities join, set by the game
+
+    def __init__(self) -> None:
+        self._registry: Optional[EntityRegistry] = None
+        self._tags = 0  # bitmask of our tags
+        self._slots = [-1] * (1 + len(TAGS))  # where we are in the array of our kind and of every tag
+        self.register()
+
+    def register(self) -> None:
+        """Join the registry set on the class with the start tags, if there is one."""
+        if self.registry is not None:
+            self.registry.add(self, self.start_tags)
+
+    @property
+    def tags(self) -> Tag:
+        return Tag(self._tags)
+
+    def alive(self) -> bool:
+        """Whether we are registered, false after `kill()`."""
+        return self._registry is not None
+
+    def kill(self) -> None:
+        """Leave the registry."""
+        if self._registry is not None:
+            self._registry.remove(self)
+
+    def retag(self, add: Tag = Tag(0), remove: Tag = Tag(0)) -> None:
+        """Set and clear tags. Does nothing unless we are registered."""
+        if self._registry is not None:
+            self._registry.set_tags(self, (self._tags & ~remove) | add)
+
+    def has(self, tag: Tag) -> bool:
+        return bool(self._tags & tag)
+
+
+class _Members:
+    """A compact array of entities. Every entity knows its index, so removing one is a swap with the last one.
+
+    While the registry is iterated, removed entities leave a hole (`None`) instead, so nobody
+    gets skipped or visited twice. The holes are swapped out once the iteration is over.
+    """
+    __slots__ = ("items", "holes", "slot")
+
+    def __init__(self, slot: int) -> None:
+        self.items: list[Optional[Entity]] = []
+        self.holes: list[int] = []
+        self.slot = slot  # which of the entities' slots holds their index in this array
+
+    def __len__(self) -> int:
+        return len(self.items) - len(self.holes)
+
+    def append(self, entity: Entity) -> None:
+        entity._slots[self.slot] = len(self.items)
+        self.items.append(entity)
+
+    def remove(self, entity: Entity, deferred: bool) -> None:
+        index = entity._slots[self.slot]
+        entity._slots[self.slot] = -1
+        if deferred:
+            self.items[index] = None
+            self.holes.append(index)
+        else:
+            self._swap_remove(index)
+
+    def _swap_remove(self, index: int) -> None:
+        last = self.items.pop()
+        if index < len(self.items):
+            assert last is not None
+            self.items[index] = last
+            last._slots[self.slot] = index
+
+    def compact(self) -> None:
+        """Swap out the holes, highest first so the last item is never a hole itself."""
+        if not self.holes:
+            return
+        self.holes.sort(reverse=True)
+        for index in self.holes:
+            self._swap_remove(index)
+        self.holes.clear()
+
+
+class EntityRegistry:
+    """All entities of a game, in a compact array per kind and per tag.
+
+    Adding, removing and retagging entities are O(1) list operations, and iterating a kind or a
+    tag walks its array in place instead of copying it like `pygame.sprite.Group` does. Entities
+    added while iterating are left for the next iteration, as with a copy.
+    """
+
+    def __init__(self) -> None:
+        self.kinds: dict[Kind, _Members] = {kind: _Members(_KIND_SLOT) for kind in Kind}
+        self.tagged: dict[Tag, _Members] = {tag: _Members(1 + position) for position, tag in enumerate(TAGS)}
+        self._tag_members = tuple(zip(_TAG_BITS, self.tagged.values()))
+        self._iterating = 0  # iterations in progress, removals leave holes while there are any
+
+    def __len__(self) -> int:
+        return sum(len(members) for members in self.kinds.values())
+
+    def add(self, entity: Entity, tags: int) -> None:
+        if entity._registry is not None:
+            raise ValueError(f"{entity!r} is already registered.")
+        entity._registry = self
+        entity._tags = 0
+        self.kinds[entity.kind].append(entity)
+        self.set_tags(entity, tags)
+
+    def remove(self, entity: Entity) -> None:
+        deferred = self._iterating > 0
+        self.kinds[entity.kind].remove(entity, deferred)
+        for bit, members in self._tag_members:
+            if entity._tags & bit:
+                members.remove(entity, deferred)
+        entity._registry = None
+        entity._tags = 0
+
+    def set_tags(self, entity: Entity, tags: int) -> None:
+        """Replace the tags of a registered entity, it joins and leaves the arrays of the changed ones."""
+        changed = entity._tags ^ tags
+        if not changed:
+            return
+        deferred = self._iterating > 0
+        for bit, members in self._tag_members:
+            if changed & bit:
+                if tags & bit:
+                    members.append(entity)
+                else:
+                    members.remove(entity, deferred)
+        entity._tags = int(tags)
+
+    def view(self, key: Union[Kind, Tag]) -> EntityView[Any]:
+        """A live, group-like view of the entities of a kind or with a single tag."""
+        return EntityView(self, key)
+
+    def iterate(self, members: _Members) -> Iterator[Entity]:
+        """Walk an array in place, skipping the holes of entities removed meanwhile."""
+        items = members.items
+        self._iterating += 1
+        try:
+            for index in range(len(items)):  # entities added during the iteration are left out
+                entity = items[index]
+                if entity is not None:
+                    yield entity
+        finally:
+            self._iterating -= 1
+            if self._iterating == 0:
+                for array in self.kinds.values():
+                    array.compact()
+                for array in self.tagged.values():
+                    array.compact()
+
+
+class EntityView(Generic[EntityT]):
+    """The entities of a kind or with a tag, with the parts of the `pygame.sprite.Group` interface the game uses."""
+
+    def __init__(self, registry: EntityRegistry, key: Union[Kind, Tag]) -> None:
+        self.registry = registry
+        self.key = key
+        self.members = registry.kinds[key] if isinstance(key, Kind) else registry.tagged[key]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __iter__(self) -> Iterator[EntityT]:
+        return self.registry.iterate(self.members)  # type: ignore[return-value]
+
+    def __contains__(self, entity: object) -> bool:
+        if not isinstance(entity, Entity) or entity._registry is not self.registry:
+            return False
+        index = entity._slots[self.members.slot]
+        return index >= 0 and self.members.items[index] is entity
+
+    def sprites(self) -> list[EntityT]:
+        return list(self)
+
+    def update(self, *args: Any) -> None:
+        """Call `update()` of every entity."""
+        for entity in self:
+            entity.update(*args)  # type: ignore[attr-defined]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Optional, TypeVar
+
+import numpy as np
+import pygame
+
+from src.entity_registry import Entity
+
+if TYPE_CHECKING:
+    from src.circleshape import CircleShape
+    from src.quadtree import LooseQuadtree
+
+ShapeT = TypeVar("ShapeT", bound="CircleShape")
+
+INITIAL_CAPACITY = 64
+
+
+class StoreField:
+    """A float attribute of a `CircleShape` that lives in an `EntityStore` while the shape is attached to one.
+
+    Detached shapes keep the value in their instance dictionary, so the attribute behaves
+    like a plain attribute for everybody using it.
+
+    Args:
+        name (str): Name of the attribute and of the matching array in `EntityStore.fields`.
+        optional (bool): Whether `None` is a valid value. It is stored as NaN in the array.
+    """
+
+    def __init__(self, name: str, optional: bool = False) -> None:
+        self.name = name
+        self.local_name = f"_{name}"
+        self.optional = optional
+
+    def __get__(self, shape: Optional["CircleShape"], owner: type) -> Any:
+        if shape is None:
+            return self
+        store = shape._store
+        if store is None:
+            return shape.__dict__[self.local_name]
+        value = float(store.fields[self.name][shape._slot])
+        if self.optional and math.isnan(value):
+            return None
+        return value
+
+    def __set__(self, shape: "CircleShape", value: Optional[float]) -> None:
+        store = shape._store
+        if store is None:
+            shape.__dict__[self.local_name] = value
+            return
+        store.fields[self.name][shape._slot] = math.nan if value is None else value
+
+
+class EntityStore(Entity, Generic[ShapeT]):
+    """Struct-of-arrays storage for the state of many circular shapes.
+
+    Positions and velocities are kept in contiguous `(capacity, 2)` arrays and every name in
+    `field_names` gets a contiguous float array, so subclasses can update all attached shapes
+    in one batched step. The shapes stay around as thin handles that read and write their slot.
+
+    Attached shapes occupy the slots `0 .. count - 1`. Detaching a shape moves the last
+    shape into the freed slot, so the arrays never contain holes.
+    """
+    field_names: ClassVar[tuple[str, ...]] = ("radius",)
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        super().__init__()
+        self.count = 0
+        self.handles: list[ShapeT] = []
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.fields: dict[str, np.ndarray] = {name: np.zeros(capacity) for name in self.field_names}
+        # the quadtree the attached shapes are indexed in, and where it filed them, see `LooseQuadtree.sync_store()`
+        self.index: Optional[LooseQuadtree[Any]] = None
+        self.index_depths = np.full(capacity, -1, dtype=np.int64)  # -1 if the shape isn't indexed
+        self.index_cells = np.full(capacity, -1, dtype=np.int64)  # row-major cell of the level, -1 if outside
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        return len(self.positions)
+
+    def _grow(self) -> None:
+        """Double the capacity of all arrays."""
+        capacity = self.capacity * 2
+        self.positions = np.resize(self.positions, (capacity, 2))
+        self.velocities = np.resize(self.velocities, (capacity, 2))
+        self.fields = {name: np.resize(array, capacity) for name, array in self.fields.items()}
+        self.index_depths = np.resize(self.index_depths, capacity)
+        self.index_cells = np.resize(self.index_cells, capacity)
+
+    def attach(self, shape: ShapeT) -> None:
+        """Move the state of a shape into the store. The shape becomes a handle to its slot."""
+        if self.count == self.capacity:
+            self._grow()
+        self._move_in(shape, self.count)
+        self.handles.append(shape)
+        self.count += 1
+
+    def detach(self, shape: ShapeT) -> None:
+        """Copy the state of a shape back into the shape and free its slot."""
+        if shape._store is not self:
+            return
+        slot = shape._slot
+        self._move_out(shape)
+
+        # fill the hole with the last shape
+        last = self.count - 1
+        if slot != last:
+            self.positions[slot] = self.positions[last]
+            self.velocities[slot] = self.velocities[last]
+            for array in self.fields.values():
+                array[slot] = array[last]
+            self.index_depths[slot] = self.index_depths[last]
+            self.index_cells[slot] = self.index_cells[last]
+            moved = self.handles[last]
+            moved._slot = slot
+            self.handles[slot] = moved
+        self.handles.pop()
+        self.count -= 1
+
+    def _move_in(self, shape: ShapeT, slot: int) -> None:
+        """Copy the state of a shape into a slot and make the shape a handle to it."""
+        if shape._store is not None:
+            raise ValueError(f"{shape!r} is already attached to a store.")
+        position, velocity = shape.position, shape.velocity
+        self.positions[slot] = (position.x, position.y)
+        self.velocities[slot] = (velocity.x, velocity.y)
+        for name, array in self.fields.items():
+            value = getattr(shape, name)
+            array[slot] = math.nan if value is None else value
+        shape._store = self
+        shape._slot = slot
+        self.index_depths[slot] = -1
+        if shape._index is not None:
+            shape._index.store_cell(shape)
+
+    def _move_out(self, shape: ShapeT) -> None:
+        """Copy the state of an attached shape back into the shape. The slot is left as it is."""
+        slot = shape._slot
+        values = {name: getattr(shape, name) for name in self.field_names}
+        position = pygame.Vector2(*self.positions[slot])
+        velocity = pygame.Vector2(*self.velocities[slot])
+
+        shape._store = None
+        shape._slot = -1
+        for name, value in values.items():
+            setattr(shape, name, value)
+        shape.position = position
+        shape.velocity = velocity
+
+    def read_position(self, slot: int) -> pygame.Vector2:
+        return pygame.Vector2(*self.positions[slot])
+
+    def write_position(self, slot: int, value: pygame.Vector2) -> None:
+        self.positions[slot] = (value.x, value.y)
+
+    def read_velocity(self, slot: int) -> pygame.Vector2:
+        return pygame.Vector2(*self.velocities[slot])
+
+    def write_velocity(self, slot: int, value: pygame.Vector2) -> None:
+        self.velocities[slot] = (value.x, value.y)
+
+    def sync_indexes(self) -> None:
+        """Refile the indexed handles whose center moved into another square of the quadtree.
+        The batched update moves the shapes without going through `CircleShape.position`.
+        """
+        if self.index is not None:
+            self.index.sync_store(self)
+
+    def kill_slots(self, slots: np.ndarray) -> None:
+        """Kill the handles in the given ascending slots."""
+        # highest slots first, swap-remove then only ever moves shapes that survive
+        for slot in slots[::-1].tolist():
+            self.handles[slot].kill()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pygame
+
+import settings.graphics as graphics
+from src.surface_cache import Color, asteroid_surfaces
+
+if TYPE_CHECKING:
+    from src.asteroid_sprite import Asteroid
+    from src.player import Player
+    from src.shot import Shot
+
+
+def _frozen(values: Sequence[object], dtype: type, columns: int = 0) -> np.ndarray:
+    """A read-only array, so the thread drawing a snapshot can rely on nobody changing it."""
+    shape = (len(values), columns) if columns else (len(values),)
+    array = np.array(values, dtype=dtype).reshape(shape)
+    array.flags.writeable = False
+    return array
+
+
+class FrameSnapshot(NamedTuple):
+    """Everything needed to draw a frame, copied out of the game so it can be drawn on another thread.
+
+    Positions are the interpolated draw positions at the time of the snapshot. Asteroids that are
+    blinked off are left out. The looks of the asteroids are indexes into the palette of
+    (fill color, border color) pairs, there are only a few different ones.
+    """
+    asteroid_positions: np.ndarray  # (n, 2)
+    asteroid_radii: np.ndarray
+    asteroid_border_widths: np.ndarray
+    asteroid_looks: np.ndarray
+    palette: tuple[tuple[Color, Color], ...]
+    shot_positions: np.ndarray  # (n, 2)
+    shot_radii: np.ndarray
+    player_triangle: Optional[tuple[tuple[float, float], ...]]
+    game_time: float  # seconds, for the timer
+    overlay: Optional[tuple[tuple[str, ...], tuple[float, ...]]]  # lines and frame times of the frame stats overlay
+
+    @classmethod
+    def capture(
+            cls,
+            asteroids: Iterable[Asteroid],
+            shots: Iterable[Shot],
+            player: Optional[Player],
+            game_time: float,
+            overlay: Optional[tuple[tuple[str, ...], tuple[float, ...]]] = None,
+        ) -> FrameSnapshot:
+        """Copy the drawing state out of the game objects, call it with `CircleShape.render_alpha` set."""
+        positions: list[tuple[float, float]] = []
+        radii: list[float] = []
+        border_widths: list[int] = []
+        looks: list[int] = []
+        palette: dict[tuple[Color, Color], int] = {}
+        for asteroid in asteroids:
+            if not asteroid.is_visible():
+                continue
+            position = asteroid.draw_position
+            positions.append((position.x, position.y))
+            radii.append(asteroid.radius)
+            border_widths.append(asteroid.border_width())
+            looks.append(palette.setdefault((asteroid.fill_color, asteroid.border_color), len(palette)))
+        shot_positions: list[tuple[float, float]] = []
+        shot_radii: list[float] = []
+        for shot in shots:
+            position = shot.draw_position
+            shot_positions.append((position.x, position.y))
+            shot_radii.append(shot.radius)
+        triangle = None
+        if player is not None:
+            triangle = tuple((point.x, point.y) for point in player.triangle(player.draw_position))
+        return cls(
+            asteroid_positions=_frozen(positions, float, 2),
+            asteroid_radii=_frozen(radii, float),
+            asteroid_border_widths=_frozen(border_widths, int),
+            asteroid_looks=_frozen(looks, int),
+            palette=tuple(palette),
+            shot_positions=_frozen(shot_positions, float, 2),
+            shot_radii=_frozen(shot_radii, float),
+            player_triangle=triangle,
+            game_time=game_time,
+            overlay=overlay,
+        )
+
+    def draw(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Draw the asteroids, the shots and the player like their `draw()` methods do.
+        Returns the screen regions drawn into, for the dirty rect rendering.
+        """
+        rects: list[pygame.Rect] = []
+        asteroids = zip(
+            self.asteroid_positions.tolist(), self.asteroid_radii.tolist(),
+            self.asteroid_border_widths.tolist(), self.asteroid_looks.tolist(),
+        )
+        if graphics.CACHE_ASTEROID_SURFACES:
+            blits: list[tuple[pygame.Surface, pygame.Rect]] = []
+            for center, radius, border_width, look in asteroids:
+                fill_color, border_color = self.palette[look]
+                surface = asteroid_surfaces.get(radius, fill_color, border_color, border_width)
+                blits.append((surface, surface.get_rect(center=center)))
+                rects.append(_circle_rect(center, radius))
+            screen.blits(blits, doreturn=False)
+        else:
+            for center, radius, border_width, look in asteroids:
+                fill_color, border_color = self.palette[look]
+                pygame.draw.circle(screen, color=fill_color, center=center, radius=radius)
+                pygame.draw.circle(screen, color=border_color, center=center, radius=radius, width=border_width)
+                rects.append(_circle_rect(center, radius))
+
+        for center, radius in zip(self.shot_positions.tolist(), self.shot_radii.tolist()):
+            pygame.draw.circle(screen, color=graphics.GameColors.SHOT_FILL, center=center, radius=radius)
+            pygame.draw.circle(
+                screen, color=graphics.GameColors.SHOT_BORDER, center=center, radius=radius,
+                width=graphics.BorderWidths.SHOT,
+            )
+            rects.append(_circle_rect(center, radius))
+
+        if self.player_triangle is not None:
+            points = self.player_triangle
+            pygame.draw.polygon(surface=screen, color=graphics.GameColors.PLAYER_FILL, points=points)
+            pygame.draw.polygon(
+                surface=screen, color=graphics.GameColors.PLAYER_BORDER, points=points,
+                width=graphics.BorderWidths.PLAYER,
+            )
+            xs, ys = zip(*points)
+            outline = graphics.BorderWidths.PLAYER + 2
+            rects.append(pygame.Rect(
+                int(min(xs)) - outline,
+                int(min(ys)) - outline,
+                int(max(xs) - min(xs)) + 2 * outline + 1,
+                int(max(ys) - min(ys)) + 2 * outline + 1,
+            ))
+        return rects
+
+
+def _circle_rect(center: Sequence[float], radius: float) -> pygame.Rect:
+    """The region a circle is drawn into, like `CircleShape.draw_rect()`."""
+    size = int(2 * radius) + 4
+    rect = pygame.Rect(0, 0, size, size)
+    rect.center = (int(center[0]), int(center[1]))
+    return rect
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import csv
+from typing import Optional, Sequence
+
+import numpy as np
+import pygame
+
+import settings.graphics as graphics
+
+STAGES = ("events", "collisions", "timers", "update", "draw")  # milliseconds spent per frame
+COUNTS = (  # plain counts: entities at the end of the frame, and checks and events during it
+    "updatable", "drawable", "vulnerable", "invulnerable", "shots", "timers_pending",
+    "collision_checks", "collision_hits", "spawn_attempts", "spawn_failures", "splits",
+)
+COLUMNS = ("frame", "dt") + STAGES + COUNTS  # frame, dt and the stages are milliseconds, the counts aren't
+OVERLAY_WIDTH = 260  # pixels, the graph shows one frame per pixel
+
+
+class FrameStats:
+    """Fixed-size ring buffer with the timings and entity counts of the most recent frames.
+
+    Stage times and counts are summed up over the current frame (a frame can contain several
+    physics steps) until `end_frame()` moves on to the next row, overwriting the oldest frame.
+
+    Args:
+        capacity (int): Number of frames to keep.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.rows = np.zeros((capacity, len(COLUMNS)))
+        self.frames = 0  # number of finished frames, the current row is frames % capacity
+        self.column = {name: idx for idx, name in enumerate(COLUMNS)}
+
+    def __len__(self) -> int:
+        return min(self.frames, self.capacity)
+
+    @property
+    def current(self) -> np.ndarray:
+        return self.rows[self.frames % self.capacity]
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """Add the time spent in a stage of the current frame."""
+        self.current[self.column[stage]] += seconds * 1000
+
+    def add_count(self, name: str, count: int) -> None:
+        """Add to a counter of the current frame."""
+        self.current[self.column[name]] += count
+
+    def end_frame(self, frame_seconds: float, dt: float, counts: dict[str, int]) -> np.ndarray:
+        """Finish the current frame and start a fresh one.
+
+        Args:
+            frame_seconds (float): Time spent working on the frame, without waiting for the next one.
+            dt (float): Time since the previous frame in seconds.
+            counts (dict[str, int]): Entity counts at the end of the frame.
+
+        Returns:
+            np.ndarray: The row of the finished frame, valid until the ring buffer wraps around to it.
+        """
+        row = self.current
+        row[self.column["frame"]] = frame_seconds * 1000
+        row[self.column["dt"]] = dt * 1000
+        for name, count in counts.items():
+            row[self.column[name]] = count
+        self.frames += 1
+        self.current[:] = 0
+        return row
+
+    def recent(self, frames: Optional[int] = None) -> np.ndarray:
+        """Get the rows of the most recent frames, oldest first."""
+        available = len(self)
+        frames = available if frames is None else min(frames, available)
+        end = self.frames % self.capacity
+        indices = np.arange(end - frames, end) % self.capacity
+        return self.rows[indices]
+
+    def averages(self, frames: int) -> dict[str, float]:
+        """Average every column over the most recent frames."""
+        recent = self.recent(frames)
+        if len(recent) == 0:
+            return {name: 0.0 for name in COLUMNS}
+        return dict(zip(COLUMNS, recent.mean(axis=0).tolist()))
+
+    def dump(self, path: str) -> None:
+        """Write all buffered frames as CSV, oldest first."""
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(COLUMNS)
+            writer.writerows(self.recent().tolist())
+
+    def overlay_lines(self, frames: int, extra_lines: Sequence[str] = ()) -> list[str]:
+        """The text of the overlay: rolling averages over the most recent frames and any extra lines."""
+        averages = self.averages(frames)
+        lines = [f"frame {averages['frame']:6.2f} ms  dt {averages['dt']:6.2f} ms"]
+        lines += [f"{stage:<11}{averages[stage]:6.2f} ms" for stage in STAGES]
+        lines += [f"{name:<17}{averages[name]:7.1f}" for name in COUNTS]
+        lines += extra_lines
+        return lines
+
+    def recent_frame_times(self, frames: int = OVERLAY_WIDTH) -> list[float]:
+        """The frame times of the most recent frames in milliseconds, oldest first, for the overlay's graph."""
+        return self.recent(frames)[:, self.column["frame"]].tolist()
+
+    def draw_overlay(
+            self,
+            screen: pygame.Surface,
+            font: pygame.font.Font,
+            frames: int,
+            extra_lines: Sequence[str] = (),
+        ) -> pygame.Rect:
+        """Draw rolling averages, any extra lines and a graph of the recent frame times in the top-right corner.
+        Returns the screen region covered by the overlay.
+        """
+        return render_overlay(screen, font, self.overlay_lines(frames, extra_lines), self.recent_frame_times())
+
+
+def render_overlay(
+        screen: pygame.Surface,
+        font: pygame.font.Font,
+        lines: Sequence[str],
+        frame_times: Sequence[float],
+    ) -> pygame.Rect:
+    """Draw the lines of the overlay and a graph of the frame times in the top-right corner.
+    Returns the screen region covered by the overlay.
+    """
+    width, line_height, graph_height = OVERLAY_WIDTH, font.get_linesize(), 60
+    left = graphics.SCREEN_WIDTH - width - 10
+    top = 10
+    background = pygame.Rect(left - 5, top - 5, width + 10, len(lines) * line_height + graph_height + 15)
+    screen.fill(graphics.GameColors.BACKGROUND, background)
+    for idx, line in enumerate(lines):
+        text = font.render(line, True, graphics.GameColors.FOREGROUND)
+        screen.blit(text, (left, top + idx * line_height))
+
+    # frame time graph, one column per frame, the budget of a frame is at the middle
+    graph = pygame.Rect(left, top + len(lines) * line_height + 5, width, graph_height)
+    budget_ms = 1000 / graphics.FPS
+    pygame.draw.rect(screen, graphics.GameColors.FOREGROUND, graph, width=1)
+    budget_y = graph.bottom - graph_height // 2
+    pygame.draw.line(screen, "red", (graph.left, budget_y), (graph.right - 1, budget_y))
+    for idx, frame_ms in enumerate(frame_times):
+        height = min(frame_ms / budget_ms * graph_height / 2, graph_height)
+        x = graph.right - len(frame_times) + idx
+        color = "red" if frame_ms > budget_ms else "green"
+        pygame.draw.line(screen, color, (x, graph.bottom - 1), (x, graph.bottom - 1 - height))
+    return background
@@ -1,49 +1,147 @@
+import itertools
+import math
+import os
 import sys
-from typing import Any, Set
+import time
+from typing import Any, Optional
 
 import pygame
 
-from settings import asteroids, graphics
+from settings import asteroids, controls, graphics, simulation
+import settings.shot as shot_settings
+from src import difficulty, game_clock, game_random, physics
+from src.asteroid_pool import AsteroidPool
 from src.asteroid_sprite import Asteroid
+from src.asteroid_store import AsteroidStore
 from src.asteroidfield import AsteroidField
+from src.broadphase import Broadphase, PairBroadphase
+from src.circleshape import CircleShape
+from src.dirty_rects import DirtyRectRenderer
+from src.entity_registry import Entity, EntityRegistry, EntityView, Kind, Tag
+from src.frame_snapshot import FrameSnapshot
+from src.frame_stats import COLUMNS, FrameStats, render_overlay
+from src.input_source import InputSource, LiveInput
 from src.player import Player
+from src.quadtree import LooseQuadtree
+from src.render_pipeline import RenderPipeline
 from src.shot import Shot
+from src.shot_store import ShotStore
+from src.spatial_hash import SpatialHash
+from src.telemetry import TelemetryWriter
 
 
 class Game:
     """Main game class for Asteroids."""
+    # whether asteroids hitting the player end the game, benchmark scenarios turn it off
+    player_can_be_hit: bool = True
 
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            headless: bool = False,
+            seed: Optional[int] = None,
+            input_source: Optional[InputSource] = None,
+            telemetry_path: Optional[str] = None,
+        ) -> None:
+        """
+        Set up pygame, the entity registry and the initial game objects.
+
+        Args:
+            headless: Run the simulation without a window, font or sound, e.g. on build servers.
+                SDL's dummy drivers are used, nothing is drawn and `run()` advances the game
+                with the fixed physics time step as fast as possible.
+            seed: Seed for everything random in the game. A random one is picked if not given.
+                The same seed and the same input always result in the same game.
+            input_source: Where the player's controls come from, e.g. a recording to replay.
+                Defaults to keyboard and mouse. The game ends when the source is finished.
+            telemetry_path: Log the frame stats of every frame to this memory-mapped ring file,
+                see `src/telemetry.py`. Nothing is logged if not given.
+        """
+        self.headless = headless
+        if headless:
+            # must be set before pygame gets initialized
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         (numpass, numfail) = pygame.init()
         print(f"Initalized with {numpass} passes and {numfail} fails")
-        self.screen = pygame.display.set_mode((graphics.SCREEN_WIDTH, graphics.SCREEN_HEIGHT))
-        pygame.display.set_caption("Asteroids")
-        self.timer_font = pygame.font.Font(graphics.TIMER_FONT, graphics.TIMER_FONT_SIZE)
+        self.timer_font: Optional[pygame.font.Font] = None
+        if headless:
+            # off-screen surface, only drawn on if somebody calls draw() explicitly
+            self.screen = pygame.Surface((graphics.SCREEN_WIDTH, graphics.SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((graphics.SCREEN_WIDTH, graphics.SCREEN_HEIGHT))
+            pygame.display.set_caption("Asteroids")
+            self.timer_font = pygame.font.Font(graphics.TIMER_FONT, graphics.TIMER_FONT_SIZE)
         self.clock = pygame.time.Clock()
+        self.last_step_dt = 0.0  # length of the last physics step, for the swept shot collisions
         self.running = True
+        self.survival_time: Optional[float] = None  # set once the game is over
+        self.frame_stats = FrameStats(simulation.FRAME_STATS_CAPACITY)
+        self.show_frame_stats = False
+        self.telemetry: Optional[TelemetryWriter] = None
+        if telemetry_path is not None:
+            self.telemetry = TelemetryWriter(telemetry_path, COLUMNS, simulation.TELEMETRY_CAPACITY)
+        self.stats_font: Optional[pygame.font.Font] = None  # created when the overlay is shown first
+        self.dirty_rects: Optional[DirtyRectRenderer] = None
+        if graphics.DIRTY_RECT_RENDERING:
+            self.dirty_rects = DirtyRectRenderer(self.screen, graphics.DIRTY_RECT_FULL_FLIP_RATIO)
+        self.render_pipeline: Optional[RenderPipeline] = None  # drawing on a thread of its own while run() is running
         self.load_assets()
+        game_clock.reset()
+        self.seed = game_random.seed(seed)
+        self.input_source: InputSource = input_source if input_source is not None else LiveInput()
+        difficulty.refresh(game_clock.game_time())
 
-        self.updatable: pygame.sprite.Group[Any] = pygame.sprite.Group()  # all the objects that can be updated
-        self.drawable: pygame.sprite.Group[Any]  = pygame.sprite.Group()  # all the objects that can be drawn
-        self.vulnerable_asteroids: pygame.sprite.Group[Any] = pygame.sprite.Group()  # vulnerable asteroids
-        self.invulnerable_asteroids: pygame.sprite.Group[Any] = pygame.sprite.Group()  # invulnerable asteroids
-        self.shots: pygame.sprite.Group[Any] = pygame.sprite.Group()  # all shots
+        # every entity of the game, with live group-like views on it
+        self.registry = EntityRegistry()
+        self.updatable: EntityView[Any] = self.registry.view(Tag.UPDATABLE)  # all the objects that can be updated
+        self.drawable: EntityView[Any] = self.registry.view(Tag.DRAWABLE)  # all the objects that can be drawn
+        self.vulnerable_asteroids: EntityView[Asteroid] = self.registry.view(Tag.VULNERABLE)  # vulnerable asteroids
+        self.invulnerable_asteroids: EntityView[Asteroid] = self.registry.view(Tag.INVULNERABLE)  # invulnerable asteroids
+        self.shots: EntityView[Shot] = self.registry.view(Kind.SHOT)  # all shots
 
-        Player.containers = (self.updatable, self.drawable)
-        Asteroid.containers = (
-            self.invulnerable_asteroids,  # start as invulnerable
-            self.updatable, self.drawable
+        # broadphase grids, rebuilt every frame in handle_collisions()
+        self.vulnerable_grid: SpatialHash[Asteroid] = SpatialHash()
+        self.invulnerable_grid: SpatialHash[Asteroid] = SpatialHash()
+        # finds the pairs of colliding asteroids, the grid does it unless another broadphase is selected
+        self.asteroid_broadphase: PairBroadphase[Asteroid] = (
+            self.vulnerable_grid if asteroids.BROADPHASE is Broadphase.GRID else asteroids.BROADPHASE.create()
         )
-        AsteroidField.containers = (self.updatable, )
-        Shot.containers = (self.updatable, self.drawable, self.shots)
+
+        Entity.registry = self.registry
+        Player.start_tags = Tag.UPDATABLE | Tag.DRAWABLE
+        # start as invulnerable, asteroids become vulnerable when their invulnerability timer fires
+        if asteroids.ARRAY_BACKED:
+            # the store updates all asteroids at once, so they don't get updated on their own
+            Asteroid.start_tags = Tag.INVULNERABLE | Tag.DRAWABLE
+        else:
+            Asteroid.start_tags = Tag.INVULNERABLE | Tag.UPDATABLE | Tag.DRAWABLE
+        AsteroidField.start_tags = Tag.UPDATABLE
+        AsteroidStore.start_tags = Tag.UPDATABLE
+        # the shot store moves and culls all shots at once
+        Shot.start_tags = Tag.DRAWABLE
+        ShotStore.start_tags = Tag.UPDATABLE
 
         self.player = Player(
             start_position=pygame.Vector2(
                 graphics.SCREEN_WIDTH / 2,
                 graphics.SCREEN_HEIGHT / 2,
-            )
+            ),
+            input_source=self.input_source,
         )
-        self.asteroid_field = AsteroidField(self.vulnerable_asteroids, self.invulnerable_asteroids)
+        self.asteroid_field = AsteroidField(self.vulnerable_asteroids, self.invulnerable_asteroids, self.frame_stats)
+        Asteroid.frame_stats = self.frame_stats
+        self.asteroid_store = AsteroidStore() if asteroids.ARRAY_BACKED else None
+        Asteroid.store = self.asteroid_store
+        self.asteroid_pool = AsteroidPool(asteroids.ASTEROID_POOL_MAX_SIZE) if asteroids.POOL_ASTEROIDS else None
+        Asteroid.pool = self.asteroid_pool
+        # all asteroids by position, for region, radius and nearest neighbour queries; asteroids spawn off-screen
+        margin = int(2 * asteroids.MAX_RADIUS)
+        self.asteroid_index: LooseQuadtree[Asteroid] = LooseQuadtree(
+            pygame.Rect(-margin, -margin, graphics.SCREEN_WIDTH + 2 * margin, graphics.SCREEN_HEIGHT + 2 * margin)
+        )
+        Asteroid.index = self.asteroid_index
+        self.shot_store = ShotStore(shot_settings.MAX_LIVE_SHOTS)
+        Shot.store = self.shot_store
 
 
     def load_assets(self) -> None:
@@ -63,6 +161,12 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == controls.TOGGLE_FRAME_STATS_KEY:
+                    self.show_frame_stats = not self.show_frame_stats
+                elif event.key == controls.DUMP_FRAME_STATS_KEY:
+                    path = time.strftime("frame_stats_%Y%m%d_%H%M%S.csv")
+                    self.frame_stats.dump(path)
+                    print(f"Wrote the timings of the last {len(self.frame_stats)} frames to {path}")
                 # TODO: handle other keys (e.g. ship controls)
 
     def handle_collisions(self) -> None:
@@ -70,47 +174,92 @@ class Game:
         Handle collisions of asteroids with the player's shots, asteroids hitting the player
         and optionally asteroids hitting each other
         """
-        # shot collision
-        asteroids_to_split: Set[Asteroid] = set()
-        shots_to_kill: Set[Shot] = set()
-        for asteroid in self.vulnerable_asteroids:
-            for shot in self.shots:
-                if asteroid.check_collision(shot):
-                    asteroids_to_split.add(asteroid)
-                    shots_to_kill.add(shot)
+        # rebuild the broadphase grid with this frame's positions
+        self.vulnerable_grid.rebuild(self.vulnerable_asteroids)
+        if asteroids.COLLISION_ENABLED and self.asteroid_broadphase is not self.vulnerable_grid:
+            self.asteroid_broadphase.rebuild(self.vulnerable_asteroids)
+
+        checks = 0  # number of check_collision() calls, for the frame stats
+        hits = 0  # checks that found a collision
+
+        # shot collision, swept along the way the shots travelled during the last step
+        # so fast shots can't skip through small asteroids
+        dt = self.last_step_dt
+        # dicts instead of sets keep the order, so splitting draws random numbers reproducibly
+        asteroids_to_split: dict[Asteroid, None] = {}
+        shots_to_kill: dict[Shot, None] = {}
+        for shot in self.shots:
+            start = shot.sweep_start(dt)
+            shot_motion = shot.position - start
+            first_hit: Optional[Asteroid] = None
+            first_time = math.inf
+            for asteroid in self.vulnerable_grid.query_segment(start, shot.position):
+                checks += 1
+                asteroid_motion = asteroid.velocity * dt
+                impact = physics.time_of_impact(
+                    start - (asteroid.position - asteroid_motion),
+                    shot_motion - asteroid_motion,
+                    shot.radius + asteroid.radius,
+                )
+                if impact is not None and impact < first_time:
+                    first_hit, first_time = asteroid, impact
+            if first_hit is not None:
+                asteroids_to_split[first_hit] = None
+                shots_to_kill[shot] = None
+        hits += len(shots_to_kill)
         for _ in shots_to_kill:
             _.kill()
         for _ in asteroids_to_split:
             _.split()
 
-        # player collision
-        all_asteroids = list(self.vulnerable_asteroids) + list(self.invulnerable_asteroids)
-        for asteroid in all_asteroids:
-            if asteroid.check_collision(self.player):
-                minutes, seconds = Game.game_time_min_sec()
-                sys.exit(f"Game over! You lasted {minutes:02}:{seconds:02}")
+        # player collision, fragments of split asteroids are invulnerable and can hit the player right away
+        self.invulnerable_grid.rebuild(self.invulnerable_asteroids)
+        nearby_asteroids = itertools.chain(
+            self.vulnerable_grid.query(self.player),
+            self.invulnerable_grid.query(self.player),
+        ) if self.player_can_be_hit else ()
+        for asteroid in nearby_asteroids:
+            checks += 1
+            if asteroid.alive() and asteroid.check_collision(self.player):
+                self.frame_stats.add_count("collision_checks", checks)
+                self.frame_stats.add_count("collision_hits", hits + 1)
+                self.game_over()
+                return
 
         # optional asteroid collision with each other
         if asteroids.COLLISION_ENABLED:
-            asteroid_list: list[Asteroid] = self.vulnerable_asteroids.sprites().copy()
-            num_asteroids = len(asteroid_list)
-            colliding_asteroids: Set[tuple[Asteroid, Asteroid]] = set()
-            for (idx1, a1) in enumerate(asteroid_list, 0):
-                if not a1.alive():
-                    continue
-                # for a2 in asteroid_list[idx1 + 1:]:
-                for idx2 in range(idx1 + 1, num_asteroids):  # index iteration for improved performance
-                    a2 = asteroid_list[idx2]
-                    if not a2.alive():
-                        continue
-                    if a1.check_collision(a2):
-                        colliding_asteroids.add((a1, a2))
-
-            for (a1, a2) in colliding_asteroids:
-                # Check if asteroids are still alive before handling collision
+            colliding_asteroids: list[tuple[Asteroid, Asteroid]] = []
+            for (a1, a2) in self.asteroid_broadphase.candidate_pairs():
+                # asteroids split by shots are still in the broadphase
                 if not (a1.alive() and a2.alive()):
-                     continue
-                asteroids.ON_COLLISION.handler(a1, a2)
+                    continue
+                checks += 1
+                if a1.check_collision(a2):
+                    colliding_asteroids.append((a1, a2))
+
+            hits += len(colliding_asteroids)
+            asteroids.ON_COLLISION.handle_pairs(colliding_asteroids)
+
+        self.frame_stats.add_count("collision_checks", checks)
+        self.frame_stats.add_count("collision_hits", hits)
+
+    def step(self, dt: float) -> None:
+        """
+        Advance the simulation by one physics step: collisions first, then the update.
+        Args:
+            dt: Length of the physics step (in seconds).
+        """
+        if self.input_source.finished:
+            self.running = False
+            return
+        if simulation.INTERPOLATE_RENDERING and not self.headless:
+            for sprite in self.drawable:
+                sprite.remember_position()
+        start = time.perf_counter()
+        self.handle_collisions()
+        self.frame_stats.add_time("collisions", time.perf_counter() - start)
+        if self.running:
+            self.update(dt)
 
     def update(self, dt: float) -> None:
         """
@@ -118,39 +267,225 @@ class Game:
         Args:
             dt: Time elapsed since last frame (in seconds).
         """
+        self.last_step_dt = dt
+        # runs the timers that are due, e.g. asteroids becoming vulnerable
+        start = time.perf_counter()
+        game_clock.advance(dt)
+        self.frame_stats.add_time("timers", time.perf_counter() - start)
+
+        difficulty.refresh(game_clock.game_time())
+        start = time.perf_counter()
         self.updatable.update(dt)
+        self.frame_stats.add_time("update", time.perf_counter() - start)
 
-        for asteroid in self.invulnerable_asteroids.copy():  # copy() to avoid iteration issues
-            if asteroid.invulnerable_timer <= 0:
-                self.invulnerable_asteroids.remove(asteroid)
-                self.vulnerable_asteroids.add(asteroid)
+        if self.asteroid_pool is not None:
+            self.asteroid_pool.recycle()
 
-    def draw(self) -> None:
-        """Draw everything to the screen."""
-        self.screen.fill(graphics.GameColors.BACKGROUND)
-        for _ in self.drawable:
-            _.draw(self.screen)
+    def draw(self, alpha: float = 1.0) -> None:
+        """Draw everything to the screen.
+        Args:
+            alpha: How far we are between the previous (0.0) and the current (1.0) physics step.
+        """
+        CircleShape.render_alpha = alpha if simulation.INTERPOLATE_RENDERING else 1.0
+        dirty_rects = self.dirty_rects
+        if dirty_rects is not None:
+            dirty_rects.begin_frame()
+        else:
+            self.screen.fill(graphics.GameColors.BACKGROUND)
+        if graphics.CACHE_ASTEROID_SURFACES:
+            # all asteroids in one batch, then everything else on top
+            blit_items = (asteroid.blit_item() for asteroid in itertools.chain(
+                self.vulnerable_asteroids, self.invulnerable_asteroids
+            ))
+            self.screen.blits([item for item in blit_items if item is not None], doreturn=False)
+            for _ in self.drawable:
+                if _.kind is not Kind.ASTEROID:
+                    _.draw(self.screen)
+        else:
+            for _ in self.drawable:
+                _.draw(self.screen)
+        if dirty_rects is not None:
+            for sprite in self.drawable:
+                dirty_rects.add(sprite.draw_rect())
 
-        minutes, seconds = Game.game_time_min_sec()
-        timer_text = self.timer_font.render(f"Time: {minutes:02}:{seconds:02}", True, (255, 255, 255))
-        self.screen.blit(timer_text, (20, 20))  # Position in top-left corner
+        if self.timer_font is not None:
+            minutes, seconds = Game.game_time_min_sec()
+            timer_text = self.timer_font.render(f"Time: {minutes:02}:{seconds:02}", True, (255, 255, 255))
+            timer_rect = self.screen.blit(timer_text, (20, 20))  # Position in top-left corner
+            if dirty_rects is not None:
+                dirty_rects.add(timer_rect)
 
-        pygame.display.flip()
+        if self.show_frame_stats:
+            if self.stats_font is None:
+                self.stats_font = pygame.font.Font(graphics.TIMER_FONT, graphics.STATS_FONT_SIZE)
+            overlay_rect = self.frame_stats.draw_overlay(
+                self.screen, self.stats_font, simulation.FRAME_STATS_AVERAGE_FRAMES, self.overlay_extra_lines()
+            )
+            if dirty_rects is not None:
+                dirty_rects.add(overlay_rect)
 
-    def run(self) -> None:
-        """Main loop: process events, update state, draw, repeat."""
+        self.present()
 
-        while self.running:
-            dt = self.clock.tick(graphics.FPS) / 1000.0  # seconds since last frame
-            self.handle_events()
-            self.handle_collisions()
-            self.update(dt)
-            self.draw()
+    def overlay_extra_lines(self) -> list[str]:
+        """Reports of the optional subsystems for the frame stats overlay."""
+        extra_lines = [self.asteroid_pool.report()] if self.asteroid_pool is not None else []
+        if self.dirty_rects is not None:
+            extra_lines.append(self.dirty_rects.report())
+        if self.render_pipeline is not None:
+            extra_lines.append(f"render thread {self.render_pipeline.draw_seconds * 1000:6.2f} ms")
+        return extra_lines
+
+    def present(self) -> None:
+        """Show what was drawn on the screen."""
+        if self.dirty_rects is not None:
+            self.dirty_rects.end_frame(update_display=not self.headless)
+        elif not self.headless:
+            pygame.display.flip()
+
+    def capture_snapshot(self, alpha: float = 1.0) -> FrameSnapshot:
+        """Copy what `draw()` would draw into a snapshot, for drawing it on the render thread.
+        Args:
+            alpha: How far we are between the previous (0.0) and the current (1.0) physics step.
+        """
+        CircleShape.render_alpha = alpha if simulation.INTERPOLATE_RENDERING else 1.0
+        overlay = None
+        if self.show_frame_stats:
+            lines = self.frame_stats.overlay_lines(simulation.FRAME_STATS_AVERAGE_FRAMES, self.overlay_extra_lines())
+            overlay = (tuple(lines), tuple(self.frame_stats.recent_frame_times()))
+        return FrameSnapshot.capture(
+            itertools.chain(self.vulnerable_asteroids, self.invulnerable_asteroids),
+            self.shots,
+            self.player,
+            game_clock.game_time(),
+            overlay,
+        )
+
+    def draw_snapshot(self, snapshot: FrameSnapshot) -> None:
+        """Draw a snapshot to the screen without presenting it, runs on the render thread."""
+        dirty_rects = self.dirty_rects
+        if dirty_rects is not None:
+            dirty_rects.begin_frame()
+        else:
+            self.screen.fill(graphics.GameColors.BACKGROUND)
+        drawn = snapshot.draw(self.screen)
+
+        if self.timer_font is not None:
+            minutes, seconds = Game.game_time_min_sec(snapshot.game_time)
+            timer_text = self.timer_font.render(f"Time: {minutes:02}:{seconds:02}", True, (255, 255, 255))
+            drawn.append(self.screen.blit(timer_text, (20, 20)))
+
+        if snapshot.overlay is not None:
+            if self.stats_font is None:
+                self.stats_font = pygame.font.Font(graphics.TIMER_FONT, graphics.STATS_FONT_SIZE)
+            drawn.append(render_overlay(self.screen, self.stats_font, *snapshot.overlay))
+
+        if dirty_rects is not None:
+            for rect in drawn:
+                dirty_rects.add(rect)
+
+    def run(self, max_frames: Optional[int] = None) -> None:
+        """Main loop: process events, update state, draw, repeat.
+
+        The physics run with a fixed time step of `1 / simulation.TICK_RATE`. The time that passed
+        since the last frame is collected and used up in as many physics steps as fit into it,
+        the remainder is carried over and used to interpolate the drawing between the last two steps.
+        A headless game skips the waiting and drawing and does exactly one physics step per frame.
+        With `simulation.PIPELINED_RENDERING`, a snapshot of every frame is drawn on a render
+        thread while the next frame is simulated, see `RenderPipeline`.
+
+        Args:
+            max_frames: Stop after this many frames. Runs until the game ends if not given.
+        """
+        if simulation.PIPELINED_RENDERING and not self.headless:
+            self.render_pipeline = RenderPipeline(self.draw_snapshot)
+        try:
+            self._run_frames(max_frames)
+        finally:
+            # a lost game exits from within a step, don't leave the render thread drawing
+            try:
+                if self.render_pipeline is not None:
+                    pipeline, self.render_pipeline = self.render_pipeline, None
+                    pipeline.close()  # passes on an error of the last drawn frame
+            finally:
+                if self.telemetry is not None:
+                    self.telemetry.close()
         pygame.quit()
 
+    def _run_frames(self, max_frames: Optional[int]) -> None:
+        step_dt = 1 / simulation.TICK_RATE
+        accumulator = 0.0
+        frames = 0
+        pipeline = self.render_pipeline
+        while self.running and (max_frames is None or frames < max_frames):
+            frames += 1
+            if self.headless:
+                frame_dt = step_dt  # no waiting for the next frame
+            else:
+                frame_dt = self.clock.tick(graphics.FPS) / 1000.0  # seconds since last frame
+            frame_start = time.perf_counter()
+            self.handle_events()
+            self.frame_stats.add_time("events", time.perf_counter() - frame_start)
+
+            if self.headless:
+                self.step(step_dt)
+            else:
+                accumulator += frame_dt
+                steps = 0
+                while accumulator >= step_dt and self.running:
+                    if steps == simulation.MAX_CATCH_UP_STEPS:
+                        # we can't keep up, drop the time instead of falling further behind
+                        accumulator %= step_dt
+                        break
+                    self.step(step_dt)
+                    accumulator -= step_dt
+                    steps += 1
+                if self.running:
+                    start = time.perf_counter()
+                    if pipeline is None:
+                        self.draw(accumulator / step_dt)
+                    else:
+                        # the last frame was drawn while this one was simulated, only waiting for it is counted
+                        pipeline.wait()
+                        self.present()
+                        pipeline.submit(self.capture_snapshot(accumulator / step_dt))
+                    self.frame_stats.add_time("draw", time.perf_counter() - start)
+            self.end_frame(frame_start, frame_dt)
+
+    def end_frame(self, frame_start: float, dt: float) -> None:
+        """Record the entity counts and the total time of the frame in the frame stats, and log them if enabled."""
+        row = self.frame_stats.end_frame(
+            time.perf_counter() - frame_start,
+            dt,
+            {
+                "updatable": len(self.updatable),
+                "drawable": len(self.drawable),
+                "vulnerable": len(self.vulnerable_asteroids),
+                "invulnerable": len(self.invulnerable_asteroids),
+                "shots": len(self.shots),
+                "timers_pending": game_clock.pending_timers(),
+            },
+        )
+        if self.telemetry is not None:
+            self.telemetry.write(row.tolist())
+
+    def game_over(self) -> None:
+        """End the game after the player got hit.
+        A headless game just stops running so the caller can look at `survival_time`.
+        """
+        self.survival_time = game_clock.game_time()
+        self.running = False
+        if self.asteroid_pool is not None:
+            print(self.asteroid_pool.report())
+        minutes, seconds = Game.game_time_min_sec()
+        message = f"Game over! You lasted {minutes:02}:{seconds:02}"
+        if not self.headless:
+            sys.exit(message)
+        print(message)
+
     @staticmethod
-    def game_time_min_sec() -> tuple[int, int]:
-        game_time = pygame.time.get_ticks() / 1000
+    def game_time_min_sec(game_time: Optional[float] = None) -> tuple[int, int]:
+        if game_time is None:
+            game_time = game_clock.game_time()
         minutes = int(game_time) // 60
         seconds = int(game_time) % 60
         return minutes, seconds
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""Simulated game time.
+
+Everything that scales with how long the game has been running (spawn rate, asteroid speed, the timer)
+reads the time from here instead of from `pygame.time.get_ticks()`. The game advances it by the
+simulated time step, so a headless game running faster than real time still sees consistent game time.
+
+Timed state changes (invulnerability ending, cooldowns, shot lifetimes) are scheduled here as well
+instead of every entity counting down its own timer each frame. The timers run on a timer wheel
+with one tick per physics step, see `settings.simulation.TICK_RATE`.
+"""
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+import settings.simulation as simulation
+from src.timer_wheel import Timer, TimerWheel
+
+# game time drifts a little from whole ticks while adding up the time steps
+_TICK_TOLERANCE = 1e-6
+
+_game_time = 0.0
+_timers = TimerWheel()
+
+
+def game_time() -> float:
+    """Get the simulated game time in seconds."""
+    return _game_time
+
+
+def advance(dt: float) -> None:
+    """Advance the simulated game time and run the timers that are due.
+
+    Args:
+        dt (float): Elapsed time in seconds.
+    """
+    global _game_time
+    _game_time += dt
+    _timers.advance_to(math.floor(_game_time * simulation.TICK_RATE + _TICK_TOLERANCE))
+
+
+def reset() -> None:
+    """Start counting the game time from zero again and drop all timers, e.g. for a new game."""
+    global _game_time
+    _game_time = 0.0
+    _timers.clear()
+
+
+def schedule(delay: float, callback: Callable[[], None]) -> Timer:
+    """Call a callback once the game time has advanced by `delay` seconds, during `advance()`.
+
+    Returns:
+        Timer: Cancel it if the callback must not run anymore, e.g. because its entity got killed.
+    """
+    due = math.ceil((_game_time + delay) * simulation.TICK_RATE - _TICK_TOLERANCE)
+    return _timers.schedule(due, callback)
+
+
+def pending_timers() -> int:
+    """Get the number of scheduled timers that haven't run or been cancelled yet."""
+    return len(_timers)
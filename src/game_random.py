@@ -0,0 +1,33 @@
+"""Random numbers of the simulation.
+
+Everything random in the game (spawn positions, split angles, colors) draws from `rng` instead of
+the global `random` module. The game seeds it on start, so a session can be reproduced from its
+seed and its input, see `src/input_source.py`.
+"""
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+rng = random.Random()
+_seed = 0
+
+
+def seed(value: Optional[int] = None) -> int:
+    """Seed the game's random number generator.
+
+    Args:
+        value (Optional[int]): The seed, a random one is picked if not given.
+
+    Returns:
+        int: The seed that was used.
+    """
+    global _seed
+    _seed = random.getrandbits(63) if value is None else value
+    rng.seed(_seed)
+    return _seed
+
+
+def current_seed() -> int:
+    """Get the seed the generator was last seeded with."""
+    return _seed
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple, Protocol
+
+import pygame
+
+if TYPE_CHECKING:
+    from settings.controls import KeyMapping
+
+# The player's actions, named like the fields of `KeyMapping`. Bit n of an action mask is ACTIONS[n].
+ACTIONS = ("shoot", "forward", "backward", "turn_left", "turn_right", "strafe_left", "strafe_right")
+
+# Recordings start with a header (magic, format version, RNG seed, tick rate, whether the game was lost),
+# followed by one record per physics tick (action mask, mouse x, mouse y).
+MAGIC = b"ASTR"
+VERSION = 2
+HEADER = struct.Struct("<4sHqH?")
+TICK = struct.Struct("<Bhh")
+
+
+class InputState(NamedTuple):
+    """The input of the player during one physics tick."""
+    actions: int  # bit mask over ACTIONS
+    mouse_position: tuple[int, int]
+
+
+NO_INPUT = InputState(0, (0, 0))
+
+
+def action_mask(mapping: KeyMapping, keys_pressed: pygame.key.ScancodeWrapper) -> int:
+    """Get the actions whose keys are pressed as a bit mask over ACTIONS."""
+    mask = 0
+    for bit, action in enumerate(ACTIONS):
+        key = getattr(mapping, action)
+        if key and keys_pressed[key]:
+            mask |= 1 << bit
+    return mask
+
+
+class ActionKeys:
+    """Answers `keys_pressed[key]` like `pygame.key.get_pressed()`, but from an action mask.
+    Keys that aren't mapped to an action are never pressed.
+
+    Args:
+        mapping (KeyMapping): The keys of the active control scheme.
+        actions (int): Bit mask over ACTIONS.
+    """
+
+    def __init__(self, mapping: KeyMapping, actions: int) -> None:
+        self.pressed = {
+            getattr(mapping, action) for bit, action in enumerate(ACTIONS)
+            if actions & (1 << bit)
+        }
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class InputSource(Protocol):
+    """Where the player's input comes from. Polled once per physics tick."""
+
+    @property
+    def finished(self) -> bool:
+        """Whether there is no more input, which ends the game."""
+        ...
+
+    def poll(self, mapping: KeyMapping) -> InputState:
+        """Get the input for the next physics tick.
+
+        Args:
+            mapping (KeyMapping): The keys of the active control scheme.
+        """
+        ...
+
+
+class LiveInput:
+    """Input from the keyboard and the mouse."""
+    finished = False
+
+    def poll(self, mapping: KeyMapping) -> InputState:
+        return InputState(action_mask(mapping, pygame.key.get_pressed()), pygame.mouse.get_pos())
+
+
+class InputRecorder:
+    """Passes the input of another source on and writes every tick to a binary recording.
+
+    Args:
+        source (InputSource): Where the input comes from.
+        path (str): File to write the recording to.
+        seed (int): Seed of the game's random number generator, see `src.game_random`.
+        tick_rate (int): Physics ticks per second of the recorded game.
+    """
+
+    def __init__(self, source: InputSource, path: str, seed: int, tick_rate: int) -> None:
+        self.source = source
+        self.path = path
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.ticks = 0
+        self.file: BinaryIO = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, tick_rate, False))
+
+    @property
+    def finished(self) -> bool:
+        return self.source.finished
+
+    def poll(self, mapping: KeyMapping) -> InputState:
+        state = self.source.poll(mapping)
+        x, y = state.mouse_position
+        self.file.write(TICK.pack(state.actions, _clamp_short(x), _clamp_short(y)))
+        self.ticks += 1
+        return state
+
+    def close(self, lost: bool = False) -> None:
+        """Finish the recording. A lost game ran the collisions of one more step without polling the input."""
+        if lost:
+            self.file.seek(0)
+            self.file.write(HEADER.pack(MAGIC, VERSION, self.seed, self.tick_rate, True))
+        self.file.close()
+
+
+class ReplayInput:
+    """Plays the input of a recording back, tick by tick.
+
+    Args:
+        seed (int): Seed of the game's random number generator during the recording.
+        tick_rate (int): Physics ticks per second of the recorded game.
+        states (list[InputState]): The input of every recorded tick.
+        lost (bool): Whether the recorded game was lost. It ended in the collisions of the step after
+            the last tick, so the replay only finishes once that step had its chance to lose it as well.
+    """
+
+    def __init__(self, seed: int, tick_rate: int, states: list[InputState], lost: bool = False) -> None:
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.states = states
+        self.lost = lost
+        self.position = 0  # index of the next tick
+        self.overrun = False  # polled after the last tick
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    @classmethod
+    def load(cls, path: str) -> ReplayInput:
+        """Read a recording written by `InputRecorder`."""
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is too short to be an input recording.")
+        magic, version, seed, tick_rate, lost = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an input recording of version {VERSION}.")
+        body = memoryview(data)[HEADER.size:]
+        usable = len(body) - len(body) % TICK.size  # ignore a tick cut off by a crash
+        states = [
+            InputState(actions, (x, y))
+            for actions, x, y in TICK.iter_unpack(body[:usable])
+        ]
+        return cls(seed, tick_rate, states, lost)
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.states) and (self.overrun or not self.lost)
+
+    def poll(self, mapping: KeyMapping) -> InputState:
+        if self.position >= len(self.states):
+            self.overrun = True
+            return NO_INPUT
+        state = self.states[self.position]
+        self.position += 1
+        return state
+
+
+def _clamp_short(value: int) -> int:
+    return max(-32768, min(32767, value))
@@ -1,9 +1,15 @@
 # In physics.py
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Optional, Sequence
+
+import numpy as np
+import pygame
 
 if TYPE_CHECKING:
     from src.asteroid_sprite import Asteroid
 
+MIN_DISTANCE_SQ = 1e-6  # Below this squared distance the collision normal is undefined and bouncing is skipped
+
 
 def bounce_asteroids(asteroid1: "Asteroid", asteroid2: "Asteroid") -> None:
     """Change the trajectory (velocity vector) of two asteroids so that they bounce away from each other.
@@ -17,7 +23,7 @@ def bounce_asteroids(asteroid1: "Asteroid", asteroid2: "Asteroid") -> None:
     direction = asteroid2.position - asteroid1.position
     distance_sq = direction.length_squared()
 
-    if distance_sq < 1e-6:
+    if distance_sq < MIN_DISTANCE_SQ:
         print("Warning: Asteroids at almost identical position during bounce calculation. Skipping bounce.")
         # If they are too close, it might mean they spawned on top of each other,
         # or a previous bounce wasn't fully resolved. Skipping bounce avoids errors.
@@ -60,3 +66,160 @@ def bounce_asteroids(asteroid1: "Asteroid", asteroid2: "Asteroid") -> None:
     # Combine to get Final New Velocities
     asteroid1.velocity = new_v1_dot * normal + v1_perp
     asteroid2.velocity = new_v2_dot * normal + v2_perp
+
+
+def time_of_impact(offset: pygame.Vector2, motion: pygame.Vector2, radius_sum: float) -> Optional[float]:
+    """Sweep one circle against another and find the earliest time they touch.
+
+    Both circles move in a straight line during the step, so only their relative movement matters.
+
+    Args:
+        offset (pygame.Vector2): Center of the first circle minus the center of the second at the start of the step.
+        motion (pygame.Vector2): Movement of the first circle minus the movement of the second during the step.
+        radius_sum (float): Sum of both radii.
+
+    Returns:
+        Optional[float]: Fraction of the step (0.0 to 1.0) at which the circles touch first,
+            0.0 if they already overlap at the start, None if they don't touch during the step.
+    """
+    # solve |offset + motion * t| = radius_sum for the smaller t
+    c = offset.length_squared() - radius_sum * radius_sum
+    if c <= 0:
+        return 0.0
+    a = motion.length_squared()
+    b = offset.dot(motion)  # half of the usual b, the factors of 2 cancel out
+    if a == 0 or b >= 0:  # not moving relative to each other or moving apart
+        return None
+    discriminant = b * b - a * c
+    if discriminant < 0:  # passing each other
+        return None
+    t = (-b - math.sqrt(discriminant)) / a
+    return t if t <= 1.0 else None
+
+
+def _independent_rounds(pairs: np.ndarray) -> np.ndarray:
+    """Assign every pair to a round so that no index appears twice within a round.
+
+    A pair always lands in a later round than every earlier pair it shares an index with,
+    so resolving the rounds one after another gives the same result as resolving the pairs in order.
+
+    Args:
+        pairs (np.ndarray): `(n, 2)` array of index pairs.
+
+    Returns:
+        np.ndarray: The round of every pair.
+    """
+    rounds = np.empty(len(pairs), dtype=np.intp)
+    last_round: dict[int, int] = {}
+    for pair_idx, (idx1, idx2) in enumerate(pairs.tolist()):
+        pair_round = max(last_round.get(idx1, -1), last_round.get(idx2, -1)) + 1
+        rounds[pair_idx] = pair_round
+        last_round[idx1] = last_round[idx2] = pair_round
+    return rounds
+
+
+def bounce_asteroids_batch(
+        pairs: np.ndarray,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        radii: np.ndarray,
+    ) -> np.ndarray:
+    """Bounce many pairs of asteroids at once, see `bounce_asteroids()` for the physics.
+    Pairs are resolved as if `bounce_asteroids()` was called for each of them in order,
+    so an asteroid taking part in several collisions sees the result of the earlier ones.
+
+    Args:
+        pairs (np.ndarray): `(n, 2)` array of indices into the other arrays.
+        positions (np.ndarray): `(m, 2)` array of positions.
+        velocities (np.ndarray): `(m, 2)` array of velocities, changed in place.
+        radii (np.ndarray): `(m,)` array of radii, used as the masses.
+
+    Returns:
+        np.ndarray: Boolean mask of the pairs that actually bounced.
+    """
+    pairs = np.asarray(pairs, dtype=np.intp).reshape(-1, 2)
+    bounced = np.zeros(len(pairs), dtype=bool)
+    if len(pairs) == 0:
+        return bounced
+
+    rounds = _independent_rounds(pairs)
+    for pair_round in range(int(rounds.max()) + 1):
+        in_round = np.flatnonzero(rounds == pair_round)
+        idx1, idx2 = pairs[in_round, 0], pairs[in_round, 1]
+
+        # Calculate collision normals (direction from asteroid1 to asteroid2)
+        direction = positions[idx2] - positions[idx1]
+        distance_sq = np.einsum("ij,ij->i", direction, direction)
+        m1, m2 = radii[idx1], radii[idx2]
+        total_mass = m1 + m2
+        # Skip asteroids at almost identical positions and massless ones
+        valid = (distance_sq >= MIN_DISTANCE_SQ) & (total_mass != 0)
+        normal = np.divide(
+            direction, np.sqrt(distance_sq)[:, np.newaxis],
+            out=np.zeros_like(direction), where=valid[:, np.newaxis],
+        )
+
+        v1, v2 = velocities[idx1], velocities[idx2]
+        v1_dot = np.einsum("ij,ij->i", v1, normal)
+        v2_dot = np.einsum("ij,ij->i", v2, normal)
+
+        # Only bounce if they are approaching each other
+        v_rel_normal_mag = np.einsum("ij,ij->i", v1 - v2, normal)
+        approaching = valid & (v_rel_normal_mag >= 0)
+        if not approaching.any():
+            continue
+        idx1, idx2 = idx1[approaching], idx2[approaching]
+        v1, v2, normal = v1[approaching], v2[approaching], normal[approaching]
+        v1_dot, v2_dot = v1_dot[approaching], v2_dot[approaching]
+        m1, m2, total_mass = m1[approaching], m2[approaching], total_mass[approaching]
+
+        # Elastic collision with unequal masses, perpendicular components remain unchanged
+        new_v1_dot = ((m1 - m2) / total_mass) * v1_dot + (2 * m2 / total_mass) * v2_dot
+        new_v2_dot = ((m2 - m1) / total_mass) * v2_dot + (2 * m1 / total_mass) * v1_dot
+        v1_perp = v1 - v1_dot[:, np.newaxis] * normal
+        v2_perp = v2 - v2_dot[:, np.newaxis] * normal
+        velocities[idx1] = new_v1_dot[:, np.newaxis] * normal + v1_perp
+        velocities[idx2] = new_v2_dot[:, np.newaxis] * normal + v2_perp
+        bounced[in_round[approaching]] = True
+
+    return bounced
+
+
+def bounce_asteroid_pairs(pairs: Sequence[tuple["Asteroid", "Asteroid"]]) -> int:
+    """Bounce pairs of colliding asteroids with one call to `bounce_asteroids_batch()`.
+    Asteroids attached to the same `AsteroidStore` are bounced directly in the store's arrays.
+
+    Args:
+        pairs (Sequence[tuple[Asteroid, Asteroid]]): The colliding asteroids, resolved in order.
+
+    Returns:
+        int: Number of pairs that bounced.
+    """
+    if not pairs:
+        return 0
+
+    store = pairs[0][0]._store
+    if store is not None and all(a1._store is store and a2._store is store for a1, a2 in pairs):
+        slot_pairs = np.array([(a1._slot, a2._slot) for a1, a2 in pairs], dtype=np.intp)
+        bounced = bounce_asteroids_batch(
+            slot_pairs, store.positions, store.velocities, store.fields["radius"]
+        )
+        return int(bounced.sum())
+
+    # gather the state of every asteroid once
+    index_of: dict["Asteroid", int] = {}
+    for pair in pairs:
+        for asteroid in pair:
+            index_of.setdefault(asteroid, len(index_of))
+    involved = list(index_of)
+    positions = np.array([(a.position.x, a.position.y) for a in involved], dtype=float)
+    velocities = np.array([(a.velocity.x, a.velocity.y) for a in involved], dtype=float)
+    radii = np.array([a.radius for a in involved], dtype=float)
+    index_pairs = np.array([(index_of[a1], index_of[a2]) for a1, a2 in pairs], dtype=np.intp)
+
+    bounced = bounce_asteroids_batch(index_pairs, positions, velocities, radii)
+
+    # write back the velocities of the asteroids that bounced
+    for idx in np.unique(index_pairs[bounced]).tolist():
+        involved[idx].velocity = pygame.Vector2(*velocities[idx])
+    return int(bounced.sum())
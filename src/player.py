@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Optional, Protocol
 
 import pygame
 
@@ -6,7 +6,10 @@ import settings.controls as controls_settings
 import settings.graphics as graphics_settings
 import settings.player as player_settings
 import settings.shot as shot_settings
+from src import game_clock
 from src.circleshape import CircleShape
+from src.entity_registry import Kind
+from src.input_source import ActionKeys, InputSource, LiveInput
 from src.shot import Shot
 
 
@@ -22,27 +25,41 @@ class Player(CircleShape):
     
     Inherits from CircleShape for collision detection purposes. We also keep a rectangle up to date to use pycharm functionality.
     """
-    def __init__(self, start_position: pygame.Vector2) -> None:
+    kind = Kind.PLAYER
+
+    def __init__(self, start_position: pygame.Vector2, input_source: Optional[InputSource] = None) -> None:
+        """Create the player's ship.
+
+        Args:
+            start_position (pygame.Vector2): Where the ship starts.
+            input_source (Optional[InputSource]): Where the controls come from. Defaults to keyboard and mouse.
+        """
         super().__init__(start_position, player_settings.RADIUS)
+        self.input_source: InputSource = input_source if input_source is not None else LiveInput()
         self.rotation: float = 0.0  # current rotation in degrees. down is 0
-        self.shot_timer: float = 0.0
+        self.gun_ready = True  # false while the gun cools down after a shot
 
-    def triangle(self) -> tuple[pygame.Vector2, pygame.Vector2, pygame.Vector2]:
+    def triangle(self, center: Optional[pygame.Vector2] = None) -> tuple[pygame.Vector2, pygame.Vector2, pygame.Vector2]:
         """Calculate the vertices of the triangle representing the player.
 
         Creates a triangle pointing in the player's current rotation direction.
         The triangle consists of a forward point and two rear points forming
         the classic "ship" shape.
 
+        Args:
+            center (Optional[pygame.Vector2]): Where to put the triangle. Defaults to our position.
+
         Returns:
             tuple[pygame.Vector2, pygame.Vector2, pygame.Vector2]: The three vertices
                 of the triangle (forward point, rear-left, rear-right).
         """
+        if center is None:
+            center = self.position
         forward = pygame.Vector2(0, 1).rotate(self.rotation)
         right = pygame.Vector2(0, 1).rotate(self.rotation + 90) * self.radius / 1.5
-        a = self.position + forward * self.radius
-        b = self.position - forward * self.radius - right
-        c = self.position - forward * self.radius + right
+        a = center + forward * self.radius
+        b = center - forward * self.radius - right
+        c = center - forward * self.radius + right
         return (a, b, c)
 
     def draw(self, screen: pygame.Surface) -> None:
@@ -54,19 +71,32 @@ class Player(CircleShape):
         Args:
             screen (pygame.Surface): The pygame surface to draw on.
         """
+        points = self.triangle(self.draw_position)
+
         pygame.draw.polygon(
             surface=screen,
             color=graphics_settings.GameColors.PLAYER_FILL,
-            points=self.triangle(),
+            points=points,
         )
 
         pygame.draw.polygon(
             surface=screen,
             color=graphics_settings.GameColors.PLAYER_BORDER,
-            points=self.triangle(),
+            points=points,
             width=graphics_settings.BorderWidths.PLAYER,
         )
 
+    def draw_rect(self) -> pygame.Rect:
+        """The bounding box of the drawn triangle including its outline."""
+        xs, ys = zip(*self.triangle(self.draw_position))
+        outline = graphics_settings.BorderWidths.PLAYER + 2
+        return pygame.Rect(
+            int(min(xs)) - outline,
+            int(min(ys)) - outline,
+            int(max(xs) - min(xs)) + 2 * outline + 1,
+            int(max(ys) - min(ys)) + 2 * outline + 1,
+        )
+
     def rotate(self, dt: float) -> None:
         """Rotate the player at the configured turn speed.
         
@@ -101,14 +131,9 @@ class Player(CircleShape):
 
     def update(self, dt: float) -> None:
         """Update player state based on active control scheme and input depending on passed time."""
-        keys = pygame.key.get_pressed()
-        mouse_pos = pygame.mouse.get_pos()
-
-        controls_settings.ACTIVE_CONTROL_SCHEME.handle_input(
-            self, keys, mouse_pos, dt  # type: ignore[arg-type]
-        )
-
-        self.shot_timer -= dt
+        scheme = controls_settings.ACTIVE_CONTROL_SCHEME
+        state = self.input_source.poll(scheme.keys)
+        scheme.handle_input(self, ActionKeys(scheme.keys, state.actions), state.mouse_position, dt)
 
     def shoot(self) -> None:
         """Attempt to fire a shot from the player's position.
@@ -120,7 +145,7 @@ class Player(CircleShape):
         Does nothing if the gun is still on cooldown from the previous shot.
         """
         # guard check against the gun being on cooldown
-        if self.shot_timer > 0:
+        if not self.gun_ready:
             return
 
         # Calculate spawn position at the tip of the player
@@ -133,4 +158,9 @@ class Player(CircleShape):
         shot.velocity = forward * shot_settings.SPEED
 
         # put the gun on cooldown
-        self.shot_timer = player_settings.SHOOT_COOLDOWN_SECOND
+        self.gun_ready = False
+        game_clock.schedule(player_settings.SHOOT_COOLDOWN_SECOND, self.reload)
+
+    def reload(self) -> None:
+        """Make the gun ready again, scheduled when it fires."""
+        self.gun_ready = True
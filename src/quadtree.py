@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from typing import TYPE_CHECKING, Any, Generic, Iterator, Optional, TypeVar
+
+import numpy as np
+import pygame
+
+if TYPE_CHECKING:
+    from src.circleshape import CircleShape
+    from src.entity_store import EntityStore
+
+ShapeT = TypeVar("ShapeT", bound="CircleShape")
+
+DEFAULT_MAX_DEPTH = 6
+
+
+class _Node:
+    """A square of the tree. Its loose bounds are twice as large and centered on the same point."""
+
+    def __init__(self, x: float, y: float, size: float, parent: Optional[_Node]) -> None:
+        self.x, self.y, self.size = x, y, size  # tight bounds: top left corner and edge length
+        self.parent = parent
+        self.children: list[Optional[_Node]] = [None, None, None, None]
+        self.items: list[Any] = []
+        self.count = 0  # items in this node and all of its descendants, empty subtrees are skipped
+
+    def child(self, index: int) -> _Node:
+        """Get a child square, created on first use. Index bit 0 is the right half, bit 1 the bottom half."""
+        child = self.children[index]
+        if child is None:
+            half = self.size / 2
+            child = _Node(self.x + half * (index & 1), self.y + half * (index >> 1), half, self)
+            self.children[index] = child
+        return child
+
+    def loose_distance_squared(self, x: float, y: float) -> float:
+        """Squared distance from a point to the loose bounds, 0 if it is inside."""
+        margin = self.size / 2
+        dx = max(self.x - margin - x, 0.0, x - (self.x + self.size + margin))
+        dy = max(self.y - margin - y, 0.0, y - (self.y + self.size + margin))
+        return dx * dx + dy * dy
+
+    def loose_overlaps(self, left: float, top: float, right: float, bottom: float) -> bool:
+        margin = self.size / 2
+        return (
+            left <= self.x + self.size + margin and right >= self.x - margin
+            and top <= self.y + self.size + margin and bottom >= self.y - margin
+        )
+
+
+class _Entry:
+    """Where a shape is filed: its indexed position and radius, and its node and cell.
+    Shapes attached to an entity store get moved by the store, their position is read from there.
+    """
+
+    def __init__(self, shape: CircleShape, x: float, y: float, radius: float, depth: int) -> None:
+        self.shape = shape
+        self._x, self._y, self.radius = x, y, radius
+        self.depth = depth
+        self.cell: Optional[tuple[int, int]] = None  # None if outside of the tree's bounds
+        self.node: Optional[_Node] = None
+
+    @property
+    def x(self) -> float:
+        shape = self.shape
+        if shape._store is not None:
+            return float(shape._store.positions[shape._slot, 0])
+        return self._x
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._x = value
+
+    @property
+    def y(self) -> float:
+        shape = self.shape
+        if shape._store is not None:
+            return float(shape._store.positions[shape._slot, 1])
+        return self._y
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._y = value
+
+
+class LooseQuadtree(Generic[ShapeT]):
+    """A loose quadtree over circle shapes for region, radius and nearest neighbour queries.
+
+    The loose bounds of a node are twice the size of its square, so a shape always fits
+    into the node of the deepest level whose squares are at least as large as its diameter,
+    wherever its center lies in that square. The level only depends on the radius and the
+    square only on the center, so shapes are filed without walking down the tree, and a
+    shape that moves stays in its node until its center crosses into another square.
+
+    Indexed shapes keep the tree in sync when their position gets set, see `CircleShape.position`.
+    Shapes attached to an entity store are moved in batches, the store refiles them with `sync_store()`.
+    Shapes outside of the bounds are kept in a list that every query checks.
+
+    Args:
+        bounds (pygame.Rect): The region to cover, e.g. the screen plus a margin for spawning shapes.
+        max_depth (int): Levels below the root, the smallest squares are `2**max_depth` times smaller.
+    """
+
+    def __init__(self, bounds: pygame.Rect, max_depth: int = DEFAULT_MAX_DEPTH) -> None:
+        self.root = _Node(bounds.left, bounds.top, max(bounds.width, bounds.height), None)
+        self.max_depth = max_depth
+        self.entries: dict[ShapeT, _Entry] = {}
+        self.outside: list[ShapeT] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, shape: object) -> bool:
+        return shape in self.entries
+
+    def depth_for(self, radius: float) -> int:
+        """The deepest level whose squares are at least as large as the diameter."""
+        if radius <= 0:
+            return self.max_depth
+        depth = max(0, min(self.max_depth, int(math.log2(self.root.size / (2 * radius)))))
+        if depth and self.root.size / (1 << depth) < 2 * radius:  # rounding of the logarithm
+            depth -= 1
+        return depth
+
+    def _cell(self, x: float, y: float, depth: int) -> Optional[tuple[int, int]]:
+        root = self.root
+        cells = 1 << depth
+        size = root.size / cells
+        cell_x, cell_y = math.floor((x - root.x) / size), math.floor((y - root.y) / size)
+        if 0 <= cell_x < cells and 0 <= cell_y < cells:
+            return cell_x, cell_y
+        return None
+
+    def _file(self, shape: ShapeT, entry: _Entry) -> None:
+        """Put a shape into the node of its entry's cell, or into the outside list."""
+        if entry.cell is None:
+            entry.node = None
+            self.outside.append(shape)
+            return
+        cell_x, cell_y = entry.cell
+        node = self.root
+        node.count += 1
+        for level in range(entry.depth - 1, -1, -1):
+            node = node.child(((cell_x >> level) & 1) | (((cell_y >> level) & 1) << 1))
+            node.count += 1
+        node.items.append(shape)
+        entry.node = node
+        self.store_cell(shape, entry)
+
+    def store_cell(self, shape: ShapeT, entry: Optional[_Entry] = None) -> None:
+        """Write the level and the cell of a shape attached to an entity store into the store's arrays, see `sync_store()`."""
+        store = shape._store
+        if store is None:
+            return
+        if store.index is None:
+            store.index = self
+        elif store.index is not self:
+            raise ValueError(f"The shapes of {store!r} are already indexed in another quadtree.")
+        if entry is None:
+            entry = self.entries[shape]
+        store.index_depths[shape._slot] = entry.depth
+        store.index_cells[shape._slot] = -1 if entry.cell is None else (entry.cell[1] << entry.depth) | entry.cell[0]
+
+    def _unfile(self, shape: ShapeT, entry: _Entry) -> None:
+        node = entry.node
+        if node is None:
+            self.outside.remove(shape)
+            return
+        node.items.remove(shape)
+        while node is not None:
+            node.count -= 1
+            node = node.parent
+
+    def insert(self, shape: ShapeT) -> None:
+        """Add a shape at its current position, from now on it keeps the tree up to date when it moves."""
+        if shape in self.entries:
+            raise ValueError(f"{shape!r} is already in the quadtree.")
+        position, radius = shape.position, shape.radius
+        entry = _Entry(shape, position.x, position.y, radius, self.depth_for(radius))
+        entry.cell = self._cell(position.x, position.y, entry.depth)
+        self.entries[shape] = entry
+        self._file(shape, entry)
+        shape._index = self
+
+    def remove(self, shape: ShapeT) -> None:
+        """Take a shape out of the tree."""
+        entry = self.entries.pop(shape)
+        self._unfile(shape, entry)
+        shape._index = None
+        if shape._store is not None:
+            shape._store.index_depths[shape._slot] = -1
+
+    def move(self, shape: ShapeT, x: Optional[float] = None, y: Optional[float] = None) -> None:
+        """Update the position of a shape, its current position unless given.
+        Only shapes whose center crossed into another square change their node.
+        """
+        if x is None or y is None:
+            position = shape.position
+            x, y = position.x, position.y
+        entry = self.entries[shape]
+        entry.x, entry.y = x, y
+        cell = self._cell(x, y, entry.depth)
+        if cell != entry.cell:
+            self._unfile(shape, entry)
+            entry.cell = cell
+            self._file(shape, entry)
+
+    def sync_store(self, store: EntityStore[Any]) -> None:
+        """Refile the shapes of an entity store whose center the store moved into another square.
+
+        The cells of all attached shapes are computed at once from the store's arrays and compared
+        to the cells they are filed in, only the shapes that crossed into another square get refiled.
+        """
+        count = store.count
+        depths = store.index_depths[:count]
+        levels = np.maximum(depths, 0)
+        sides = np.left_shift(1, levels)
+        sizes = self.root.size / sides
+        positions = store.positions[:count]
+        cell_x = np.floor((positions[:, 0] - self.root.x) / sizes)
+        cell_y = np.floor((positions[:, 1] - self.root.y) / sizes)
+        inside = (cell_x >= 0) & (cell_x < sides) & (cell_y >= 0) & (cell_y < sides)
+        cells = np.where(inside, cell_y * sides + cell_x, -1).astype(np.int64)
+        changed = np.flatnonzero((depths >= 0) & (cells != store.index_cells[:count]))
+
+        handles = store.handles
+        for slot, cell in zip(changed.tolist(), cells[changed].tolist()):
+            shape = handles[slot]
+            entry = self.entries[shape]
+            self._unfile(shape, entry)
+            entry.cell = None if cell < 0 else (cell & ((1 << entry.depth) - 1), cell >> entry.depth)
+            self._file(shape, entry)
+
+    def _nodes(self, left: float, top: float, right: float, bottom: float) -> Iterator[_Node]:
+        """Yield the non-empty nodes whose loose bounds overlap a box."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.count == 0 or (node is not self.root and not node.loose_overlaps(left, top, right, bottom)):
+                continue
+            yield node
+            stack.extend(child for child in node.children if child is not None)
+
+    def _candidates(self, left: float, top: float, right: float, bottom: float) -> Iterator[ShapeT]:
+        yield from self.outside
+        for node in self._nodes(left, top, right, bottom):
+            yield from node.items
+
+    def query_circle(self, center: pygame.Vector2, radius: float) -> list[ShapeT]:
+        """Get every shape that overlaps or touches a circle."""
+        x, y = center.x, center.y
+        found: list[ShapeT] = []
+        for shape in self._candidates(x - radius, y - radius, x + radius, y + radius):
+            entry = self.entries[shape]
+            reach = radius + entry.radius
+            if (entry.x - x) ** 2 + (entry.y - y) ** 2 <= reach * reach:
+                found.append(shape)
+        return found
+
+    def query_rect(self, rect: pygame.Rect) -> list[ShapeT]:
+        """Get every shape that overlaps or touches a rectangle."""
+        found: list[ShapeT] = []
+        for shape in self._candidates(rect.left, rect.top, rect.right, rect.bottom):
+            entry = self.entries[shape]
+            # distance from the center to the closest point of the rectangle
+            dx = entry.x - max(rect.left, min(entry.x, rect.right))
+            dy = entry.y - max(rect.top, min(entry.y, rect.bottom))
+            if dx * dx + dy * dy <= entry.radius * entry.radius:
+                found.append(shape)
+        return found
+
+    def nearest(self, point: pygame.Vector2, k: int = 1) -> list[ShapeT]:
+        """Get the k shapes whose borders are closest to a point, closest first.
+        Shapes the point lies in are at distance 0, ties keep the order in which they were found.
+        """
+        x, y = point.x, point.y
+        counter = itertools.count()  # tie breaker, the heap never compares nodes or shapes
+        heap: list[tuple[float, int, bool, Any]] = []
+
+        def push_shape(shape: ShapeT) -> None:
+            entry = self.entries[shape]
+            distance = max(math.hypot(entry.x - x, entry.y - y) - entry.radius, 0.0)
+            heapq.heappush(heap, (distance, next(counter), True, shape))
+
+        for shape in self.outside:
+            push_shape(shape)
+        if self.root.count:
+            heapq.heappush(heap, (0.0, next(counter), False, self.root))
+
+        found: list[ShapeT] = []
+        while heap and len(found) < k:
+            _, _, is_shape, item = heapq.heappop(heap)
+            if is_shape:
+                found.append(item)
+                continue
+            # shapes lie within the loose bounds of their node, so its distance is a lower bound for theirs
+            for shape in item.items:
+                push_shape(shape)
+            for child in item.children:
+                if child is not None and child.count:
+                    heapq.heappush(heap, (math.sqrt(child.loose_distance_squared(x, y)), next(counter), False, child))
+        return found
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Optional
+
+from src.frame_snapshot import FrameSnapshot
+
+
+class RenderPipeline:
+    """Draws frame snapshots on a thread of its own, enabled with `settings.simulation.PIPELINED_RENDERING`.
+
+    The snapshots are double-buffered: the render thread draws the front snapshot while the
+    game simulates the next frame and fills the back one. `wait()` and `submit()` at the end of
+    every frame hand the back snapshot over. Most of the work of blits and draw calls happens
+    without holding the GIL, so on machines with more than one core drawing overlaps the
+    simulation instead of adding to it. The price is a frame of latency.
+
+    Presenting the drawn frame stays on the caller's thread, SDL wants the display handled there.
+
+    Args:
+        draw (Callable[[FrameSnapshot], None]): Draws a snapshot onto the screen, called on the render thread.
+    """
+
+    def __init__(self, draw: Callable[[FrameSnapshot], None]) -> None:
+        self.draw = draw
+        self.front: Optional[FrameSnapshot] = None  # being drawn
+        self.back: Optional[FrameSnapshot] = None  # submitted, waiting to be drawn
+        self.draw_seconds = 0.0  # how long drawing the last snapshot took on the render thread
+        self.error: Optional[BaseException] = None  # raised by draw, passed on by wait()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="render", daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot: FrameSnapshot) -> None:
+        """Hand over a snapshot to draw. Call `wait()` before, the screen must be free."""
+        with self._condition:
+            self.back = snapshot
+            self._condition.notify_all()
+
+    def wait(self) -> None:
+        """Wait until the submitted snapshot is on the screen."""
+        with self._condition:
+            while self.back is not None or self.front is not None:
+                self._condition.wait()
+            if self.error is not None:
+                error, self.error = self.error, None
+                raise error
+
+    def close(self) -> None:
+        """Let the render thread finish what it is drawing and stop it.
+        An error raised while drawing the last snapshot is passed on, or printed if another exception is already on its way.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        error, self.error = self.error, None
+        if error is None:
+            return
+        if sys.exc_info()[1] is None:
+            raise error
+        traceback.print_exception(error)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self.back is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                snapshot = self.front = self.back
+                self.back = None
+            start = time.perf_counter()
+            try:
+                self.draw(snapshot)
+            except BaseException as error:  # handed to the game's thread
+                self.error = error
+            with self._condition:
+                self.draw_seconds = time.perf_counter() - start
+                self.front = None
+                self._condition.notify_all()
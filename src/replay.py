@@ -0,0 +1,58 @@
+"""Record games and replay them, e.g. to reproduce a performance problem or to use a real session as a benchmark."""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import struct
+
+import settings.simulation as simulation
+from src import game_clock
+from src.game import Game
+from src.input_source import InputRecorder, LiveInput, ReplayInput
+
+
+def state_digest(game: Game) -> str:
+    """Hash the simulation state, two games with the same digest ended up in exactly the same state."""
+    digest = hashlib.sha256()
+    player = game.player
+    digest.update(struct.pack("<4d", game_clock.game_time(), player.position.x, player.position.y, player.rotation))
+    for shape in itertools.chain(game.vulnerable_asteroids, game.invulnerable_asteroids, game.shots):
+        position, velocity = shape.position, shape.velocity
+        digest.update(struct.pack("<5d", position.x, position.y, velocity.x, velocity.y, shape.radius))
+    return digest.hexdigest()[:16]
+
+
+def record(
+        path: str,
+        headless: bool = False,
+        seed: int | None = None,
+        max_frames: int | None = None,
+        telemetry_path: str | None = None,
+    ) -> Game:
+    """Play a game and record its input to `path`."""
+    game = Game(headless=headless, seed=seed, telemetry_path=telemetry_path)
+    recorder = InputRecorder(LiveInput(), path, game.seed, simulation.TICK_RATE)
+    game.player.input_source = game.input_source = recorder
+    try:
+        game.run(max_frames=max_frames)
+    finally:
+        # a lost game exits from within run(), the recording is complete nonetheless
+        recorder.close(lost=game.survival_time is not None)
+        print(f"Recorded {recorder.ticks} ticks with seed {game.seed} to {path}, final state {state_digest(game)}")
+    return game
+
+
+def replay(path: str, headless: bool = True, telemetry_path: str | None = None) -> Game:
+    """Replay a recording tick by tick. Headless replays run as fast as possible."""
+    recording = ReplayInput.load(path)
+    if recording.tick_rate != simulation.TICK_RATE:
+        raise ValueError(
+            f"{path} was recorded with {recording.tick_rate} ticks per second, "
+            f"but the game runs with {simulation.TICK_RATE}."
+        )
+    game = Game(headless=headless, seed=recording.seed, input_source=recording, telemetry_path=telemetry_path)
+    try:
+        game.run()
+    finally:
+        print(f"Replayed {recording.position} of {len(recording)} ticks from {path}, final state {state_digest(game)}")
+    return game
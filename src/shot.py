@@ -1,11 +1,29 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, Optional
+
 import pygame
 
 import settings.graphics as graphics
+import settings.shot as shot_settings
+from src import game_clock
+from src.boundary_behaviors import BoundaryBehavior, apply_to_shape
 from src.circleshape import CircleShape
+from src.entity_registry import Kind
+from src.entity_store import StoreField
 from settings.shot import RADIUS
 
+if TYPE_CHECKING:
+    from src.shot_store import ShotStore
+    from src.timer_wheel import Timer
+
 
 class Shot(CircleShape):
+    kind = Kind.SHOT
+    store: ClassVar[Optional[ShotStore]] = None  # moves and culls all shots at once if set
+    age = StoreField("age")  # seconds since the shot was fired
+    distance = StoreField("distance")  # pixels travelled so far
+
     def __init__(self, start_position: pygame.Vector2) -> None:
         """Shots are circular shapes with a fix radius (from `contant.py`).
         They can destoy asteroids but this is currently handled in `main.py`.
@@ -14,6 +32,12 @@ class Shot(CircleShape):
             start_position (pygame.Vector2): starting position as a 2-dimensional vector
         """
         super().__init__(start_position, RADIUS)
+        self.age = 0.0
+        self.distance = 0.0
+        if self.store is not None:
+            self.store.attach(self)
+        # shots that haven't hit anything are removed after their lifetime
+        self.expiry: Optional[Timer] = game_clock.schedule(shot_settings.MAX_LIFETIME_SEC, self.kill)
 
     def draw(self, screen: pygame.Surface) -> None:
         """Shots are drawn as simple white circles on our screen.
@@ -21,11 +45,13 @@ class Shot(CircleShape):
         Args:
             screen (pygame.Surface): Surface representing our screen to draw upon.
         """
+        center = self.draw_position
+
         # Draw filled circle first
         pygame.draw.circle(
             screen,
             color=graphics.GameColors.SHOT_FILL,
-            center=self.position,
+            center=center,
             radius=self.radius,
         )
 
@@ -33,17 +59,49 @@ class Shot(CircleShape):
         pygame.draw.circle(
             screen,
             color=graphics.GameColors.SHOT_BORDER,
-            center=self.position,
+            center=center,
             radius=self.radius,
             width=graphics.BorderWidths.SHOT,
         )
 
     def update(self, dt: float) -> None:
-        """Move ourselves according to our velocity vector and passed time
+        """Move ourselves according to our velocity vector and passed time.
+        Shots that missed are removed once they are too far away or off-screen.
+        Not called for shots in a `ShotStore`, it does the same for all of them at once.
 
         Args:
             dt (float): passed time since last update in seconds
         """
-        self.position += self.velocity * dt
+        self.integrate(dt)
+        if shot_settings.BOUNDARY_BEHAVIOR is not BoundaryBehavior.PASS_THROUGH:
+            apply_to_shape(shot_settings.BOUNDARY_BEHAVIOR.batch_handler, self, dt)
+        self.age += dt
+        self.distance += self.velocity.length() * dt
+        if self.is_expired():
+            self.kill()
+
+    def kill(self) -> None:
+        """Remove the shot, its lifetime timer doesn't need to fire anymore."""
+        super().kill()
+        if self.expiry is not None:
+            self.expiry.cancel()
+            self.expiry = None
+
+    def sweep_start(self, dt: float) -> pygame.Vector2:
+        """Where the shot was at the start of the last physics step of length `dt`.
+        Shots fly straight, so this is where the segment checked for hits starts.
+        """
+        return self.position - self.velocity * min(self.age, dt)
+
+    def is_expired(self) -> bool:
+        """Check whether the shot has travelled more than `MAX_RANGE` or left the screen plus `OFFSCREEN_MARGIN`.
+        Its lifetime is up to a timer, see `__init__()`.
+        """
+        reach = self.radius + shot_settings.OFFSCREEN_MARGIN
+        return (
+            self.distance > shot_settings.MAX_RANGE
+            or not -reach < self.position.x < graphics.SCREEN_WIDTH + reach
+            or not -reach < self.position.y < graphics.SCREEN_HEIGHT + reach
+        )
 
     # TODO: move collision with asteroids logic to this class!
\ No newline at end of file
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, Optional
+
+import numpy as np
+
+import settings.graphics as graphics
+import settings.shot as shot_settings
+from src.entity_store import EntityStore
+
+if TYPE_CHECKING:
+    from src.shot import Shot
+
+
+class ShotStore(EntityStore["Shot"]):
+    """Fixed-capacity ring buffer holding the state of all live shots.
+
+    Shots take the slots one after another and wrap around at the end, so the slot that is
+    handed out next always belongs to the oldest shot. When all slots are taken, that shot gets
+    killed to make room. Movement, aging and culling of all shots happen in one batched step.
+
+    Args:
+        capacity (int): Maximum number of live shots.
+    """
+    field_names: ClassVar[tuple[str, ...]] = ("radius", "age", "distance")
+
+    def __init__(self, capacity: int = shot_settings.MAX_LIVE_SHOTS) -> None:
+        super().__init__(capacity)
+        self.ring: list[Optional[Shot]] = [None] * capacity
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.head = 0  # the next slot to hand out
+        self.boundary_handler = shot_settings.BOUNDARY_BEHAVIOR.batch_handler
+
+    def attach(self, shape: Shot) -> None:
+        """Move a new shot into the next slot, killing the oldest shot if it is still around."""
+        slot = self.head
+        oldest = self.ring[slot]
+        if oldest is not None:
+            oldest.kill()
+        self._move_in(shape, slot)
+        self.ring[slot] = shape
+        self.alive[slot] = True
+        self.head = (slot + 1) % self.capacity
+        self.count += 1
+
+    def detach(self, shape: Shot) -> None:
+        """Copy the state of a shot back into the shot and free its slot."""
+        if shape._store is not self:
+            return
+        slot = shape._slot
+        self._move_out(shape)
+        self.ring[slot] = None
+        self.alive[slot] = False
+        self.count -= 1
+
+    def kill_slots(self, slots: np.ndarray) -> None:
+        for slot in slots.tolist():
+            self.ring[slot].kill()  # type: ignore[union-attr]
+
+    def update(self, dt: float) -> None:
+        """Move all shots and remove the ones that travelled too far or are off-screen.
+        Shots that are too old are killed by their lifetime timer.
+        """
+        if self.count == 0:
+            return
+        # free slots are moved along as well, that's cheaper than picking the live ones
+        self.positions += self.velocities * dt
+        self.boundary_handler(self.positions, self.velocities, self.fields["radius"], dt)
+        self.fields["age"] += dt
+        self.fields["distance"] += np.hypot(self.velocities[:, 0], self.velocities[:, 1]) * dt
+
+        radii = self.fields["radius"]
+        margin = shot_settings.OFFSCREEN_MARGIN
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        expired = self.alive & (
+            (self.fields["distance"] > shot_settings.MAX_RANGE)
+            | (x + radii < -margin)
+            | (x - radii > graphics.SCREEN_WIDTH + margin)
+            | (y + radii < -margin)
+            | (y - radii > graphics.SCREEN_HEIGHT + margin)
+        )
+        if expired.any():
+            self.kill_slots(np.flatnonzero(expired))
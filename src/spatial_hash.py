@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import Generic, Iterable, Iterator, Protocol, TypeVar
+
+import pygame
+
+from settings.asteroids import MAX_RADIUS
+
+
+class Circle(Protocol):
+    """Anything with a position and a radius, e.g. a `CircleShape`."""
+
+    @property
+    def position(self) -> pygame.Vector2: ...
+
+    @property
+    def radius(self) -> float: ...
+
+
+ShapeT = TypeVar("ShapeT", bound=Circle)
+
+# Every shape in the game is at most MAX_RADIUS big, so two shapes can only overlap
+# when their centers are closer than 2 * MAX_RADIUS. With cells of that size, a shape
+# only ever has to be compared against the shapes in its own and the 8 neighbouring cells.
+DEFAULT_CELL_SIZE = 2 * MAX_RADIUS
+
+# Half of the neighbourhood: pairs are only looked up in these directions
+# so that every pair of cells is visited exactly once.
+_FORWARD_NEIGHBOURS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+class SpatialHash(Generic[ShapeT]):
+    """A uniform grid broadphase for circular shapes.
+
+    Shapes are bucketed by the cell their center falls into. The grid is meant to be
+    rebuilt every frame via `rebuild()`, which is cheap compared to testing every shape
+    against every other shape.
+
+    Args:
+        cell_size (float): Edge length of a grid cell in pixels. Must be at least the
+            largest possible sum of radii of two shapes that shall be tested against each other.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive, but got {cell_size!r}.")
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[ShapeT]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.cells.values())
+
+    def cell_of(self, shape: Circle) -> tuple[int, int]:
+        """Get the grid coordinates of the cell containing the center of a shape."""
+        position = shape.position
+        return (int(position.x // self.cell_size), int(position.y // self.cell_size))
+
+    def clear(self) -> None:
+        """Remove all shapes from the grid."""
+        self.cells.clear()
+
+    def insert(self, shape: ShapeT) -> None:
+        """Add a single shape to the grid."""
+        self.cells.setdefault(self.cell_of(shape), []).append(shape)
+
+    def rebuild(self, shapes: Iterable[ShapeT]) -> None:
+        """Clear the grid and insert all given shapes at their current positions."""
+        self.cells.clear()
+        for shape in shapes:
+            self.insert(shape)
+
+    def query(self, shape: Circle) -> Iterator[ShapeT]:
+        """Yield every stored shape that might collide with the given shape.
+
+        The shape itself does not have to be stored in the grid.
+        Its radius plus the radius of any stored shape must not exceed the cell size.
+        """
+        cell_x, cell_y = self.cell_of(shape)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                bucket = self.cells.get((cell_x + dx, cell_y + dy))
+                if bucket:
+                    yield from bucket
+
+    def query_segment(self, start: pygame.Vector2, end: pygame.Vector2) -> Iterator[ShapeT]:
+        """Yield every stored shape that might collide with a shape moving from `start` to `end`, each once.
+
+        Its radius plus the radius of any stored shape must not exceed the cell size.
+        """
+        size = self.cell_size
+        min_x, max_x = int(min(start.x, end.x) // size), int(max(start.x, end.x) // size)
+        min_y, max_y = int(min(start.y, end.y) // size), int(max(start.y, end.y) // size)
+        # all cells touched by the bounding box of the segment plus their neighbours
+        for cell_x in range(min_x - 1, max_x + 2):
+            for cell_y in range(min_y - 1, max_y + 2):
+                bucket = self.cells.get((cell_x, cell_y))
+                if bucket:
+                    yield from bucket
+
+    def candidate_pairs(self) -> Iterator[tuple[ShapeT, ShapeT]]:
+        """Yield every pair of stored shapes in the same or in neighbouring cells exactly once."""
+        cells = self.cells
+        for (cell_x, cell_y), bucket in cells.items():
+            count = len(bucket)
+            # pairs within the cell
+            for idx1 in range(count):
+                shape1 = bucket[idx1]
+                for idx2 in range(idx1 + 1, count):
+                    yield shape1, bucket[idx2]
+            # pairs with half of the neighbouring cells
+            for dx, dy in _FORWARD_NEIGHBOURS:
+                neighbour = cells.get((cell_x + dx, cell_y + dy))
+                if not neighbour:
+                    continue
+                for shape1 in bucket:
+                    for shape2 in neighbour:
+                        yield shape1, shape2
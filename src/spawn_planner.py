@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, NamedTuple, Sequence
+
+import pygame
+
+from settings.asteroids import MAX_RADIUS, MIN_RADIUS, SIZES, STARTING_SPEED_SPREAD
+from settings.graphics import SCREEN_HEIGHT, SCREEN_WIDTH
+from src import game_random
+from src.spatial_hash import Circle, SpatialHash
+
+# direction asteroids enter the screen in and where on the edge they start for a value between 0 and 1
+Edge = tuple[pygame.Vector2, Callable[[float], pygame.Vector2]]
+
+
+class SpawnCandidate(NamedTuple):
+    """A possible spawn of an asteroid. Cheap to throw away, unlike a sprite."""
+    position: pygame.Vector2
+    velocity: pygame.Vector2
+    radius: float
+
+
+def in_spawn_band(position: pygame.Vector2) -> bool:
+    """Check whether something at this position could overlap an asteroid spawning at any edge.
+
+    Asteroids spawn `MAX_RADIUS` outside the screen, so only shapes less than `2 * MAX_RADIUS`
+    away from those lines can overlap them.
+    """
+    return (
+        position.x < MAX_RADIUS
+        or position.x > SCREEN_WIDTH - MAX_RADIUS
+        or position.y < MAX_RADIUS
+        or position.y > SCREEN_HEIGHT - MAX_RADIUS
+    )
+
+
+class SpawnPlanner:
+    """Finds free spots at the screen edges for new asteroids.
+
+    The asteroids near the edges are put into a grid once per spawn round, so every random
+    candidate is only compared against its neighbours. Planned spawns are added to the
+    grid as well, so several asteroids spawned at once don't overlap each other.
+
+    Args:
+        edges (Sequence[Edge]): The edges asteroids can enter the screen from.
+    """
+
+    def __init__(self, edges: Sequence[Edge]) -> None:
+        self.edges = edges
+        self.index: SpatialHash[Circle] = SpatialHash()
+        self.attempts = 0  # random candidates tried by the last `plan()`
+
+    def rebuild(self, shapes: Iterable[Circle]) -> None:
+        """Index the shapes that are close enough to the edges to block a spawn."""
+        self.index.rebuild(shape for shape in shapes if in_spawn_band(shape.position))
+
+    def random_candidate(self) -> SpawnCandidate:
+        """Create a candidate at a random edge, entering the screen at a random angle."""
+        rng = game_random.rng
+        direction, position_at = rng.choice(self.edges)
+        speed = rng.randint(*STARTING_SPEED_SPREAD)
+        velocity = (direction * speed).rotate(rng.randint(-30, 30))
+        position = position_at(rng.uniform(0, 1))
+        radius = rng.randint(1, SIZES) * MIN_RADIUS
+        return SpawnCandidate(position, velocity, radius)
+
+    def is_free(self, candidate: SpawnCandidate) -> bool:
+        """Check that the candidate doesn't overlap any indexed shape."""
+        for shape in self.index.query(candidate):
+            reach = candidate.radius + shape.radius
+            if candidate.position.distance_squared_to(shape.position) < reach * reach:
+                return False
+        return True
+
+    def plan(self, count: int, max_attempts: int) -> list[SpawnCandidate]:
+        """Find free spots for up to `count` asteroids. Call `rebuild()` first.
+
+        Asteroids without a free spot are left out, the caller can count them as the difference.
+
+        Args:
+            count (int): Number of asteroids to place.
+            max_attempts (int): Random candidates tried per asteroid before giving up on it.
+        """
+        planned: list[SpawnCandidate] = []
+        self.attempts = 0
+        for _ in range(count):
+            for _ in range(max_attempts):
+                self.attempts += 1
+                candidate = self.random_candidate()
+                if self.is_free(candidate):
+                    planned.append(candidate)
+                    self.index.insert(candidate)
+                    break
+        return planned
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+import settings.graphics as graphics
+
+Color = str | tuple[int, int, int]
+SurfaceKey = tuple[float, Color, Color, int]
+
+# Transparent background of the cached surfaces, the first one that isn't used by the asteroid itself
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 0), (1, 2, 3))
+
+
+class AsteroidSurfaceCache:
+    """Pre-rendered asteroid circles, so drawing an asteroid is a single blit.
+
+    Asteroids come in a few discrete sizes and colors, so there are only a handful of different
+    looks. Each one is rasterized on first use and kept until the cache is full, then the least
+    recently used surface is dropped.
+
+    Args:
+        max_size (int): Maximum number of cached surfaces.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.surfaces: OrderedDict[SurfaceKey, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    def get(self, radius: float, fill_color: Color, border_color: Color, border_width: int) -> pygame.Surface:
+        """Get the surface for an asteroid, rendering it if it isn't cached yet."""
+        key = (radius, fill_color, border_color, border_width)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = self.render(*key)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def render(radius: float, fill_color: Color, border_color: Color, border_width: int) -> pygame.Surface:
+        """Rasterize an asteroid onto a color keyed surface just big enough to hold it."""
+        used = {tuple(pygame.Color(fill_color)), tuple(pygame.Color(border_color))}
+        colorkey = next(
+            color for color in COLORKEY_CANDIDATES
+            if tuple(pygame.Color(color)) not in used
+        )
+        size = int(radius * 2) + 2
+        surface = pygame.Surface((size, size))
+        surface.fill(colorkey)
+        center = (size / 2, size / 2)
+        pygame.draw.circle(surface, color=fill_color, center=center, radius=radius)
+        pygame.draw.circle(surface, color=border_color, center=center, radius=radius, width=border_width)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()  # match the screen's pixel format for faster blits
+        # run-length encoding makes skipping the transparent corners cheap
+        surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        return surface
+
+
+asteroid_surfaces = AsteroidSurfaceCache(graphics.ASTEROID_SURFACE_CACHE_SIZE)
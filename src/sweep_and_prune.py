@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Generic, Iterable, Iterator
+
+from src.spatial_hash import ShapeT
+
+
+class SweepAndPrune(Generic[ShapeT]):
+    """An incremental sort-and-sweep broadphase along the x axis.
+
+    The shapes are kept sorted by the left end of their x extent. Asteroids move only a little
+    between two frames, so last frame's order is almost sorted already and an insertion sort
+    puts it back in order with a few swaps. Unlike a grid, it doesn't care how different the
+    radii are: every shape is only compared with the shapes whose x extents overlap its own.
+    """
+
+    def __init__(self) -> None:
+        self.order: list[ShapeT] = []  # sorted by the left end of the x extent as of the last rebuild
+        self.lefts: list[float] = []
+        self.swaps = 0  # moves the insertion sort needed in the last rebuild, low when the motion is coherent
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def rebuild(self, shapes: Iterable[ShapeT]) -> None:
+        """Bring the order up to date with the given shapes at their current positions.
+        Shapes that are gone are dropped, new ones are sorted in.
+        """
+        current = dict.fromkeys(shapes)  # keeps the order of the new shapes
+        order = [shape for shape in self.order if shape in current]
+        if len(order) < len(current):
+            known = dict.fromkeys(order)
+            order.extend(shape for shape in current if shape not in known)
+        lefts = [shape.position.x - shape.radius for shape in order]
+
+        # insertion sort, about linear for an almost sorted order
+        swaps = 0
+        for idx in range(1, len(order)):
+            left = lefts[idx]
+            if lefts[idx - 1] <= left:
+                continue
+            shape = order[idx]
+            pos = idx
+            while pos > 0 and lefts[pos - 1] > left:
+                lefts[pos] = lefts[pos - 1]
+                order[pos] = order[pos - 1]
+                pos -= 1
+            lefts[pos] = left
+            order[pos] = shape
+            swaps += idx - pos
+
+        self.order, self.lefts, self.swaps = order, lefts, swaps
+
+    def candidate_pairs(self) -> Iterator[tuple[ShapeT, ShapeT]]:
+        """Yield every pair of shapes whose x extents and y extents overlap exactly once."""
+        # (right end of the x extent, y, radius, shape) of the shapes the sweep is inside of
+        active: list[tuple[float, float, float, ShapeT]] = []
+        for shape, left in zip(self.order, self.lefts):
+            if active:
+                active = [entry for entry in active if entry[0] >= left]
+            position, radius = shape.position, shape.radius
+            y = position.y
+            for _, other_y, other_radius, other in active:
+                if abs(y - other_y) <= radius + other_radius:
+                    yield other, shape
+            active.append((position.x + radius, y, radius, shape))
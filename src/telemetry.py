@@ -0,0 +1,84 @@
+"""Per-frame telemetry for long soak sessions, written to a memory-mapped ring file and read back with NumPy."""
+from __future__ import annotations
+
+import mmap
+import struct
+from typing import Sequence
+
+import numpy as np
+
+MAGIC = b"ASTTELEM"
+VERSION = 1
+# magic, version, capacity in records, number of columns, length of the column names, records written so far
+HEADER = struct.Struct("<8sIIIIQ")
+_WRITTEN_OFFSET = HEADER.size - 8  # where the record count sits in the header
+INDEX_COLUMN = "index"  # number of the frame since the log was opened, stored in front of every record
+
+
+class TelemetryWriter:
+    """Fixed-size binary records in a ring file, one per frame.
+
+    The file is memory-mapped, so writing a frame is one `struct.pack_into()` of the record and
+    one of the record count in the header, the operating system writes the pages back when it
+    sees fit. Once `capacity` records are written, the oldest ones get overwritten. The layout
+    is self-describing, see `read_telemetry()`.
+
+    Args:
+        path (str): File to write, it is truncated.
+        columns (Sequence[str]): Names of the float values of every record.
+        capacity (int): Number of records kept.
+    """
+
+    def __init__(self, path: str, columns: Sequence[str], capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"A telemetry capacity of {capacity} records isn't plausible.")
+        self.path = path
+        self.columns = tuple(columns)
+        self.capacity = capacity
+        self.record = struct.Struct(f"<Q{len(self.columns)}d")
+        names = "\n".join(self.columns).encode()
+        self.data_offset = -(-(HEADER.size + len(names)) // 8) * 8  # records start 8-byte aligned
+        size = self.data_offset + capacity * self.record.size
+        with open(path, "w+b") as file:
+            file.truncate(size)
+            self.map = mmap.mmap(file.fileno(), size)  # keeps its own handle of the file
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, capacity, len(self.columns), len(names), 0)
+        self.map[HEADER.size:HEADER.size + len(names)] = names
+        self.written = 0
+
+    def __len__(self) -> int:
+        return min(self.written, self.capacity)
+
+    def write(self, values: Sequence[float]) -> None:
+        """Append a record with a value for every column, overwriting the oldest one if the file is full."""
+        offset = self.data_offset + (self.written % self.capacity) * self.record.size
+        self.record.pack_into(self.map, offset, self.written, *values)
+        self.written += 1
+        struct.pack_into("<Q", self.map, _WRITTEN_OFFSET, self.written)
+
+    def close(self) -> None:
+        """Write everything back to the file and unmap it."""
+        if not self.map.closed:
+            self.map.flush()
+            self.map.close()
+
+
+def read_telemetry(path: str) -> dict[str, np.ndarray]:
+    """Read a telemetry file into one array per column, oldest record first.
+
+    Works on the file of a running game as well, the records written so far are returned.
+    Besides the columns the writer was given, `INDEX_COLUMN` holds the number of each frame.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    magic, version, capacity, column_count, names_length, written = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} isn't a telemetry file of version {VERSION}.")
+    columns = data[HEADER.size:HEADER.size + names_length].decode().split("\n") if column_count else []
+    dtype = np.dtype([(INDEX_COLUMN, "<u8")] + [(name, "<f8") for name in columns])
+    data_offset = -(-(HEADER.size + names_length) // 8) * 8
+    records = np.frombuffer(data, dtype=dtype, count=capacity, offset=data_offset)
+    count = min(written, capacity)
+    order = np.arange(written - count, written) % capacity
+    ordered = records[order]
+    return {name: ordered[name].copy() for name in dtype.names or ()}
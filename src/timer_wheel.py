@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Callable, Optional, Sequence
+
+# Slots per level as powers of two. Level 0 holds the timers of the next 256 ticks one slot per tick,
+# every further level holds 64 slots that each span all slots of the level below.
+LEVEL_BITS = (8, 6, 6, 6)
+
+
+class Timer:
+    """A callback that runs once at a tick, see `TimerWheel.schedule()`."""
+
+    def __init__(self, due: int, callback: Callable[[], None], wheel: Optional[TimerWheel] = None) -> None:
+        self.due = due
+        self.callback: Optional[Callable[[], None]] = callback
+        self.wheel = wheel  # counts us as live until we fire or get cancelled
+
+    @property
+    def active(self) -> bool:
+        """Whether the timer is still waiting, it isn't after it fired or got cancelled."""
+        return self.callback is not None
+
+    def cancel(self) -> None:
+        """Keep the timer from firing. It stays in its slot until the wheel gets there and drops it."""
+        if self.callback is None:
+            return
+        self.callback = None
+        if self.wheel is not None:
+            self.wheel.live -= 1
+
+
+class TimerWheel:
+    """A hierarchical timer wheel counting discrete ticks.
+
+    Scheduling and cancelling are O(1). Advancing by a tick only looks at one slot of the
+    lowest level, plus, once every 256 ticks, one slot of a higher level whose timers get
+    spread over the levels below (the cascade). So the cost per tick is proportional to the
+    timers that fire, not to the number of timers waiting.
+
+    Args:
+        level_bits (Sequence[int]): Slots per level as powers of two, lowest level first.
+    """
+
+    def __init__(self, level_bits: Sequence[int] = LEVEL_BITS) -> None:
+        self.level_bits = tuple(level_bits)
+        # ticks per slot of every level as powers of two
+        self.shifts = tuple(sum(self.level_bits[:level]) for level in range(len(self.level_bits)))
+        self.max_delay = (1 << sum(self.level_bits)) - 1  # later timers wait in the top level and get filed again
+        self.tick = 0  # the next tick to run
+        self.levels: list[list[list[Timer]]] = []
+        self.pending = 0  # timers in the slots, including cancelled ones not dropped yet
+        self.live = 0  # timers that will still fire, what `len()` reports
+        self.clear()
+
+    def __len__(self) -> int:
+        return self.live
+
+    def clear(self) -> None:
+        """Drop all timers and start counting from tick 0 again."""
+        for slots in self.levels:
+            for timers in slots:
+                for timer in timers:
+                    timer.wheel = None  # cancelling a dropped timer mustn't count
+        self.tick = 0
+        self.levels = [[[] for _ in range(1 << bits)] for bits in self.level_bits]
+        self.pending = 0
+        self.live = 0
+
+    def schedule(self, due: int, callback: Callable[[], None]) -> Timer:
+        """Run a callback once the wheel has run the given tick. Ticks already run count as the next tick."""
+        timer = Timer(due, callback, self)
+        self._file(timer)
+        self.pending += 1
+        self.live += 1
+        return timer
+
+    def _file(self, timer: Timer) -> None:
+        due = max(timer.due, self.tick)
+        delay = min(due - self.tick, self.max_delay)
+        due = self.tick + delay
+        for level, bits in enumerate(self.level_bits):
+            shift = self.shifts[level]
+            if delay < 1 << (shift + bits):
+                self.levels[level][(due >> shift) & ((1 << bits) - 1)].append(timer)
+                return
+
+    def _cascade(self, level: int) -> int:
+        """File the timers of the current slot of a level again, they now fit into the levels below."""
+        index = (self.tick >> self.shifts[level]) & ((1 << self.level_bits[level]) - 1)
+        slots = self.levels[level]
+        timers, slots[index] = slots[index], []
+        for timer in timers:
+            self._file(timer)
+        return index
+
+    def advance_to(self, tick: int) -> None:
+        """Run all ticks up to and including the given one, firing their timers in the order they were scheduled."""
+        lowest = self.levels[0]
+        mask = len(lowest) - 1
+        while self.tick <= tick:
+            if self.pending == 0:
+                # nothing to fire or to cascade, skip ahead
+                self.tick = tick + 1
+                return
+            index = self.tick & mask
+            if index == 0:
+                for level in range(1, len(self.level_bits)):
+                    if self._cascade(level) != 0:
+                        break
+            timers, lowest[index] = lowest[index], []
+            # timers scheduled by the callbacks for this tick fire on the next one
+            self.tick += 1
+            self.pending -= len(timers)
+            for timer in timers:
+                callback = timer.callback
+                if callback is not None:
+                    timer.callback = None
+                    self.live -= 1
+                    callback()
@@ -1,8 +1,24 @@
 # test_physics.py (or add to your main file temporarily)
+import random
+
+import numpy as np
 import pygame
+import pytest
 
+import settings.simulation as simulation
+from benchmarks.bots import RandomBot
+from settings.graphics import SCREEN_HEIGHT, SCREEN_WIDTH
 from src.asteroid_sprite import Asteroid
-from src.physics import bounce_asteroids
+from src.boundary_behaviors import BoundaryBehavior
+from src.entity_registry import Entity, EntityRegistry, Kind, Tag
+from src.game import Game
+from src.input_source import InputRecorder
+from src.player import Player
+from src.physics import bounce_asteroid_pairs, bounce_asteroids, bounce_asteroids_batch, time_of_impact
+from src.quadtree import LooseQuadtree
+from src.replay import replay, state_digest
+from src.telemetry import INDEX_COLUMN, TelemetryWriter, read_telemetry
+from src.timer_wheel import LEVEL_BITS, TimerWheel
 
 
 def test_bounce_physics():
@@ -31,5 +47,235 @@ def test_bounce_physics():
     print(f"  A1 moving away from A2: {a1.velocity.x < 0}")  # Should be True
     print(f"  A2 moving away from A1: {a2.velocity.x > 0}")  # Should be True
 
+def test_batch_bounce_matches_scalar():
+    """The batched solver must give the same velocities as bouncing pair by pair"""
+    rng = random.Random(42)
+    count = 40
+    positions = np.array([(rng.uniform(0, 200), rng.uniform(0, 200)) for _ in range(count)])
+    velocities = np.array([(rng.uniform(-50, 50), rng.uniform(-50, 50)) for _ in range(count)])
+    radii = np.array([rng.randint(1, 5) * 20.0 for _ in range(count)])
+    # lots of asteroids take part in several collisions, some pairs are at the same position
+    positions[1] = positions[0]
+    pairs = np.array([(0, 1)] + [rng.sample(range(count), 2) for _ in range(200)])
+
+    asteroids: list[Asteroid] = []
+    for pos, vel, radius in zip(positions.tolist(), velocities.tolist(), radii.tolist()):
+        a = Asteroid(position=pygame.Vector2(*pos), radius=radius)
+        a.velocity = pygame.Vector2(*vel)
+        asteroids.append(a)
+    for idx1, idx2 in pairs:
+        bounce_asteroids(asteroids[idx1], asteroids[idx2])
+
+    batch_velocities = velocities.copy()
+    bounced = bounce_asteroids_batch(pairs, positions, batch_velocities, radii)
+
+    expected = np.array([(a.velocity.x, a.velocity.y) for a in asteroids])
+    assert np.allclose(batch_velocities, expected)
+    assert not bounced[0]  # identical positions are skipped
+    assert bounced.any() and not bounced.all()  # pairs moving apart are skipped
+
+
+def test_bounce_asteroid_pairs():
+    """Bouncing asteroid objects in a batch writes the new velocities back"""
+    a1 = Asteroid(position=pygame.Vector2(0, 0), radius=5)
+    a2 = Asteroid(position=pygame.Vector2(15, 0), radius=5)
+    a1.velocity = pygame.Vector2(10, 0)
+    a2.velocity = pygame.Vector2(-10, 0)
+
+    assert bounce_asteroid_pairs([(a1, a2)]) == 1
+    assert a1.velocity == pygame.Vector2(-10, 0)
+    assert a2.velocity == pygame.Vector2(10, 0)
+
+    # moving apart now, nothing happens
+    assert bounce_asteroid_pairs([(a1, a2)]) == 0
+
+
+def test_time_of_impact():
+    """A shot crossing a small asteroid within one step hits it, even though both end positions miss"""
+    # shot flies from x=-50 to x=50 through an asteroid of radius 20 at the origin
+    impact = time_of_impact(pygame.Vector2(-50, 0), pygame.Vector2(100, 0), 25)
+    assert impact is not None and abs(impact - 0.25) < 1e-9
+    # already overlapping at the start
+    assert time_of_impact(pygame.Vector2(10, 0), pygame.Vector2(100, 0), 25) == 0.0
+    # passing by, stopping short and moving away
+    assert time_of_impact(pygame.Vector2(-50, 30), pygame.Vector2(100, 0), 25) is None
+    assert time_of_impact(pygame.Vector2(-50, 0), pygame.Vector2(20, 0), 25) is None
+    assert time_of_impact(pygame.Vector2(-50, 0), pygame.Vector2(-100, 0), 25) is None
+
+
+def test_quadtree_queries_match_linear_scan():
+    """The quadtree must find the same asteroids as checking all of them, also after they moved"""
+    rng = random.Random(7)
+    index: LooseQuadtree[Asteroid] = LooseQuadtree(pygame.Rect(0, 0, 800, 600))
+    asteroids = [
+        Asteroid(position=pygame.Vector2(rng.uniform(-100, 900), rng.uniform(-100, 700)), radius=rng.randint(1, 5) * 20.0)
+        for _ in range(200)
+    ]
+    for a in asteroids:
+        index.insert(a)
+    for a in asteroids[::2]:
+        a.position += pygame.Vector2(rng.uniform(-150, 150), rng.uniform(-150, 150))  # synced by the setter
+    for a in asteroids[::5]:
+        a.kill()  # removes it from the index
+    alive = [a for a in asteroids if a in index]
+
+    for _ in range(50):
+        point = pygame.Vector2(rng.uniform(-50, 850), rng.uniform(-50, 650))
+        radius = rng.uniform(0, 200)
+        expected = {a for a in alive if a.position.distance_to(point) <= radius + a.radius}
+        assert set(index.query_circle(point, radius)) == expected
+
+        rect = pygame.Rect(point.x, point.y, rng.uniform(0, 300), rng.uniform(0, 300))
+        expected = {
+            a for a in alive
+            if pygame.Vector2(max(rect.left, min(a.position.x, rect.right)),
+                              max(rect.top, min(a.position.y, rect.bottom))).distance_to(a.position) <= a.radius
+        }
+        assert set(index.query_rect(rect)) == expected
+
+        border_distances = sorted(max(a.position.distance_to(point) - a.radius, 0.0) for a in alive)
+        nearest = index.nearest(point, 5)
+        assert [max(a.position.distance_to(point) - a.radius, 0.0) for a in nearest] == pytest.approx(border_distances[:5])
+
+
+def test_registry_removal_while_iterating():
+    """Entities killed or retagged during an update are neither skipped nor updated twice, new ones wait a frame"""
+    registry = EntityRegistry()
+    updated: list[int] = []
+
+    class Counter(Entity):
+        registry = None  # added by hand below
+
+        def __init__(self, number: int) -> None:
+            super().__init__()
+            self.number = number
+
+        def update(self) -> None:
+            updated.append(self.number)
+            if self.number % 3 == 0:
+                self.kill()
+            elif self.number % 3 == 1:
+                self.retag(remove=Tag.UPDATABLE)
+            if self.number == 4:
+                registry.add(Counter(100), Tag.UPDATABLE)
+            if self.number == 5:
+                counters[8].kill()  # not updated yet
+
+    counters = [Counter(number) for number in range(10)]
+    for counter in counters:
+        registry.add(counter, Tag.UPDATABLE | Tag.DRAWABLE)
+    updatable, drawable = registry.view(Tag.UPDATABLE), registry.view(Tag.DRAWABLE)
+    updatable.update()
+    assert sorted(updated) == [0, 1, 2, 3, 4, 5, 6, 7, 9]
+    assert {c.number for c in updatable} == {2, 5, 100}
+    assert {c.number for c in drawable} == {1, 2, 4, 5, 7}
+    assert len(registry.view(Kind.SYSTEM)) == len(drawable) + 1
+    assert counters[1] in drawable and counters[1] not in updatable and not counters[3].alive()
+
+
+def test_telemetry_ring_keeps_the_latest_frames(tmp_path):
+    """After wrapping around, the reader returns the most recent records oldest first"""
+    path = str(tmp_path / "telemetry.bin")
+    writer = TelemetryWriter(path, ["frame", "shots"], capacity=8)
+    assert read_telemetry(path)["frame"].size == 0
+    for frame in range(20):
+        writer.write([frame * 0.5, frame % 3])
+    log = read_telemetry(path)  # readable while the writer is open
+    writer.close()
+    assert log[INDEX_COLUMN].tolist() == list(range(12, 20))
+    assert log["frame"].tolist() == [frame * 0.5 for frame in range(12, 20)]
+    assert log["shots"].tolist() == [frame % 3 for frame in range(12, 20)]
+
+
+@pytest.mark.parametrize("level_bits", [LEVEL_BITS, (4, 2, 2)])
+def test_timer_wheel_fires_at_the_due_tick(level_bits):
+    """Timers fire exactly at their tick across the level boundaries and beyond the longest delay, cancelled ones never"""
+    rng = random.Random(5)
+    wheel = TimerWheel(level_bits)
+    wheel.advance_to(36)  # start in the middle of the slots
+    lowest, second = 1 << level_bits[0], 1 << (level_bits[0] + level_bits[1])
+    delays = [0, 1, lowest - 1, lowest, lowest + 1, second - 1, second, second + 1]
+    if level_bits != LEVEL_BITS:  # too many ticks to run through for the real layout
+        delays += [wheel.max_delay, wheel.max_delay + 1, 3 * wheel.max_delay + 5]
+    fired: list[tuple[int, int]] = []  # (due, tick it fired at)
+    timers = []
+    for delay in delays:
+        for _ in range(3):
+            due = wheel.tick + delay
+            timers.append(wheel.schedule(due, lambda due=due: fired.append((due, wheel.tick - 1))))
+    for timer in timers[::3]:
+        timer.cancel()
+    assert len(wheel) == len(timers) - len(timers[::3])
+
+    last_due = max(timer.due for timer in timers)
+    while wheel.tick <= last_due:
+        wheel.advance_to(wheel.tick + rng.randint(0, 3 * lowest))
+        assert len(wheel) == sum(timer.active for timer in timers)
+    assert sorted(fired) == sorted((timer.due, timer.due) for index, timer in enumerate(timers) if index % 3)
+    assert len(wheel) == 0
+
+    # an empty wheel skips ahead and still fires on time afterwards
+    wheel.advance_to(wheel.tick + 10 * second)
+    due = wheel.tick + lowest + 3
+    fired.clear()
+    wheel.schedule(due, lambda: fired.append((due, wheel.tick - 1)))
+    wheel.advance_to(due + lowest)
+    assert fired == [(due, due)]
+
+
+
+@pytest.mark.parametrize("seconds, lost", [(120, True), (5, False)])
+def test_replay_reproduces_the_recorded_game(tmp_path, seconds, lost):
+    """A replay ends in the state of the recording, with the collision that lost the recorded game but no more"""
+    path = str(tmp_path / "game.rec")
+    recorded = Game(headless=True, seed=3)
+    recorder = InputRecorder(RandomBot(recorded, 3), path, recorded.seed, simulation.TICK_RATE)
+    recorded.player.input_source = recorded.input_source = recorder
+    recorded.run(max_frames=seconds * simulation.TICK_RATE)
+    recorder.close(lost=recorded.survival_time is not None)
+    assert (recorded.survival_time is not None) == lost  # lost or cut off
+    digest = state_digest(recorded)
+
+    replayed = replay(path)
+    assert replayed.survival_time == recorded.survival_time
+    assert state_digest(replayed) == digest
+
+
+
+@pytest.mark.parametrize("behavior", list(BoundaryBehavior))
+def test_batch_boundary_handlers_match_the_player_handlers(behavior):
+    """A batch handler moves an entity like the player's handler moves the player, where both are defined alike"""
+    r = 20.0  # the player's radius
+    if behavior is BoundaryBehavior.BOUNCE:
+        # from touching an edge, the bounce moves back onto the screen by the whole distance
+        moves = [((r, 300.0), 60.0, 10.0), ((400.0, SCREEN_HEIGHT - r), 20.0, 10.0), ((SCREEN_WIDTH - r, 50.0), -120.0, 10.0)]
+    elif behavior.name.startswith("WRAP_"):
+        # the player's transfers start from where the player was, so wrap from beyond an edge without moving further
+        moves = [
+            ((r - 5, 300.0), 60.0, 0.0), ((SCREEN_WIDTH - r + 5, 200.0), -70.0, 0.0),
+            ((400.0, r - 3), 160.0, 0.0), ((400.0, SCREEN_HEIGHT - r + 4), -20.0, 0.0),
+        ]
+    else:
+        # across one edge, across a corner, and staying on the screen
+        moves = [((30.0, 300.0), 90.0, 25.0), ((30.0, 40.0), 135.0, 30.0), ((400.0, 300.0), 30.0, 50.0)]
+
+    speed = 100.0
+    for start, rotation, distance in moves:
+        player = Player(pygame.Vector2(start))
+        player.rotation = rotation
+        forward = pygame.Vector2(0, 1).rotate(rotation)
+        behavior.handler(player, forward, distance)
+
+        dt = distance / speed
+        velocities = np.array([[forward.x * speed, forward.y * speed]])
+        positions = np.array([start]) + velocities * dt
+        behavior.batch_handler(positions, velocities, np.array([player.radius]), dt)
+        player.kill()
+
+        assert positions[0].tolist() == pytest.approx([player.position.x, player.position.y])
+        heading = pygame.Vector2(0, 1).rotate(player.rotation) * speed
+        assert velocities[0].tolist() == pytest.approx([heading.x, heading.y])
+
+
 if __name__ == "__main__":
     test_bounce_physics()